@@ -4,11 +4,12 @@ import random
 import time
 import matplotlib.pyplot as plt
 import numpy as np
+from ordenacao import ordena_rapida, TIPOS_PIVO
 
 
 
 
-def ordena_rapida(lista, tipo_pivo="primeiro"):
+def ordena_rapida_listas(lista, tipo_pivo="primeiro"):
    if len(lista) <= 1:
        return lista
 
@@ -28,7 +29,7 @@ def ordena_rapida(lista, tipo_pivo="primeiro"):
    maiores = [x for x in lista if x > pivo]
 
 
-   return ordena_rapida(menores, tipo_pivo) + iguais + ordena_rapida(maiores, tipo_pivo)
+   return ordena_rapida_listas(menores, tipo_pivo) + iguais + ordena_rapida_listas(maiores, tipo_pivo)
 
 
 plt.style.use('default')
@@ -123,3 +124,27 @@ pivo_pior = max(medias, key=medias.get)
 print(f"\nMelhor pivô: {pivo_melhor}")
 print(f"Pior pivô: {pivo_pior}")
 print(f"Diferença de desempenho: {(medias[pivo_pior] - medias[pivo_melhor]):.6f} segundos")
+
+
+print("\nIntrosort no lugar vs. quicksort com listas (50000 elementos):")
+dados_ordenados_entrada = sorted(dados)
+for pivo in TIPOS_PIVO:
+   inicio = time.time()
+   resultado = ordena_rapida(dados.copy(), pivo)
+   tempo_aleatorio = time.time() - inicio
+   inicio = time.time()
+   resultado_ordenado = ordena_rapida(dados_ordenados_entrada.copy(), pivo)
+   tempo_ordenado = time.time() - inicio
+   if resultado != dados_ordenados_entrada or resultado_ordenado != dados_ordenados_entrada:
+       raise RuntimeError(f"Introsort com pivô {pivo} não ordenou corretamente")
+   print(f"  Pivo: {pivo}, introsort aleatória: {tempo_aleatorio:.6f} s, introsort ordenada: {tempo_ordenado:.6f} s")
+
+for pivo in tipos_pivo:
+   inicio = time.time()
+   ordena_rapida_listas(dados.copy(), pivo)
+   print(f"  Pivo: {pivo}, listas aleatória: {time.time() - inicio:.6f} s")
+
+# Com entrada ordenada, 'primeiro' e 'ultimo' recursam até a profundidade n na versão com listas
+inicio = time.time()
+ordena_rapida_listas(dados_ordenados_entrada.copy(), "mediano")
+print(f"  Pivo: mediano, listas ordenada: {time.time() - inicio:.6f} s")
@@ -2,6 +2,7 @@ import random
 import time
 import matplotlib.pyplot as plt
 import numpy as np
+from ordenacao import ordena_rapida, ordena_decorada, ordena_estudantes
 
 
 class Estudante:
@@ -14,7 +15,7 @@ class Estudante:
        return f"{self.nome}: {self.nota}"
 
 
-def ordena_rapida(lista, chave):
+def ordena_rapida_listas(lista, chave):
    if len(lista) <= 1:
        return lista
 
@@ -25,7 +26,7 @@ def ordena_rapida(lista, chave):
    maiores = [x for x in lista if chave(x) > chave(pivo)]
 
 
-   return ordena_rapida(menores, chave) + iguais + ordena_rapida(maiores, chave)
+   return ordena_rapida_listas(menores, chave) + iguais + ordena_rapida_listas(maiores, chave)
 
 
 plt.style.use('default')
@@ -118,4 +119,58 @@ print("\nRazões de crescimento:")
 for i in range(len(razoes)):
    print(f"Aumento de {tamanhos[i]} para {tamanhos[i + 1]} elementos:")
    print(f"Razão de tempo: {razoes[i]:.2f}")
-   print(f"Razão de tamanho: {razoes_tamanho[i]:.2f}")
\ No newline at end of file
+   print(f"Razão de tamanho: {razoes_tamanho[i]:.2f}")
+
+print("\nIntrosort no lugar vs. quicksort com listas:")
+for tamanho in [1000, 10000, 50000]:
+   estudantes = [
+       Estudante(f"Estudante{i}", random.randint(0, 100)) for i in range(tamanho)
+   ]
+
+
+   inicio = time.time()
+   por_listas = ordena_rapida_listas(estudantes.copy(), chave=lambda x: x.nota)
+   tempo_listas = time.time() - inicio
+
+
+   inicio = time.time()
+   no_lugar = ordena_rapida(estudantes.copy(), chave=lambda x: x.nota)
+   tempo_no_lugar = time.time() - inicio
+
+
+   # Com o desempate pela posição original, a ordem dos empates também coincide
+   if por_listas != no_lugar:
+       raise RuntimeError("Introsort não ordenou corretamente")
+   print(f"{tamanho} estudantes: listas {tempo_listas:.6f} s, introsort {tempo_no_lugar:.6f} s "
+         f"({tempo_listas / tempo_no_lugar:.2f}x)")
+
+
+print("\nOrdenação decorada (argsort) vs. quicksort recursivo com listas:")
+for tamanho in [10000, 100000, 1000000]:
+   estudantes = [
+       Estudante(f"Estudante{random.randint(0, tamanho)}", random.randint(0, 100)) for i in range(tamanho)
+   ]
+
+
+   inicio = time.time()
+   por_listas = ordena_rapida_listas(estudantes, chave=lambda x: x.nota)
+   tempo_listas = time.time() - inicio
+
+
+   inicio = time.time()
+   decorada = ordena_decorada(estudantes, lambda x: x.nota)
+   tempo_decorada = time.time() - inicio
+
+
+   inicio = time.time()
+   por_nota_e_nome = ordena_estudantes(estudantes)
+   tempo_duas_chaves = time.time() - inicio
+
+
+   # As duas versões são estáveis, então a ordem dos empates também coincide
+   if por_listas != decorada:
+       raise RuntimeError("Ordenação decorada diverge do quicksort com listas")
+   if por_nota_e_nome != sorted(estudantes, key=lambda e: (e.nota, e.nome)):
+       raise RuntimeError("Ordenação por nota e nome incorreta")
+   print(f"{tamanho} estudantes: listas {tempo_listas:.6f} s, argsort {tempo_decorada:.6f} s "
+         f"({tempo_listas / tempo_decorada:.2f}x), nota e nome com lexsort {tempo_duas_chaves:.6f} s")
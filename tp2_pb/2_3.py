@@ -1,7 +1,9 @@
+import math
 import random
 import time
 import matplotlib.pyplot as plt
 import numpy as np
+from ordenacao import ordena_decorada, ordena_estudantes
 
 
 class Estudante:
@@ -30,7 +32,7 @@ def ordena_rapida(lista, chave):
    return ordena_rapida(menores, chave) + iguais + ordena_rapida(maiores, chave)
 
 
-def quick_select(lista, k):
+def quick_select_listas(lista, k):
    if len(lista) == 1:
        return lista[0]
 
@@ -44,11 +46,152 @@ def quick_select(lista, k):
 
 
    if k <= len(menores):
-       return quick_select(menores, k)
+       return quick_select_listas(menores, k)
    elif k <= len(menores) + len(iguais):
        return pivo
    else:
-       return quick_select(maiores, k - len(menores) - len(iguais))
+       return quick_select_listas(maiores, k - len(menores) - len(iguais))
+
+
+def ordena_insercao_intervalo(lista, esquerda, direita):
+   for i in range(esquerda + 1, direita + 1):
+       valor = lista[i]
+       j = i - 1
+       while j >= esquerda and lista[j] > valor:
+           lista[j + 1] = lista[j]
+           j -= 1
+       lista[j + 1] = valor
+
+
+def particiona_hoare(lista, esquerda, direita):
+   # Pivô em lista[esquerda]; devolve j com lista[esquerda..j] <= pivô <= lista[j+1..direita]
+   pivo = lista[esquerda]
+   i = esquerda - 1
+   j = direita + 1
+   while True:
+       i += 1
+       while lista[i] < pivo:
+           i += 1
+       j -= 1
+       while lista[j] > pivo:
+           j -= 1
+       if i >= j:
+           return j
+       lista[i], lista[j] = lista[j], lista[i]
+
+
+def mediana_de_tres(lista, a, b, c):
+   if lista[a] < lista[b]:
+       if lista[b] < lista[c]:
+           return b
+       return c if lista[a] < lista[c] else a
+   if lista[a] < lista[c]:
+       return a
+   return c if lista[b] < lista[c] else b
+
+
+def escolhe_pivo(lista, esquerda, direita, estrategia):
+   if estrategia == 'aleatorio':
+       return random.randint(esquerda, direita)
+
+   # Ninther de Tukey: mediana de três medianas de três, espalhadas pelo intervalo
+   meio = (esquerda + direita) // 2
+   if direita - esquerda < 40:
+       return mediana_de_tres(lista, esquerda, meio, direita)
+   passo = (direita - esquerda) // 8
+   return mediana_de_tres(
+       lista,
+       mediana_de_tres(lista, esquerda, esquerda + passo, esquerda + 2 * passo),
+       mediana_de_tres(lista, meio - passo, meio, meio + passo),
+       mediana_de_tres(lista, direita - 2 * passo, direita - passo, direita))
+
+
+def mediana_das_medianas(lista, esquerda, direita):
+   # Ordena grupos de 5, leva as medianas para o início do intervalo e seleciona a mediana delas
+   num_grupos = 0
+   for inicio in range(esquerda, direita + 1, 5):
+       fim = min(inicio + 4, direita)
+       ordena_insercao_intervalo(lista, inicio, fim)
+       mediana = (inicio + fim) // 2
+       destino = esquerda + num_grupos
+       lista[destino], lista[mediana] = lista[mediana], lista[destino]
+       num_grupos += 1
+   meio = esquerda + (num_grupos - 1) // 2
+   seleciona_intervalo(lista, meio, esquerda, esquerda + num_grupos - 1, 'mediana_das_medianas')
+   return meio
+
+
+def seleciona_intervalo(lista, k, esquerda, direita, estrategia='ninther'):
+   # Introselect: se duas partições seguidas não reduzem o intervalo à metade,
+   # o restante passa a usar a mediana das medianas, que garante tempo linear
+   usar_mediana_das_medianas = estrategia == 'mediana_das_medianas'
+   tamanho_referencia = direita - esquerda + 1
+   particoes = 0
+
+   while direita - esquerda >= 16:
+       if usar_mediana_das_medianas:
+           indice_pivo = mediana_das_medianas(lista, esquerda, direita)
+       else:
+           indice_pivo = escolhe_pivo(lista, esquerda, direita, estrategia)
+       lista[esquerda], lista[indice_pivo] = lista[indice_pivo], lista[esquerda]
+       j = particiona_hoare(lista, esquerda, direita)
+
+       if k <= j:
+           direita = j
+       else:
+           esquerda = j + 1
+
+       particoes += 1
+       if particoes == 2:
+           tamanho = direita - esquerda + 1
+           if tamanho > tamanho_referencia // 2:
+               usar_mediana_das_medianas = True
+           tamanho_referencia = tamanho
+           particoes = 0
+
+   ordena_insercao_intervalo(lista, esquerda, direita)
+   return lista[k]
+
+
+def quick_select(lista, k, estrategia='ninther'):
+   # k começa em 1, como na versão original; a lista é reorganizada no lugar
+   if not 1 <= k <= len(lista):
+       raise IndexError(f"k={k} fora do intervalo 1..{len(lista)}")
+   return seleciona_intervalo(lista, k - 1, 0, len(lista) - 1, estrategia)
+
+
+def quick_select_varios(lista, ks, estrategia='ninther'):
+   # Cada estatística seleciona no intervalo deixado pelas anteriores, então as partições
+   # feitas para uma servem às outras
+   indices = sorted(set(k - 1 for k in ks))
+   for indice in indices:
+       if not 0 <= indice < len(lista):
+           raise IndexError(f"k={indice + 1} fora do intervalo 1..{len(lista)}")
+
+   valores = {}
+   pendentes = [(0, len(lista) - 1, 0, len(indices))]
+   while pendentes:
+       esquerda, direita, primeiro, ultimo = pendentes.pop()
+       if primeiro >= ultimo:
+           continue
+       meio = (primeiro + ultimo) // 2
+       indice = indices[meio]
+       valores[indice + 1] = seleciona_intervalo(lista, indice, esquerda, direita, estrategia)
+       pendentes.append((esquerda, indice - 1, primeiro, meio))
+       pendentes.append((indice + 1, direita, meio + 1, ultimo))
+
+   return [valores[k] for k in ks]
+
+
+def percentis(lista, ps=(50, 95, 99), estrategia='ninther'):
+   if not lista:
+       raise ValueError("Percentis de uma lista vazia não são definidos")
+   for p in ps:
+       if not 0 <= p <= 100:
+           raise ValueError(f"Percentil {p} fora do intervalo 0..100")
+   # Posto mais próximo: o percentil p é o elemento de posição ceil(p/100 * n)
+   ks = [max(1, math.ceil(p / 100 * len(lista))) for p in ps]
+   return dict(zip(ps, quick_select_varios(lista, ks, estrategia)))
 
 
 n_listas = 10
@@ -130,3 +273,53 @@ for k in valores_k:
 
 
 
+
+
+print("\nEntradas ordenadas (pior caso do pivô no primeiro elemento):")
+for tamanho in [200, 400, 800]:
+   lista = list(range(tamanho))
+   inicio = time.time()
+   quick_select_listas(lista.copy(), tamanho // 2)
+   tempo_listas = time.time() - inicio
+   inicio = time.time()
+   quick_select(lista.copy(), tamanho // 2)
+   tempo_no_lugar = time.time() - inicio
+   print(f"n = {tamanho}: listas {tempo_listas:.6f} s, introselect no lugar {tempo_no_lugar:.6f} s")
+
+
+print("\nIntroselect no lugar em listas grandes (k = n/2):")
+for tamanho in [100000, 1000000]:
+   aleatoria = [random.randint(1, 1000000) for _ in range(tamanho)]
+   entradas = {'aleatória': aleatoria, 'ordenada': sorted(aleatoria)}
+   for nome_entrada, entrada in entradas.items():
+       for estrategia in ['aleatorio', 'ninther', 'mediana_das_medianas']:
+           lista = entrada.copy()
+           inicio = time.time()
+           valor = quick_select(lista, tamanho // 2, estrategia)
+           fim = time.time()
+           print(f"n = {tamanho}, {nome_entrada}, pivô {estrategia}: {fim - inicio:.6f} s (valor {valor})")
+
+   inicio = time.time()
+   separados = [quick_select(aleatoria.copy(), max(1, math.ceil(p / 100 * tamanho))) for p in (50, 95, 99)]
+   tempo_separados = time.time() - inicio
+   inicio = time.time()
+   juntos = percentis(aleatoria.copy())
+   tempo_juntos = time.time() - inicio
+   if list(juntos.values()) != separados:
+       raise RuntimeError("Seleção múltipla diverge das seleções separadas")
+   print(f"n = {tamanho}, p50/p95/p99 {juntos}: três seleções {tempo_separados:.6f} s, "
+         f"seleção múltipla {tempo_juntos:.6f} s")
+
+
+print("\nOrdenação de estudantes com chaves calculadas uma vez (100000 estudantes):")
+estudantes = [Estudante(f"Estudante{random.randint(0, 100000)}", random.randint(0, 100)) for _ in range(100000)]
+inicio = time.time()
+por_listas = ordena_rapida(estudantes, chave=lambda x: x.nota)
+tempo_listas = time.time() - inicio
+inicio = time.time()
+por_nota_e_nome = ordena_estudantes(estudantes)
+tempo_decorada = time.time() - inicio
+if [e.nota for e in por_listas] != [e.nota for e in por_nota_e_nome]:
+   raise RuntimeError("Ordenação decorada diverge do quicksort com listas")
+print(f"quicksort recursivo: {tempo_listas:.6f} s, argsort/lexsort por nota e nome: {tempo_decorada:.6f} s")
+print(f"Três melhores: {por_nota_e_nome[-3:]}")
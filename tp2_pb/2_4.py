@@ -1,8 +1,12 @@
+import sys
 import time
 import random
+import heapq
+import itertools
+import numpy as np
 
 
-def k_menores_elementos(lista, k=10):
+def k_menores_elementos_ordenando(lista, k=10):
    menores = [float('inf')] * k
    for num in lista[:k]:
        menores.append(num)
@@ -14,6 +18,94 @@ def k_menores_elementos(lista, k=10):
    return menores
 
 
+def k_menores_vetorizado(vetor, k=10):
+   vetor = np.asarray(vetor)
+   if k <= 0:
+       return vetor[:0]
+   if k < len(vetor):
+       vetor = vetor[np.argpartition(vetor, k - 1)[:k]]
+   return np.sort(vetor)
+
+
+def k_menores_elementos(fonte, k=10):
+   # Vetor NumPy inteiro: seleção vetorizada, sem laço em Python
+   if isinstance(fonte, np.ndarray):
+       return k_menores_vetorizado(fonte, k).tolist()
+   if k <= 0:
+       return []
+
+   # Max-heap limitada a k elementos (valores negados sobre o heapq); o topo é o maior
+   # dos k menores vistos até agora, e cada candidato custa O(log k) em vez de uma ordenação
+   heap = []
+   iterador = iter(fonte)
+   primeiro = next(iterador, None)
+   if primeiro is None:
+       return []
+
+   if isinstance(primeiro, np.ndarray):
+       # Fonte fragmentada em blocos: só os candidatos abaixo do limite entram na heap
+       for bloco in itertools.chain([primeiro], iterador):
+           if len(heap) == k:
+               bloco = bloco[bloco < -heap[0]]
+           for num in k_menores_vetorizado(bloco, k).tolist():
+               if len(heap) < k:
+                   heapq.heappush(heap, -num)
+               elif num < -heap[0]:
+                   heapq.heapreplace(heap, -num)
+               else:
+                   break
+       return sorted(-num for num in heap)
+
+   heap.append(-primeiro)
+   for num in itertools.islice(iterador, k - 1):
+       heapq.heappush(heap, -num)
+   if len(heap) < k:
+       return sorted(-num for num in heap)
+
+   limite = -heap[0]
+   for num in iterador:
+       if num < limite:
+           heapq.heapreplace(heap, -num)
+           limite = -heap[0]
+   return sorted(-num for num in heap)
+
+
+def gerar_blocos(tamanho, tamanho_bloco=1000000, semente=0):
+   gerador = np.random.default_rng(semente)
+   for inicio in range(0, tamanho, tamanho_bloco):
+       yield gerador.integers(0, 2 ** 31 - 1, min(tamanho_bloco, tamanho - inicio), dtype=np.int32)
+
+
+def comparar_k_menores(tamanho=10000000, k=1000, tamanho_bloco=1000000):
+   vetor = np.concatenate(list(gerar_blocos(tamanho, tamanho_bloco)))
+   tempos = {}
+
+   start_time = time.time()
+   referencia = k_menores_elementos_ordenando(vetor, k=k)
+   tempos['sorted a cada candidato'] = time.time() - start_time
+
+   start_time = time.time()
+   resultado_heap = k_menores_elementos(
+       itertools.chain.from_iterable(bloco.tolist() for bloco in gerar_blocos(tamanho, tamanho_bloco)), k=k)
+   tempos['heap limitada (iterável)'] = time.time() - start_time
+
+   start_time = time.time()
+   resultado_blocos = k_menores_elementos(gerar_blocos(tamanho, tamanho_bloco), k=k)
+   tempos['heap limitada (blocos NumPy)'] = time.time() - start_time
+
+   start_time = time.time()
+   resultado_vetor = k_menores_elementos(vetor, k=k)
+   tempos['argpartition'] = time.time() - start_time
+
+   if not (referencia == resultado_heap == resultado_blocos == resultado_vetor):
+       raise RuntimeError("As implementações de k menores divergem")
+
+   print(f"\n{k} menores elementos de {tamanho} valores:")
+   for nome, tempo in tempos.items():
+       print("  {}: {:.6f} segundos ({:.1f}x)".format(nome, tempo, tempos['sorted a cada candidato'] / tempo))
+   return tempos
+
+
 def main():
    lista_aleatoria = random.sample(range(1, 100000), 50000)
 
@@ -30,5 +122,14 @@ def main():
    print("Tempo de execução: {:.6f} segundos".format(tempo_execucao))
 
 
-for i in range(10):
-   main()
+if __name__ == "__main__":
+   for i in range(10):
+       main()
+
+
+   # 10^8 valores ocupam 800 MB só no vetor de referência: só roda quando pedido
+   if '--grande' in sys.argv:
+       comparar_k_menores(tamanho=100000000)
+   else:
+       comparar_k_menores()
+       print("Comparação com 10^8 valores omitida; rode com --grande para incluí-la.")
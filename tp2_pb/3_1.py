@@ -4,9 +4,10 @@ import time
 import matplotlib.pyplot as plt
 import numpy as np
 import random
+import tracemalloc
 
 
-class Node:
+class NodeComDict:
    def __init__(self, value):
        self.value = value
        self.next = None
@@ -14,19 +15,20 @@ class Node:
 
 
 
-class LinkedList:
+class LinkedListSemCauda:
+   # Versão anterior, mantida para comparação: inserir_fim percorre a lista inteira
    def __init__(self):
        self.head = None
 
 
    def inserir_inicio(self, value):
-       new_node = Node(value)
+       new_node = NodeComDict(value)
        new_node.next = self.head
        self.head = new_node
 
 
    def inserir_fim(self, value):
-       new_node = Node(value)
+       new_node = NodeComDict(value)
        if not self.head:
            self.head = new_node
            return
@@ -36,16 +38,87 @@ class LinkedList:
        last.next = new_node
 
 
+
+
+class Node:
+   __slots__ = ('value', 'next')
+
+
+   def __init__(self, value):
+       self.value = value
+       self.next = None
+
+
+
+
+class LinkedList:
+   def __init__(self):
+       self.head = None
+       self.tail = None
+       self.tamanho = 0
+
+
+   def __len__(self):
+       return self.tamanho
+
+
+   def inserir_inicio(self, value):
+       new_node = Node(value)
+       new_node.next = self.head
+       self.head = new_node
+       if self.tail is None:
+           self.tail = new_node
+       self.tamanho += 1
+
+
+   def inserir_fim(self, value):
+       new_node = Node(value)
+       if self.tail is None:
+           self.head = new_node
+       else:
+           self.tail.next = new_node
+       self.tail = new_node
+       self.tamanho += 1
+
+
+   def extend(self, valores):
+       # Encadeia os novos nós localmente e liga a corrente à cauda uma única vez
+       primeiro = ultimo = None
+       quantidade = 0
+       for value in valores:
+           new_node = Node(value)
+           if ultimo is None:
+               primeiro = new_node
+           else:
+               ultimo.next = new_node
+           ultimo = new_node
+           quantidade += 1
+       if primeiro is None:
+           return
+       if self.tail is None:
+           self.head = primeiro
+       else:
+           self.tail.next = primeiro
+       self.tail = ultimo
+       self.tamanho += quantidade
+
+
    def excluir(self, value):
        if not self.head:
            return
        if self.head.value == value:
            self.head = self.head.next
+           if self.head is None:
+               self.tail = None
+           self.tamanho -= 1
            return
        current = self.head
        while current.next:
            if current.next.value == value:
+               if current.next is self.tail:
+                   self.tail = current
                current.next = current.next.next
+               self.tamanho -= 1
                return
            current = current.next
 
@@ -92,16 +165,38 @@ def executar_teste():
    tempo_exibir = medir_tempo(lista.exibir)
 
 
+   lista_antes = LinkedListSemCauda()
+   lista_depois = LinkedList()
+   tempo_fim_antes = medir_tempo(lambda: [lista_antes.inserir_fim(i) for i in range(5000)])
+   tempo_fim_depois = medir_tempo(lambda: [lista_depois.inserir_fim(i) for i in range(5000)])
+   tempo_extend = medir_tempo(lista_depois.extend, range(100000))
+
+
    return {
        'inicio': tempo_inicio,
        'fim': tempo_fim,
        'excluir': tempo_excluir,
-       'exibir': tempo_exibir
+       'exibir': tempo_exibir,
+       'vazao_fim_antes': 5000 / tempo_fim_antes,
+       'vazao_fim_depois': 5000 / tempo_fim_depois,
+       'vazao_extend': 100000 / tempo_extend
    }
 
 
 
 
+def medir_memoria_por_no(classe_lista, quantidade=100000):
+   tracemalloc.start()
+   lista = classe_lista()
+   for i in range(quantidade):
+       lista.inserir_inicio(i)
+   memoria, _ = tracemalloc.get_traced_memory()
+   tracemalloc.stop()
+   return memoria / quantidade
+
+
+
+
 resultados = []
 for i in range(10):
    print(f"Executando teste {i + 1}/10...")
@@ -165,4 +260,13 @@ for operacao in tempos:
    print(f"Média: {np.mean(valores):.6f} segundos")
    print(f"Desvio Padrão: {np.std(valores):.6f} segundos")
    print(f"Mínimo: {min(valores):.6f} segundos")
-   print(f"Máximo: {max(valores):.6f} segundos")
\ No newline at end of file
+   print(f"Máximo: {max(valores):.6f} segundos")
+
+
+print("\nInserção no fim e memória por nó, antes e depois (cauda, contador e __slots__):")
+for chave, descricao in [('vazao_fim_antes', 'inserir_fim sem cauda'),
+                         ('vazao_fim_depois', 'inserir_fim com cauda'),
+                         ('vazao_extend', 'extend')]:
+   print(f"{descricao}: {np.mean([r[chave] for r in resultados]):,.0f} inserções/segundo")
+print(f"Memória por nó com __dict__: {medir_memoria_por_no(LinkedListSemCauda):.1f} bytes")
+print(f"Memória por nó com __slots__: {medir_memoria_por_no(LinkedList):.1f} bytes")
@@ -1,6 +1,7 @@
 
 
 import time
+import random
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -82,6 +83,266 @@ class DoublyLinkedList:
        return elements
 
 
+   def buscar(self, value):
+       current = self.head
+       posicao = 0
+       while current:
+           if current.value == value:
+               return posicao
+           current = current.next
+           posicao += 1
+       return -1
+
+
+
+
+CAPACIDADE_BLOCO = 64
+
+
+
+
+class Bloco:
+   __slots__ = ('valores', 'next', 'prev')
+
+
+   def __init__(self, valores):
+       self.valores = valores
+       self.next = None
+       self.prev = None
+
+
+
+
+class ListaDesenrolada:
+   # Lista duplamente encadeada de blocos: cada bloco guarda até `capacidade` valores
+   # contíguos, então percorrer a lista segue um ponteiro por bloco e não por elemento
+   def __init__(self, capacidade=CAPACIDADE_BLOCO):
+       if capacidade < 2:
+           raise ValueError("A capacidade do bloco deve ser pelo menos 2")
+       self.capacidade = capacidade
+       self.head = None
+       self.tail = None
+       self.tamanho = 0
+
+
+   def __len__(self):
+       return self.tamanho
+
+
+   def inserir_inicio(self, value):
+       if self.head is None or len(self.head.valores) >= self.capacidade:
+           self._ligar_apos(None, Bloco([value]))
+       else:
+           self.head.valores.insert(0, value)
+       self.tamanho += 1
+
+
+   def inserir_fim(self, value):
+       if self.tail is None or len(self.tail.valores) >= self.capacidade:
+           self._ligar_apos(self.tail, Bloco([value]))
+       else:
+           self.tail.valores.append(value)
+       self.tamanho += 1
+
+
+   def extend(self, valores):
+       valores = list(valores)
+       inicio = 0
+       if self.tail is not None:
+           inicio = self.capacidade - len(self.tail.valores)
+           self.tail.valores.extend(valores[:inicio])
+       for i in range(inicio, len(valores), self.capacidade):
+           self._ligar_apos(self.tail, Bloco(valores[i:i + self.capacidade]))
+       self.tamanho += len(valores)
+
+
+   def excluir(self, pos):
+       if pos < 0 or pos >= self.tamanho:
+           return
+       bloco, indice = self._localizar(pos)
+       self._excluir_do_bloco(bloco, indice)
+
+
+   def exibir(self):
+       elements = []
+       current = self.head
+       while current:
+           elements.extend(current.valores)
+           current = current.next
+       return elements
+
+
+   def exibir_reversa(self):
+       elements = []
+       current = self.tail
+       while current:
+           elements.extend(reversed(current.valores))
+           current = current.prev
+       return elements
+
+
+   def buscar(self, value):
+       # A varredura dentro do bloco é feita pelo `in`/`index` da lista, em C
+       current = self.head
+       posicao = 0
+       while current:
+           valores = current.valores
+           if value in valores:
+               return posicao + valores.index(value)
+           posicao += len(valores)
+           current = current.next
+       return -1
+
+
+   def cursor(self, pos=0):
+       if pos < 0 or pos > self.tamanho:
+           raise IndexError("Posição fora da lista")
+       if pos == self.tamanho:
+           return CursorDesenrolado(self, None, 0)
+       bloco, indice = self._localizar(pos)
+       return CursorDesenrolado(self, bloco, indice)
+
+
+   def _localizar(self, pos):
+       # Salta blocos inteiros: O(n / capacidade), a partir da ponta mais próxima
+       if pos < self.tamanho // 2:
+           current = self.head
+           while pos >= len(current.valores):
+               pos -= len(current.valores)
+               current = current.next
+           return current, pos
+       pos = self.tamanho - 1 - pos
+       current = self.tail
+       while pos >= len(current.valores):
+           pos -= len(current.valores)
+           current = current.prev
+       return current, len(current.valores) - 1 - pos
+
+
+   def _ligar_apos(self, anterior, bloco):
+       if anterior is None:
+           bloco.next = self.head
+           self.head = bloco
+       else:
+           bloco.next = anterior.next
+           anterior.next = bloco
+       bloco.prev = anterior
+       if bloco.next is None:
+           self.tail = bloco
+       else:
+           bloco.next.prev = bloco
+
+
+   def _desligar(self, bloco):
+       if bloco.prev is None:
+           self.head = bloco.next
+       else:
+           bloco.prev.next = bloco.next
+       if bloco.next is None:
+           self.tail = bloco.prev
+       else:
+           bloco.next.prev = bloco.prev
+
+
+   def _inserir_no_bloco(self, bloco, indice, value):
+       # Bloco cheio: divide ao meio antes de inserir (custo limitado pela capacidade)
+       if len(bloco.valores) >= self.capacidade:
+           metade = len(bloco.valores) // 2
+           novo = Bloco(bloco.valores[metade:])
+           del bloco.valores[metade:]
+           self._ligar_apos(bloco, novo)
+           if indice > metade:
+               bloco = novo
+               indice -= metade
+       bloco.valores.insert(indice, value)
+       self.tamanho += 1
+       return bloco, indice
+
+
+   def _excluir_do_bloco(self, bloco, indice):
+       # Remove e mantém os blocos pelo menos meio cheios, pedindo valores ao bloco
+       # seguinte ou fundindo os dois; devolve a posição do elemento que vinha depois
+       del bloco.valores[indice]
+       self.tamanho -= 1
+       minimo = self.capacidade // 2
+       if len(bloco.valores) < minimo:
+           seguinte = bloco.next
+           anterior = bloco.prev
+           if seguinte is not None:
+               if len(bloco.valores) + len(seguinte.valores) <= self.capacidade:
+                   bloco.valores.extend(seguinte.valores)
+                   self._desligar(seguinte)
+               else:
+                   quantidade = minimo - len(bloco.valores)
+                   bloco.valores.extend(seguinte.valores[:quantidade])
+                   del seguinte.valores[:quantidade]
+           elif anterior is not None and len(anterior.valores) + len(bloco.valores) <= self.capacidade:
+               indice += len(anterior.valores)
+               anterior.valores.extend(bloco.valores)
+               self._desligar(bloco)
+               bloco = anterior
+           elif not bloco.valores:
+               self._desligar(bloco)
+               return None, 0
+       if indice >= len(bloco.valores):
+           return bloco.next, 0
+       return bloco, indice
+
+
+
+
+class CursorDesenrolado:
+   # Posição (bloco, índice) dentro de uma ListaDesenrolada; inserir e excluir no cursor
+   # custam O(capacidade), ou seja, O(1) para a capacidade fixa, sem percorrer a lista
+   __slots__ = ('lista', 'bloco', 'indice')
+
+
+   def __init__(self, lista, bloco, indice):
+       self.lista = lista
+       self.bloco = bloco
+       self.indice = indice
+
+
+   def valido(self):
+       return self.bloco is not None
+
+
+   def valor(self):
+       if self.bloco is None:
+           raise IndexError("Cursor no fim da lista")
+       return self.bloco.valores[self.indice]
+
+
+   def avancar(self):
+       if self.bloco is None:
+           return False
+       self.indice += 1
+       if self.indice >= len(self.bloco.valores):
+           self.bloco = self.bloco.next
+           self.indice = 0
+       return self.bloco is not None
+
+
+   def inserir(self, value):
+       # Insere antes do elemento sob o cursor, que continua apontando para ele
+       if self.bloco is None:
+           self.lista.inserir_fim(value)
+           return
+       bloco, indice = self.lista._inserir_no_bloco(self.bloco, self.indice, value)
+       self.bloco = bloco
+       self.indice = indice
+       self.avancar()
+
+
+   def excluir(self):
+       # Remove o elemento sob o cursor, que passa a apontar para o seguinte
+       if self.bloco is None:
+           raise IndexError("Cursor no fim da lista")
+       value = self.bloco.valores[self.indice]
+       self.bloco, self.indice = self.lista._excluir_do_bloco(self.bloco, self.indice)
+       return value
+
+
 
 
 def medir_tempo(operacao, *args):
@@ -145,6 +406,67 @@ def main():
 
 
 
+def comparar_lista_desenrolada(tamanho=1000000, capacidades=(16, 64, 256), n_buscas=20):
+   lista = DoublyLinkedList()
+   for i in range(tamanho):
+       lista.inserir_fim(i)
+   alvos = random.sample(range(tamanho), n_buscas)
+
+   estruturas = [('DoublyLinkedList', lista)]
+   for capacidade in capacidades:
+       desenrolada = ListaDesenrolada(capacidade)
+       desenrolada.extend(range(tamanho))
+       estruturas.append((f'Desenrolada ({capacidade})', desenrolada))
+
+   resultados = {}
+   for nome, estrutura in estruturas:
+       tempo_exibir = medir_tempo(estrutura.exibir)
+       tempo_reversa = medir_tempo(estrutura.exibir_reversa)
+       start_time = time.time()
+       for alvo in alvos:
+           if estrutura.buscar(alvo) != alvo:
+               raise RuntimeError(f"{nome}: busca por {alvo} devolveu posição errada")
+       tempo_buscar = (time.time() - start_time) / n_buscas
+       resultados[nome] = {'exibir': tempo_exibir, 'reversa': tempo_reversa, 'buscar': tempo_buscar}
+
+   # Inserções e exclusões intercaladas a partir de um cursor no meio da lista
+   desenrolada = ListaDesenrolada()
+   desenrolada.extend(range(tamanho))
+   cursor = desenrolada.cursor(tamanho // 2)
+   start_time = time.time()
+   for i in range(100000):
+       cursor.inserir(-i)
+       cursor.avancar()
+       cursor.excluir()
+   tempo_cursor = time.time() - start_time
+
+   base = resultados['DoublyLinkedList']
+   print(f"\nTravessia e busca com {tamanho} elementos:")
+   for nome, tempos in resultados.items():
+       print(f"{nome}:")
+       for operacao, tempo in tempos.items():
+           print(f"  {operacao}: {tempo:.6f} segundos ({base[operacao] / tempo:.1f}x)")
+   print(f"Cursor: {200000 / tempo_cursor:,.0f} inserções/exclusões por segundo")
+
+   plt.figure(figsize=(12, 6))
+   operacoes = list(base.keys())
+   largura = 0.8 / len(resultados)
+   for i, (nome, tempos) in enumerate(resultados.items()):
+       plt.bar(np.arange(len(operacoes)) + i * largura, [tempos[op] for op in operacoes], largura, label=nome)
+   plt.xticks(np.arange(len(operacoes)) + largura * (len(resultados) - 1) / 2, operacoes)
+   plt.title(f'Lista Encadeada vs Lista Desenrolada ({tamanho} elementos)')
+   plt.ylabel('Tempo (segundos)')
+   plt.yscale('log')
+   plt.legend()
+   plt.grid(True, alpha=0.3)
+   plt.tight_layout()
+   plt.savefig('comparacao_lista_desenrolada.png')
+   plt.show()
+   return resultados
+
+
+
+
 for i in range(10):
    main()
 
@@ -161,3 +483,6 @@ plt.xticks(rotation=45)
 plt.grid(True, alpha=0.3)
 plt.tight_layout()
 plt.show()
+
+
+comparar_lista_desenrolada()
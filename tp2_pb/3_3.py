@@ -5,6 +5,9 @@ import numpy as np
 
 
 class Node:
+   __slots__ = ('valor', 'proximo')
+
+
    def __init__(self, valor):
        self.valor = valor
        self.proximo = None
@@ -13,23 +16,50 @@ class Node:
 
 
 class LinkedList:
-   def __init__(self):
+   def __init__(self, guardar_estados=False):
        self.cabeca = None
+       self.cauda = None
+       self.tamanho = 0
        self.operacoes = []
+       self.tamanhos = []
+       # Copiar a lista inteira a cada operação torna n adições O(n²); só sob pedido
+       self.guardar_estados = guardar_estados
        self.estados = []
 
 
+   def _registrar(self, operacao):
+       self.operacoes.append(operacao)
+       self.tamanhos.append(self.tamanho)
+       if self.guardar_estados:
+           self.estados.append(self.exibir())
+
+
    def adicionar(self, valor):
        novo_no = Node(valor)
-       if not self.cabeca:
+       if self.cauda is None:
            self.cabeca = novo_no
        else:
-           atual = self.cabeca
-           while atual.proximo:
-               atual = atual.proximo
-           atual.proximo = novo_no
-       self.operacoes.append(f'Adicionado {valor}')
-       self.estados.append(self.exibir())
+           self.cauda.proximo = novo_no
+       self.cauda = novo_no
+       self.tamanho += 1
+       self._registrar(f'Adicionado {valor}')
+
+
+   def extend(self, valores):
+       quantidade = self.tamanho
+       for valor in valores:
+           novo_no = Node(valor)
+           if self.cauda is None:
+               self.cabeca = novo_no
+           else:
+               self.cauda.proximo = novo_no
+           self.cauda = novo_no
+           self.tamanho += 1
+       self._registrar(f'Adicionados {self.tamanho - quantidade} valores')
+
+
+   def __len__(self):
+       return self.tamanho
 
 
    def buscar(self, valor):
@@ -46,14 +76,14 @@ class LinkedList:
    def inverter(self):
        anterior = None
        atual = self.cabeca
+       self.cauda = atual
        while atual:
            proximo_no = atual.proximo
            atual.proximo = anterior
            anterior = atual
            atual = proximo_no
        self.cabeca = anterior
-       self.operacoes.append('Lista invertida')
-       self.estados.append(self.exibir())
+       self._registrar('Lista invertida')
 
 
    def exibir(self):
@@ -70,7 +100,7 @@ class LinkedList:
 
 
        # Gráfico de linha mostrando o tamanho da lista ao longo das operações
-       tamanhos = [len(estado) for estado in self.estados]
+       tamanhos = self.tamanhos
        plt.plot(range(len(tamanhos)), tamanhos, marker='o', linestyle='-', linewidth=2, markersize=8)
 
 
@@ -127,6 +157,10 @@ print("Teste 8.2 - Buscar o valor 2 (meio):", lista.buscar(2))
 print("Teste 8.3 - Buscar o valor 3 (fim):", lista.buscar(3))
 
 
+lista.extend([5, 6])
+print("Teste 8.4 - Adicionar [5, 6] de uma vez:", lista.exibir(), "tamanho", len(lista))
+
+
 lista2 = LinkedList()
 lista2.adicionar(10)
 lista2.inverter()
@@ -1,6 +1,18 @@
+import os
+import sys
 import time
+import heapq
 import random
+import tempfile
+import tracemalloc
 import concurrent.futures
+from multiprocessing import shared_memory
+import numpy as np
+
+# A ordenação externa e o merge sort natural ficam num só lugar, junto do tp4
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tp4_pb'))
+from ordenacao_externa import (ordenacao_mergesort_natural as merge_sort_natural, ordenacao_externa,
+                               gerar_arquivo_binario, arquivo_binario_ordenado)
 
 
 def merge_sort_sequencial(lista):
@@ -12,16 +24,88 @@ def merge_sort_sequencial(lista):
    return merge(esquerda, direita)
 
 
-def merge_sort_paralelo(lista):
+def ordenar_trecho_compartilhado(nome, tamanho, tipo, inicio, fim):
+   # Roda no processo filho: anexa ao bloco compartilhado e ordena só o seu trecho, no lugar
+   memoria = shared_memory.SharedMemory(name=nome)
+   try:
+       vetor = np.ndarray((tamanho,), dtype=tipo, buffer=memoria.buf)
+       vetor[inicio:fim].sort(kind='mergesort')
+       del vetor
+   finally:
+       memoria.close()
+
+
+def vetor_exato(lista):
+   # Só vai para a memória compartilhada o que volta idêntico de tolist(): int que cabem em
+   # int64 ou float. Misturas seriam convertidas (int -> float, perda de precisão, texto) e
+   # vetores de objetos levariam ponteiros do processo pai, inválidos nos filhos sob spawn
+   if isinstance(lista, np.ndarray):
+       return lista if lista.dtype.kind in 'biuf' else None
+   if all(type(x) is int for x in lista):
+       if -2 ** 63 <= min(lista) and max(lista) < 2 ** 63:
+           return np.array(lista, dtype=np.int64)
+       return None
+   if all(type(x) is float for x in lista):
+       return np.array(lista, dtype=np.float64)
+   return None
+
+
+def merge_sort_paralelo(lista, num_processos=None):
+   # Um trecho por processo, ordenado dentro de memória compartilhada (nada é serializado
+   # além do nome do bloco e dos limites); os trechos são intercalados com uma heap de k vias
    if len(lista) <= 1:
-       return lista
-   meio = len(lista) // 2
-   with concurrent.futures.ThreadPoolExecutor() as executor:
-       esquerda_futuro = executor.submit(merge_sort_paralelo, lista[:meio])
-       direita_futuro = executor.submit(merge_sort_paralelo, lista[meio:])
-       esquerda = esquerda_futuro.result()
-       direita = direita_futuro.result()
-   return merge(esquerda, direita)
+       return list(lista)
+   num_processos = num_processos or os.cpu_count()
+   dados = vetor_exato(lista)
+   if dados is None:
+       return merge_sort_natural(list(lista))
+   memoria = shared_memory.SharedMemory(create=True, size=dados.nbytes)
+   try:
+       vetor = np.ndarray(dados.shape, dtype=dados.dtype, buffer=memoria.buf)
+       vetor[:] = dados
+       limites = np.linspace(0, len(vetor), num_processos + 1, dtype=int).tolist()
+
+       with concurrent.futures.ProcessPoolExecutor(max_workers=num_processos) as executor:
+           futuros = [executor.submit(ordenar_trecho_compartilhado, memoria.name, len(vetor), vetor.dtype.str,
+                                      inicio, fim)
+                      for inicio, fim in zip(limites, limites[1:]) if fim > inicio]
+           for futuro in futuros:
+               futuro.result()
+
+       trechos = [vetor[inicio:fim].tolist() for inicio, fim in zip(limites, limites[1:])]
+       del vetor
+   finally:
+       memoria.close()
+       memoria.unlink()
+   return list(heapq.merge(*trechos))
+
+
+def ordenar_vetor_paralelo(vetor, num_processos=None):
+   # Mesmo esquema sem sair do NumPy: cada processo ordena sua fatia na memória compartilhada
+   # e o timsort (kind='stable') só intercala as sequências já ordenadas, no lugar
+   if len(vetor) <= 1:
+       return vetor
+   num_processos = num_processos or os.cpu_count()
+   memoria = shared_memory.SharedMemory(create=True, size=vetor.nbytes)
+   try:
+       compartilhado = np.ndarray(vetor.shape, dtype=vetor.dtype, buffer=memoria.buf)
+       compartilhado[:] = vetor
+       limites = np.linspace(0, len(vetor), num_processos + 1, dtype=int).tolist()
+
+       with concurrent.futures.ProcessPoolExecutor(max_workers=num_processos) as executor:
+           futuros = [executor.submit(ordenar_trecho_compartilhado, memoria.name, len(vetor), vetor.dtype.str,
+                                      inicio, fim)
+                      for inicio, fim in zip(limites, limites[1:]) if fim > inicio]
+           for futuro in futuros:
+               futuro.result()
+
+       vetor[:] = compartilhado
+       del compartilhado
+   finally:
+       memoria.close()
+       memoria.unlink()
+   vetor.sort(kind='stable')
+   return vetor
 
 
 def merge(esquerda, direita):
@@ -39,41 +123,145 @@ def merge(esquerda, direita):
    return resultado
 
 
-def testar_ordenacao(lista):
+def merge_sort_externo(entrada, saida, memoria_bytes=512 * 2 ** 20, num_processos=None, diretorio_temporario=None):
+   # Mesma ordenação externa do tp4 (trechos de até memoria_bytes intercalados em k vias),
+   # com cada trecho ordenado em paralelo sem deixar de ser um vetor int64
+   return ordenacao_externa(entrada, saida, memoria_bytes,
+                            ordenar=lambda vetor: ordenar_vetor_paralelo(vetor, num_processos),
+                            diretorio_temporario=diretorio_temporario)
+
+
+def testar_ordenacao_externa(tamanho_bytes=2 ** 30, memoria_bytes=64 * 2 ** 20):
+   with tempfile.TemporaryDirectory() as pasta:
+       entrada = os.path.join(pasta, 'entrada.bin')
+       saida = os.path.join(pasta, 'saida.bin')
+       gerar_arquivo_binario(entrada, tamanho_bytes)
+
+
+       # O tracemalloc não vê o bloco compartilhado (mmap), já contado no tamanho dos trechos
+       tracemalloc.start()
+       start_time = time.time()
+       num_trechos = merge_sort_externo(entrada, saida, memoria_bytes, diretorio_temporario=pasta)
+       tempo_externo = time.time() - start_time
+       _, pico = tracemalloc.get_traced_memory()
+       tracemalloc.stop()
+       if pico > memoria_bytes:
+           raise RuntimeError(f"Merge sort externo usou {pico / 2 ** 20:.1f} MB, acima de "
+                              f"{memoria_bytes / 2 ** 20:.0f} MB")
+
+
+       tamanho = os.path.getsize(entrada)
+       if not arquivo_binario_ordenado(saida):
+           raise RuntimeError("Merge sort externo produziu um arquivo fora de ordem")
+       if os.path.getsize(saida) != tamanho:
+           raise RuntimeError("Merge sort externo perdeu elementos")
+
+
+   print(f"Merge sort externo: {tamanho / 2 ** 20:.0f} MB com {memoria_bytes / 2 ** 20:.0f} MB de memória, "
+         f"{num_trechos} trechos, {tempo_externo:.2f} s, pico de {pico / 2 ** 20:.1f} MB")
+   return tempo_externo
+
+
+def conferir_tipos_merge_sort_paralelo(num_processos=2):
+   # Compara valores e tipos elemento a elemento: com ==, 1 == 1.0 esconderia uma conversão
+   casos = [
+       [3, 1, 2],
+       [3.5, -1.0, 2.25],
+       [3, 1, 2.5],
+       [2 ** 63, 5, 7],
+       [2 ** 60 + 1, 2 ** 60, -2 ** 63],
+       [-2 ** 63 - 1, 0, 1],
+       [True, False, True],
+       ['b', 'a', 'c'],
+   ]
+   for caso in casos:
+       resultado = merge_sort_paralelo(caso, num_processos)
+       esperado = sorted(caso)
+       if [(type(x), x) for x in resultado] != [(type(x), x) for x in esperado]:
+           raise RuntimeError(f"Merge sort paralelo alterou {caso}: {resultado} em vez de {esperado}")
+   print(f"Merge sort paralelo preserva valores e tipos em {len(casos)} entradas")
+
+
+def testar_ordenacao(lista, processos=None):
+   processos = processos or range(1, os.cpu_count() + 1)
+
+
    start_time = time.time()
    lista_sequencial = merge_sort_sequencial(lista)
    tempo_sequencial = time.time() - start_time
 
 
+   tempos_paralelos = {}
+   for num_processos in processos:
+       start_time = time.time()
+       lista_paralela = merge_sort_paralelo(lista, num_processos)
+       tempos_paralelos[num_processos] = time.time() - start_time
+       if lista_paralela != lista_sequencial:
+           raise RuntimeError(f"Merge sort paralelo com {num_processos} processos ordenou errado")
+
+
+   start_time = time.time()
+   lista_natural = merge_sort_natural(list(lista))
+   tempo_natural = time.time() - start_time
+   if lista_natural != lista_sequencial:
+       raise RuntimeError("Merge sort natural ordenou errado")
+
+
    start_time = time.time()
-   lista_paralela = merge_sort_paralelo(lista)
-   tempo_paralelo = time.time() - start_time
+   merge_sort_natural(lista_natural)
+   tempo_natural_ordenada = time.time() - start_time
+
+
+   print(f"n = {len(lista)}: sequencial {tempo_sequencial:.6f} s, natural de baixo para cima {tempo_natural:.6f} s "
+         f"(já ordenada: {tempo_natural_ordenada:.6f} s)")
+   for num_processos, tempo in tempos_paralelos.items():
+       print(f"  {num_processos} processo(s): {tempo:.6f} s, speedup {tempo_sequencial / tempo:.2f}x")
+   return tempo_sequencial, tempos_paralelos
+
+
+if __name__ == "__main__":
+   conferir_tipos_merge_sort_paralelo()
 
 
-   return tempo_sequencial, tempo_paralelo
+   tamanhos = [2**i for i in range(10, 21, 2)]
+   tempos_sequenciais = []
+   tempos_paralelos = []
 
 
-tamanhos = [2**i for i in range(1, 11)]
-tempos_sequenciais = []
-tempos_paralelos = []
+   for tamanho in tamanhos:
+       lista = [random.randint(0, 100000) for _ in range(tamanho)]
+       tempo_sequencial, tempos_por_processos = testar_ordenacao(lista)
+       tempos_sequenciais.append(tempo_sequencial)
+       tempos_paralelos.append(tempos_por_processos)
 
 
-for tamanho in tamanhos:
-   lista = [random.randint(0, 100000) for _ in range(tamanho)]
-   tempo_sequencial, tempo_paralelo = testar_ordenacao(lista)
-   tempos_sequenciais.append(tempo_sequencial)
-   tempos_paralelos.append(tempo_paralelo)
+   import matplotlib.pyplot as plt
 
 
-import matplotlib.pyplot as plt
+   plt.subplot(2, 1, 1)
+   plt.plot(tamanhos, tempos_sequenciais, label="Sequencial", marker='o')
+   for num_processos in tempos_paralelos[0]:
+       plt.plot(tamanhos, [tempos[num_processos] for tempos in tempos_paralelos],
+                label=f"Paralelo ({num_processos} processos)", marker='x')
+   plt.xlabel("Tamanho da lista")
+   plt.ylabel("Tempo (segundos)")
+   plt.title("Tempo de Execução para Ordenação (MergeSort)")
+   plt.legend()
 
 
-plt.plot(tamanhos, tempos_sequenciais, label="Sequencial", marker='o')
-plt.plot(tamanhos, tempos_paralelos, label="Paralelo", marker='x')
-plt.xlabel("Tamanho da lista")
-plt.ylabel("Tempo (segundos)")
-plt.title("Tempo de Execução para Ordenação (MergeSort)")
-plt.legend()
-plt.show()
+   plt.subplot(2, 1, 2)
+   for tamanho, tempo_sequencial, tempos in zip(tamanhos, tempos_sequenciais, tempos_paralelos):
+       plt.plot(list(tempos), [tempo_sequencial / t for t in tempos.values()], label=f"n = {tamanho}", marker='o')
+   plt.xlabel("Número de processos")
+   plt.ylabel("Speedup sobre o sequencial")
+   plt.title(f"Speedup do MergeSort Paralelo (até {os.cpu_count()} CPUs)")
+   plt.legend()
+   plt.tight_layout()
+   plt.show()
 
 
+   # Gera e ordena um arquivo de 1 GB no disco: só roda quando pedido
+   if '--ordenacao-externa' in sys.argv:
+       testar_ordenacao_externa()
+   else:
+       print("Ordenação externa de 1 GB omitida; rode com --ordenacao-externa para incluí-la.")
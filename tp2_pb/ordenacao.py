@@ -0,0 +1,166 @@
+import random
+import numpy as np
+
+
+LIMITE_INSERCAO = 16
+TIPOS_PIVO = ("primeiro", "ultimo", "mediano", "mediana_de_tres", "aleatorio")
+
+
+def ordena_insercao_intervalo(chaves, itens, esquerda, direita):
+   for i in range(esquerda + 1, direita + 1):
+       chave = chaves[i]
+       if itens is not None:
+           item = itens[i]
+       j = i - 1
+       while j >= esquerda and chaves[j] > chave:
+           chaves[j + 1] = chaves[j]
+           if itens is not None:
+               itens[j + 1] = itens[j]
+           j -= 1
+       chaves[j + 1] = chave
+       if itens is not None:
+           itens[j + 1] = item
+
+
+def ordena_heap_intervalo(chaves, itens, esquerda, direita):
+   n = direita - esquerda + 1
+
+
+   def descer(raiz, fim):
+       while True:
+           filho = 2 * raiz + 1
+           if filho >= fim:
+               return
+           if filho + 1 < fim and chaves[esquerda + filho + 1] > chaves[esquerda + filho]:
+               filho += 1
+           if chaves[esquerda + filho] <= chaves[esquerda + raiz]:
+               return
+           a, b = esquerda + raiz, esquerda + filho
+           chaves[a], chaves[b] = chaves[b], chaves[a]
+           if itens is not None:
+               itens[a], itens[b] = itens[b], itens[a]
+           raiz = filho
+
+
+   for raiz in range(n // 2 - 1, -1, -1):
+       descer(raiz, n)
+   for fim in range(n - 1, 0, -1):
+       a, b = esquerda, esquerda + fim
+       chaves[a], chaves[b] = chaves[b], chaves[a]
+       if itens is not None:
+           itens[a], itens[b] = itens[b], itens[a]
+       descer(0, fim)
+
+
+def mediana_de_tres(chaves, a, b, c):
+   if chaves[a] < chaves[b]:
+       if chaves[b] < chaves[c]:
+           return b
+       return c if chaves[a] < chaves[c] else a
+   if chaves[a] < chaves[c]:
+       return a
+   return c if chaves[b] < chaves[c] else b
+
+
+def escolhe_pivo(chaves, esquerda, direita, tipo_pivo):
+   if tipo_pivo == "primeiro":
+       return esquerda
+   if tipo_pivo == "ultimo":
+       return direita
+   if tipo_pivo == "mediano":
+       return (esquerda + direita) // 2
+   if tipo_pivo == "mediana_de_tres":
+       return mediana_de_tres(chaves, esquerda, (esquerda + direita) // 2, direita)
+   return random.randint(esquerda, direita)
+
+
+def particiona_hoare(chaves, itens, esquerda, direita):
+   # Pivô em chaves[esquerda], lido uma única vez; devolve j com esquerda <= j < direita
+   pivo = chaves[esquerda]
+   i = esquerda - 1
+   j = direita + 1
+   while True:
+       i += 1
+       while chaves[i] < pivo:
+           i += 1
+       j -= 1
+       while chaves[j] > pivo:
+           j -= 1
+       if i >= j:
+           return j
+       chaves[i], chaves[j] = chaves[j], chaves[i]
+       if itens is not None:
+           itens[i], itens[j] = itens[j], itens[i]
+
+
+def introsort(chaves, itens, tipo_pivo):
+   # Quicksort no lugar: intervalos pequenos vão para a inserção e, se a profundidade
+   # passar de 2*log2(n), o intervalo é terminado com heapsort
+   if len(chaves) < 2:
+       return
+   pilha = [(0, len(chaves) - 1, 2 * (len(chaves).bit_length() - 1))]
+   while pilha:
+       esquerda, direita, profundidade = pilha.pop()
+       while direita - esquerda >= LIMITE_INSERCAO:
+           if profundidade == 0:
+               ordena_heap_intervalo(chaves, itens, esquerda, direita)
+               break
+           profundidade -= 1
+
+           indice_pivo = escolhe_pivo(chaves, esquerda, direita, tipo_pivo)
+           chaves[esquerda], chaves[indice_pivo] = chaves[indice_pivo], chaves[esquerda]
+           if itens is not None:
+               itens[esquerda], itens[indice_pivo] = itens[indice_pivo], itens[esquerda]
+           j = particiona_hoare(chaves, itens, esquerda, direita)
+
+           # O lado maior vai para a pilha e o menor continua no laço: pilha O(log n)
+           if j - esquerda < direita - j:
+               pilha.append((j + 1, direita, profundidade))
+               direita = j
+           else:
+               pilha.append((esquerda, j, profundidade))
+               esquerda = j + 1
+       else:
+           ordena_insercao_intervalo(chaves, itens, esquerda, direita)
+
+
+def ordena_rapida(lista, tipo_pivo="mediana_de_tres", chave=None):
+   # Ordena no lugar e devolve a própria lista. Com chave, cada chave é calculada uma vez,
+   # os empates são desfeitos pela posição original (ordenação estável) e as trocas são
+   # espelhadas na lista de elementos. Sem chave, valores iguais podem trocar de ordem
+   if tipo_pivo not in TIPOS_PIVO:
+       raise ValueError("Tipo de pivo invalido. Escolha 'primeiro', 'ultimo', 'mediano', 'mediana_de_tres' ou 'aleatorio'.")
+   if chave is None:
+       introsort(lista, None, tipo_pivo)
+       return lista
+   chaves = [chave(x) for x in lista]
+   n = len(chaves)
+   if all(type(c) is int for c in chaves):
+       # Chaves inteiras: c * n + i preserva a ordem e desempata sem criar tuplas
+       chaves = [c * n + i for i, c in enumerate(chaves)]
+   else:
+       chaves = [(c, i) for i, c in enumerate(chaves)]
+   introsort(chaves, lista, tipo_pivo)
+   return lista
+
+
+def ordena_decorada(lista, *chaves):
+   # Decorar-ordenar-desdecorar: cada chave é calculada uma única vez por elemento num vetor
+   # NumPy, os índices são ordenados de forma estável e os objetos são permutados no fim
+   if not chaves:
+       raise ValueError("Informe pelo menos uma função de chave")
+   vetores = [np.array([chave(x) for x in lista]) for chave in chaves]
+   for vetor in vetores:
+       if vetor.ndim != 1:
+           raise ValueError("Cada chave deve devolver um valor escalar; para desempatar, passe várias "
+                            "funções de chave em vez de uma que devolve tupla")
+   if len(vetores) == 1:
+       ordem = np.argsort(vetores[0], kind='stable')
+   else:
+       # lexsort usa a última chave como principal
+       ordem = np.lexsort(vetores[::-1])
+   return [lista[i] for i in ordem.tolist()]
+
+
+def ordena_estudantes(estudantes):
+   return ordena_decorada(estudantes, lambda e: e.nota, lambda e: e.nome)
@@ -20,6 +20,98 @@ def verificar_ip_em_rede(ip, prefixo):
 
 
 
+TAMANHO_BLOCO_CONVERSAO = 65536
+
+
+
+
+def converter_ips_para_uint32(ips, tamanho_bloco=TAMANHO_BLOCO_CONVERSAO):
+   # As matrizes de caracteres custam centenas de bytes por IP: a conversão anda em blocos
+   # de tamanho fixo, então o pico de memória não cresce com a quantidade de IPs
+   quantidade = len(ips)
+   valores = np.zeros(quantidade, dtype=np.uint32)
+   validos = np.zeros(quantidade, dtype=bool)
+   for inicio in range(0, quantidade, tamanho_bloco):
+       fim = min(inicio + tamanho_bloco, quantidade)
+       valores[inicio:fim], validos[inicio:fim] = converter_bloco_uint32(ips[inicio:fim])
+   return valores, validos
+
+
+
+
+def converter_bloco_uint32(ips):
+   quantidade = len(ips)
+   texto = np.array(ips, dtype=str)
+   caracteres = texto.view(np.uint32).reshape(quantidade, -1)
+   largura = caracteres.shape[1]
+   digito = (caracteres >= 48) & (caracteres <= 57)
+   ponto = caracteres == 46
+   validos = np.all(digito | ponto | (caracteres == 0), axis=1) & (ponto.sum(axis=1) == 3)
+
+
+   # Peso de cada dígito: 10 elevado à quantidade de dígitos que faltam até o próximo ponto ou fim do texto
+   colunas = np.arange(largura, dtype=np.int32)
+   separador = np.where(~digito, colunas, largura)
+   proximo_separador = np.minimum.accumulate(separador[:, ::-1], axis=1)[:, ::-1]
+   expoente = np.clip(proximo_separador - colunas - 1, 0, 3)
+   contribuicao = np.where(digito, (caracteres - 48).astype(np.int32) * 10 ** expoente, 0)
+   segmento = np.cumsum(ponto, axis=1, dtype=np.int8)
+
+
+   valores = np.zeros(quantidade, dtype=np.int64)
+   for indice in range(4):
+       no_segmento = segmento == indice
+       octeto = np.where(no_segmento, contribuicao, 0).sum(axis=1)
+       qtd_digitos = (digito & no_segmento).sum(axis=1)
+       validos &= (qtd_digitos >= 1) & (qtd_digitos <= 3) & (octeto <= 255)
+       # Zeros à esquerda ("01") são rejeitados pelo ipaddress
+       validos &= (qtd_digitos == 1) | (octeto >= 10 ** np.clip(qtd_digitos - 1, 0, 3))
+       valores = (valores << 8) | octeto
+   valores = valores.astype(np.uint32)
+
+
+   # O que o caminho vetorizado não reconhece é decidido pelo ipaddress, como no modo IP a IP
+   for i in np.flatnonzero(~validos):
+       try:
+           valores[i] = int(ipaddress.IPv4Address(ips[i]))
+           validos[i] = True
+       except ValueError:
+           valores[i] = 0
+   return valores, validos
+
+
+
+
+def verificar_ips_em_rede(ips, prefixos):
+   if isinstance(ips, np.ndarray):
+       valores = ips.astype(np.uint32, copy=False)
+       validos = np.ones(len(valores), dtype=bool)
+   else:
+       valores, validos = converter_ips_para_uint32(ips)
+   lista_prefixos = [prefixos] if isinstance(prefixos, str) else list(prefixos)
+
+
+   resultado = np.zeros((len(valores), len(lista_prefixos)), dtype=bool)
+   for j, prefixo in enumerate(lista_prefixos):
+       try:
+           rede = ipaddress.ip_network(prefixo, strict=False)
+       except ValueError as e:
+           print(f"Erro: {e}")
+           continue
+       if rede.version == 6:
+           # Endereços IPv4 nunca pertencem a uma rede IPv6; IPs de texto IPv6 seguem pelo caminho escalar
+           if not isinstance(ips, np.ndarray):
+               resultado[:, j] = [not validos[i] and verificar_ip_em_rede(ip, prefixo) for i, ip in enumerate(ips)]
+           continue
+       mascara = np.uint32(int(rede.netmask))
+       resultado[:, j] = ((valores & mascara) == np.uint32(int(rede.network_address))) & validos
+
+
+   return resultado[:, 0] if isinstance(prefixos, str) else resultado
+
+
+
+
 def gerar_ip_aleatorio():
    return f"{randint(1, 255)}.{randint(0, 255)}.{randint(0, 255)}.{randint(1, 254)}"
 
@@ -42,6 +134,27 @@ def executar_teste_performance(quantidade_ips, prefixo="192.168.1.0/24"):
 
 
 
+def executar_teste_performance_lote(quantidade_ips, prefixo="192.168.1.0/24"):
+   ips = [gerar_ip_aleatorio() for _ in range(quantidade_ips)]
+
+
+   inicio = time.time()
+   valores, _ = converter_ips_para_uint32(ips)
+   fim = time.time()
+   tempo_conversao = fim - inicio
+
+
+   inicio = time.time()
+   verificar_ips_em_rede(valores, prefixo)
+   fim = time.time()
+   tempo_verificacao = fim - inicio
+
+
+   return quantidade_ips, tempo_conversao, tempo_verificacao
+
+
+
+
 def salvar_resultados(resultados, nome_base):
    with open(f"{nome_base}.txt", "w") as f:
        f.write("Resultados dos Testes de Performance\n")
@@ -80,20 +193,76 @@ def salvar_resultados(resultados, nome_base):
 
 
 
+def conferir_modos(quantidade_ips, prefixos):
+   ips = [gerar_ip_aleatorio() for _ in range(quantidade_ips)]
+   lote = verificar_ips_em_rede(ips, prefixos)
+   for j, prefixo in enumerate(prefixos):
+       escalar = np.array([verificar_ip_em_rede(ip, prefixo) for ip in ips])
+       if not np.array_equal(escalar, lote[:, j]):
+           return False
+   return True
+
+
+
+
+def salvar_comparacao_modos(resultados, resultados_lote, nome_base):
+   with open(f"{nome_base}_lote.txt", "w") as f:
+       f.write("Comparação: Verificação IP a IP vs Verificação em Lote (NumPy)\n")
+       f.write("-" * 80 + "\n")
+       f.write(f"{'Qtd IPs':>10} | {'IP a IP (s)':>12} | {'Conversão (s)':>13} | {'Máscara (s)':>12} | {'Speedup':>8}\n")
+       for qtd, tempo in resultados.items():
+           tempo_conversao, tempo_verificacao = resultados_lote[qtd]
+           speedup = tempo / (tempo_conversao + tempo_verificacao)
+           f.write(f"{qtd:10d} | {tempo:12.4f} | {tempo_conversao:13.4f} | {tempo_verificacao:12.4f} | {speedup:7.1f}x\n")
+
+
+   plt.figure(figsize=(10, 6))
+   qtds = list(resultados.keys())
+   plt.plot(qtds, list(resultados.values()), 'b-o', linewidth=2, markersize=8, label='IP a IP (ipaddress)')
+   plt.plot(qtds, [sum(resultados_lote[qtd]) for qtd in qtds], 'g-o', linewidth=2, markersize=8, label='Lote (conversão + máscara)')
+   plt.plot(qtds, [resultados_lote[qtd][1] for qtd in qtds], 'r--o', linewidth=2, markersize=8, label='Lote (apenas máscara)')
+   plt.xscale('log')
+   plt.yscale('log')
+   plt.title('Tempo de Execução vs Quantidade de IPs por Modo', fontsize=14, pad=15)
+   plt.xlabel('Quantidade de IPs', fontsize=12)
+   plt.ylabel('Tempo de Execução (segundos)', fontsize=12)
+   plt.grid(True, linestyle='--', alpha=0.7)
+   plt.legend(fontsize=12)
+
+
+   plt.tight_layout()
+   plt.savefig(f"{nome_base}_lote.png", dpi=300, bbox_inches='tight')
+   plt.close()
+
+
+
+
 def realizar_todos_testes(nome_base="tp3_4-1"):
-   quantidades = [500, 1000, 2500, 5000, 10000]
+   quantidades = [500, 1000, 10000, 100000, 1000000, 10000000]
+
+
+   prefixos_conferencia = ["192.168.1.0/24", "10.0.0.0/8", "172.16.0.0/12", "200.1.2.3/30"]
+   if conferir_modos(10000, prefixos_conferencia):
+       print("Modo em lote confere com verificar_ip_em_rede.")
+   else:
+       print("ATENÇÃO: modo em lote divergiu de verificar_ip_em_rede!")
 
 
    resultados = {}
+   resultados_lote = {}
    for qtd in quantidades:
        print(f"Executando teste com {qtd} IPs...")
        _, tempo = executar_teste_performance(qtd)
        resultados[qtd] = tempo
        print(f"Tempo de execução: {tempo:.2f} segundos")
+       _, tempo_conversao, tempo_verificacao = executar_teste_performance_lote(qtd)
+       resultados_lote[qtd] = (tempo_conversao, tempo_verificacao)
+       print(f"Tempo em lote: {tempo_conversao:.2f}s de conversão + {tempo_verificacao:.4f}s de verificação")
 
 
    salvar_resultados(resultados, nome_base)
-   print(f"\nResultados salvos em {nome_base}.txt e {nome_base}.png")
+   salvar_comparacao_modos(resultados, resultados_lote, nome_base)
+   print(f"\nResultados salvos em {nome_base}.txt, {nome_base}.png, {nome_base}_lote.txt e {nome_base}_lote.png")
 
 
    return resultados
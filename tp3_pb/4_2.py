@@ -3,7 +3,14 @@ import time
 import numpy as np
 import matplotlib.pyplot as plt
 from random import randint
+from array import array
 import os
+import sys
+import tracemalloc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from tabela_mmap import medir_partida_a_frio
+from tabela_intervalos import TabelaIntervalos
 
 
 class TrieNode:
@@ -13,14 +20,21 @@ class TrieNode:
 
 
 class IPTrie:
-   def __init__(self):
+   def __init__(self, rcu=False):
        self.root = TrieNode()
+       self.rcu = rcu
+       self.trava_escrita = threading.Lock()
+       self.tabela_intervalos = None
 
 
    def insert(self, prefix):
+       if self.rcu:
+           self.apply_updates([prefix], [])
+           return
        try:
            net = ipaddress.IPv4Network(prefix, strict=False)
            node = self.root
+           self.tabela_intervalos = None
            ip_int = int(net.network_address)
            prefix_len = net.prefixlen
            for i in range(32):
@@ -35,6 +49,91 @@ class IPTrie:
            print(f"Erro ao inserir prefixo {prefix}: {e}")
 
 
+   def _filho_para_escrita(self, node, bit, copiados):
+       filho = node.children.get(bit)
+       if filho is None:
+           filho = TrieNode()
+       elif copiados is None or id(filho) in copiados:
+           return filho
+       else:
+           # Modo RCU: o nó publicado nunca é alterado, a escrita acontece numa cópia
+           copia = TrieNode()
+           copia.children = dict(filho.children)
+           copia.prefix = filho.prefix
+           filho = copia
+       if copiados is not None:
+           copiados.add(id(filho))
+       node.children[bit] = filho
+       return filho
+
+
+   def _inserir_em(self, raiz, prefix, copiados):
+       try:
+           net = ipaddress.IPv4Network(prefix, strict=False)
+       except ValueError as e:
+           print(f"Erro ao inserir prefixo {prefix}: {e}")
+           return
+       ip_int = int(net.network_address)
+       node = raiz
+       for i in range(net.prefixlen):
+           node = self._filho_para_escrita(node, (ip_int >> (31 - i)) & 1, copiados)
+       node.prefix = prefix
+
+
+   def _remover_em(self, raiz, prefix, copiados):
+       try:
+           net = ipaddress.IPv4Network(prefix, strict=False)
+       except ValueError as e:
+           print(f"Erro ao remover prefixo {prefix}: {e}")
+           return False
+       ip_int = int(net.network_address)
+       prefix_len = net.prefixlen
+       caminho = [raiz]
+       node = raiz
+       for i in range(prefix_len):
+           bit = (ip_int >> (31 - i)) & 1
+           if bit not in node.children:
+               return False
+           node = self._filho_para_escrita(node, bit, copiados)
+           caminho.append(node)
+       if node.prefix is None:
+           return False
+       node.prefix = None
+       # Poda dos nós que ficaram sem prefixo e sem filhos
+       for i in range(prefix_len, 0, -1):
+           node = caminho[i]
+           if node.children or node.prefix is not None:
+               break
+           del caminho[i - 1].children[(ip_int >> (32 - i)) & 1]
+       return True
+
+
+   def remove(self, prefix):
+       return self.apply_updates([], [prefix]) == 1
+
+
+   def apply_updates(self, adds, removes):
+       with self.trava_escrita:
+           if self.rcu:
+               raiz = TrieNode()
+               raiz.children = dict(self.root.children)
+               raiz.prefix = self.root.prefix
+               copiados = {id(raiz)}
+           else:
+               raiz = self.root
+               copiados = None
+           removidos = 0
+           for prefix in removes:
+               if self._remover_em(raiz, prefix, copiados):
+                   removidos += 1
+           for prefix in adds:
+               self._inserir_em(raiz, prefix, copiados)
+           # Publicação do novo snapshot: os leitores em andamento continuam na raiz antiga
+           self.root = raiz
+           self.tabela_intervalos = None
+           return removidos
+
+
    def longest_prefix_match(self, ip):
        try:
            ip_addr = ipaddress.IPv4Address(ip)
@@ -54,6 +153,173 @@ class IPTrie:
            return None
 
 
+   @property
+   def lista_prefixos(self):
+       tabela = self.tabela_intervalos
+       return [] if tabela is None else tabela.prefixos
+
+
+   def construir_intervalos(self, raiz=None):
+       # A tabela guarda a raiz de onde saiu e é publicada numa única atribuição, junto com os
+       # seus prefixos: um leitor nunca combina a tabela de um snapshot com a raiz de outro
+       tabela = TabelaIntervalos(self.root if raiz is None else raiz)
+       self.tabela_intervalos = tabela
+       return tabela
+
+
+   def longest_prefix_match_many(self, ips):
+       # Raiz e tabela lidas uma vez só; se o escritor publicou outra raiz no meio, a tabela
+       # lida pertence ao snapshot anterior e é refeita a partir da raiz atual
+       raiz = self.root
+       tabela = self.tabela_intervalos
+       if tabela is None or tabela.raiz is not raiz:
+           tabela = self.construir_intervalos(raiz)
+       return tabela.longest_prefix_match_many(ips)
+
+
+class IPTrieCompacta:
+   BITS_TABELA = 16
+
+   def __init__(self):
+       self.chave = array('I', [0])
+       self.comprimento = array('B', [0])
+       self.filho0 = array('i', [-1])
+       self.filho1 = array('i', [-1])
+       self.prefixo_id = array('i', [-1])
+       self.prefixos = []
+       self.tabela_no = None
+       self.tabela_melhor = None
+
+
+   def _novo_no(self, chave, comprimento, prefixo_id):
+       self.chave.append(chave)
+       self.comprimento.append(comprimento)
+       self.filho0.append(-1)
+       self.filho1.append(-1)
+       self.prefixo_id.append(prefixo_id)
+       return len(self.chave) - 1
+
+
+   def _marcar_prefixo(self, no, prefix):
+       if self.prefixo_id[no] == -1:
+           self.prefixo_id[no] = len(self.prefixos)
+           self.prefixos.append(prefix)
+       else:
+           self.prefixos[self.prefixo_id[no]] = prefix
+
+
+   def _ligar(self, pai, bit, filho):
+       if bit:
+           self.filho1[pai] = filho
+       else:
+           self.filho0[pai] = filho
+
+
+   def insert(self, prefix):
+       try:
+           net = ipaddress.IPv4Network(prefix, strict=False)
+       except ValueError as e:
+           print(f"Erro ao inserir prefixo {prefix}: {e}")
+           return
+       ip_int = int(net.network_address)
+       prefix_len = net.prefixlen
+       self.tabela_no = None
+       self.tabela_melhor = None
+       node = 0
+       while True:
+           if self.comprimento[node] == prefix_len:
+               self._marcar_prefixo(node, prefix)
+               return
+           bit = (ip_int >> (31 - self.comprimento[node])) & 1
+           filho = self.filho1[node] if bit else self.filho0[node]
+           if filho == -1:
+               novo = self._novo_no(ip_int, prefix_len, len(self.prefixos))
+               self.prefixos.append(prefix)
+               self._ligar(node, bit, novo)
+               return
+           chave_filho = self.chave[filho]
+           comp_filho = self.comprimento[filho]
+           # Tamanho do prefixo comum entre o novo prefixo e o filho (compressão de caminho)
+           comum = min(prefix_len, comp_filho, 32 - (ip_int ^ chave_filho).bit_length())
+           if comum == comp_filho:
+               node = filho
+               continue
+           mascara = (0xFFFFFFFF << (32 - comum)) & 0xFFFFFFFF
+           bit_filho = (chave_filho >> (31 - comum)) & 1
+           if comum == prefix_len:
+               novo = self._novo_no(ip_int & mascara, comum, len(self.prefixos))
+               self.prefixos.append(prefix)
+               self._ligar(novo, bit_filho, filho)
+               self._ligar(node, bit, novo)
+               return
+           intermediario = self._novo_no(ip_int & mascara, comum, -1)
+           folha = self._novo_no(ip_int, prefix_len, len(self.prefixos))
+           self.prefixos.append(prefix)
+           self._ligar(intermediario, bit_filho, filho)
+           self._ligar(intermediario, 1 - bit_filho, folha)
+           self._ligar(node, bit, intermediario)
+           return
+
+
+   def _construir_tabela(self):
+       # Compressão de nível: os 16 primeiros bits indexam diretamente o nó de partida da busca
+       tamanho = 1 << self.BITS_TABELA
+       self.tabela_no = array('i', [0]) * tamanho
+       self.tabela_melhor = array('i', [self.prefixo_id[0]]) * tamanho
+       pilha = [(0, self.prefixo_id[0])]
+       while pilha:
+           node, melhor = pilha.pop()
+           if self.prefixo_id[node] != -1:
+               melhor = self.prefixo_id[node]
+           inicio = self.chave[node] >> (32 - self.BITS_TABELA)
+           fim = inicio + (1 << (self.BITS_TABELA - self.comprimento[node]))
+           self.tabela_no[inicio:fim] = array('i', [node]) * (fim - inicio)
+           self.tabela_melhor[inicio:fim] = array('i', [melhor]) * (fim - inicio)
+           for filho in (self.filho0[node], self.filho1[node]):
+               if filho != -1 and self.comprimento[filho] <= self.BITS_TABELA:
+                   pilha.append((filho, melhor))
+
+
+   def longest_prefix_match(self, ip):
+       try:
+           ip_int = int(ipaddress.IPv4Address(ip))
+       except ValueError as e:
+           print(f"Erro ao buscar longest prefix match para IP {ip}: {e}")
+           return None
+       if self.tabela_no is None:
+           self._construir_tabela()
+       chave = self.chave
+       comprimento = self.comprimento
+       filho0 = self.filho0
+       filho1 = self.filho1
+       prefixo_id = self.prefixo_id
+       indice = ip_int >> (32 - self.BITS_TABELA)
+       node = self.tabela_no[indice]
+       melhor = self.tabela_melhor[indice]
+       while comprimento[node] < 32:
+           if (ip_int >> (31 - comprimento[node])) & 1:
+               node = filho1[node]
+           else:
+               node = filho0[node]
+           if node == -1 or (ip_int ^ chave[node]) >> (32 - comprimento[node]):
+               break
+           if prefixo_id[node] != -1:
+               melhor = prefixo_id[node]
+       return self.prefixos[melhor] if melhor != -1 else None
+
+
+def busca_linear(prefixos, ip):
+   ip_addr = ipaddress.IPv4Address(ip)
+   melhor_match = None
+   maior_prefixo = -1
+   for prefixo in prefixos:
+       rede = ipaddress.IPv4Network(prefixo, strict=False)
+       if ip_addr in rede and rede.prefixlen > maior_prefixo:
+           melhor_match = prefixo
+           maior_prefixo = rede.prefixlen
+   return melhor_match
+
+
 def gerar_ip_aleatorio():
    return f"{randint(1, 255)}.{randint(0, 255)}.{randint(0, 255)}.{randint(1, 254)}"
 
@@ -140,3 +406,176 @@ def salvar_resultados(resultados_insercao, resultados_busca, nome_base):
    plt.close()
 
 
+def construir_trie(prefixos):
+   trie = IPTrie()
+   for prefix in prefixos:
+       trie.insert(prefix)
+   return trie
+
+
+def ler_continuamente(trie, ips, parar):
+   buscas = 0
+   while not parar.is_set():
+       for ip in ips:
+           trie.longest_prefix_match(ip)
+       buscas += len(ips)
+   return buscas
+
+
+def medir_leitores(trie, ips, qtd_leitores, duracao, escritor=None):
+   parar = threading.Event()
+   with ThreadPoolExecutor(max_workers=qtd_leitores) as executor:
+       futuros = [executor.submit(ler_continuamente, trie, ips, parar) for _ in range(qtd_leitores)]
+       inicio = time.time()
+       atualizacoes = 0
+       while time.time() - inicio < duracao:
+           if escritor is None:
+               time.sleep(0.01)
+           else:
+               atualizacoes += escritor()
+       parar.set()
+       buscas = sum(futuro.result() for futuro in futuros)
+   tempo = time.time() - inicio
+   return buscas / tempo, atualizacoes / tempo
+
+
+def testar_atualizacoes_concorrentes(qtd_prefixos=100000, qtd_leitores=4, tamanho_lote=500, duracao=5):
+   prefixos = [gerar_prefixo_aleatorio() for _ in range(qtd_prefixos)]
+   ips = [gerar_ip_aleatorio() for _ in range(1000)]
+   trie = IPTrie(rcu=True)
+   trie.apply_updates(prefixos, [])
+   anunciados = list(prefixos)
+
+   def escritor():
+       # Retira os prefixos mais antigos e anuncia novos no mesmo lote
+       removes = anunciados[:tamanho_lote]
+       adds = [gerar_prefixo_aleatorio() for _ in range(tamanho_lote)]
+       del anunciados[:tamanho_lote]
+       anunciados.extend(adds)
+       trie.apply_updates(adds, removes)
+       return len(adds) + len(removes)
+
+   print(f"Testando {qtd_leitores} leitores sobre {qtd_prefixos} prefixos em modo RCU...")
+   buscas_sem_escrita, _ = medir_leitores(trie, ips, qtd_leitores, duracao)
+   buscas_com_escrita, atualizacoes = medir_leitores(trie, ips, qtd_leitores, duracao, escritor)
+   print(f"  Sem atualizações: {buscas_sem_escrita:,.0f} buscas/s")
+   print(f"  Com atualizações: {buscas_com_escrita:,.0f} buscas/s | {atualizacoes:,.0f} atualizações/s")
+   return buscas_sem_escrita, buscas_com_escrita, atualizacoes
+
+
+def medir_construcao(classe, prefixos):
+   tracemalloc.start()
+   inicio = time.time()
+   trie = classe()
+   for prefix in prefixos:
+       trie.insert(prefix)
+   # A primeira busca também entra na medição, pois constrói as estruturas auxiliares da engine compacta
+   trie.longest_prefix_match(gerar_ip_aleatorio())
+   fim = time.time()
+   memoria, _ = tracemalloc.get_traced_memory()
+   tracemalloc.stop()
+   return trie, fim - inicio, memoria
+
+
+def medir_buscas_por_segundo(funcao_busca, ips):
+   inicio = time.time()
+   for ip in ips:
+       funcao_busca(ip)
+   fim = time.time()
+   return len(ips) / (fim - inicio) if fim > inicio else float('inf')
+
+
+def comparar_engines(tamanhos=(10000, 100000, 1000000), qtd_buscas=100000, qtd_buscas_linear=20):
+   resultados = {
+       'tamanhos': list(tamanhos),
+       'memoria_trie': [],
+       'memoria_compacta': [],
+       'memoria_linear': [],
+       'buscas_trie': [],
+       'buscas_compacta': [],
+       'buscas_linear': []
+   }
+   for tamanho in tamanhos:
+       print(f"Comparando engines com {tamanho} prefixos...")
+       prefixos = [gerar_prefixo_aleatorio() for _ in range(tamanho)]
+       ips = [gerar_ip_aleatorio() for _ in range(qtd_buscas)]
+       trie, tempo_trie, memoria_trie = medir_construcao(IPTrie, prefixos)
+       buscas_trie = medir_buscas_por_segundo(trie.longest_prefix_match, ips)
+       del trie
+       compacta, tempo_compacta, memoria_compacta = medir_construcao(IPTrieCompacta, prefixos)
+       buscas_compacta = medir_buscas_por_segundo(compacta.longest_prefix_match, ips)
+       del compacta
+       memoria_linear = sys.getsizeof(prefixos)
+       buscas_linear = medir_buscas_por_segundo(lambda ip: busca_linear(prefixos, ip), ips[:qtd_buscas_linear])
+       resultados['memoria_trie'].append(memoria_trie)
+       resultados['memoria_compacta'].append(memoria_compacta)
+       resultados['memoria_linear'].append(memoria_linear)
+       resultados['buscas_trie'].append(buscas_trie)
+       resultados['buscas_compacta'].append(buscas_compacta)
+       resultados['buscas_linear'].append(buscas_linear)
+       print(f"  IPTrie: construção {tempo_trie:.2f}s | memória {memoria_trie / 2**20:.1f} MB | {buscas_trie:,.0f} buscas/s")
+       print(f"  IPTrieCompacta: construção {tempo_compacta:.2f}s | memória {memoria_compacta / 2**20:.1f} MB | {buscas_compacta:,.0f} buscas/s")
+       print(f"  Busca linear: memória {memoria_linear / 2**20:.1f} MB | {buscas_linear:,.1f} buscas/s")
+   return resultados
+
+
+def salvar_comparacao_engines(resultados, nome_base="tp3_4-2_engines"):
+   tamanhos = resultados['tamanhos']
+   with open(f"{nome_base}.txt", "w") as f:
+       f.write("Comparação de Engines para Longest Prefix Match (IPv4)\n")
+       f.write("=" * 80 + "\n\n")
+       f.write(f"{'Qtd Prefixos':>12} | {'Engine':15} | {'Memória (MB)':>12} | {'Buscas/s':>14}\n")
+       f.write("-" * 80 + "\n")
+       for i, tamanho in enumerate(tamanhos):
+           for nome, chave in (('IPTrie', 'trie'), ('IPTrieCompacta', 'compacta'), ('Busca linear', 'linear')):
+               f.write(f"{tamanho:12d} | {nome:15} | {resultados['memoria_' + chave][i] / 2**20:12.2f} | "
+                       f"{resultados['buscas_' + chave][i]:14,.1f}\n")
+       f.write("\nANÁLISE COMPARATIVA\n")
+       f.write("-" * 80 + "\n")
+       for i, tamanho in enumerate(tamanhos):
+           razao_memoria = resultados['memoria_trie'][i] / resultados['memoria_compacta'][i]
+           razao_busca = resultados['buscas_compacta'][i] / resultados['buscas_trie'][i]
+           f.write(f"Para {tamanho} prefixos, a IPTrieCompacta usa {razao_memoria:.1f}x menos memória "
+                   f"e faz {razao_busca:.1f}x mais buscas por segundo que a IPTrie.\n")
+
+   plt.figure(figsize=(14, 6))
+   plt.subplot(1, 2, 1)
+   plt.plot(tamanhos, [m / 2**20 for m in resultados['memoria_trie']], 'r-o', linewidth=2, markersize=8, label='IPTrie')
+   plt.plot(tamanhos, [m / 2**20 for m in resultados['memoria_compacta']], 'g-o', linewidth=2, markersize=8, label='IPTrieCompacta')
+   plt.plot(tamanhos, [m / 2**20 for m in resultados['memoria_linear']], 'b-o', linewidth=2, markersize=8, label='Busca Linear')
+   plt.xscale('log')
+   plt.yscale('log')
+   plt.title('Memória vs Quantidade de Prefixos', fontsize=14, pad=15)
+   plt.xlabel('Quantidade de Prefixos', fontsize=12)
+   plt.ylabel('Memória (MB)', fontsize=12)
+   plt.grid(True, linestyle='--', alpha=0.7)
+   plt.legend()
+   plt.subplot(1, 2, 2)
+   plt.plot(tamanhos, resultados['buscas_trie'], 'r-o', linewidth=2, markersize=8, label='IPTrie')
+   plt.plot(tamanhos, resultados['buscas_compacta'], 'g-o', linewidth=2, markersize=8, label='IPTrieCompacta')
+   plt.plot(tamanhos, resultados['buscas_linear'], 'b-o', linewidth=2, markersize=8, label='Busca Linear')
+   plt.xscale('log')
+   plt.yscale('log')
+   plt.title('Buscas por Segundo vs Quantidade de Prefixos', fontsize=14, pad=15)
+   plt.xlabel('Quantidade de Prefixos', fontsize=12)
+   plt.ylabel('Buscas por Segundo', fontsize=12)
+   plt.grid(True, linestyle='--', alpha=0.7)
+   plt.legend()
+   plt.tight_layout()
+   plt.savefig(f"{nome_base}.png", dpi=300, bbox_inches='tight')
+   plt.close()
+
+
+if __name__ == "__main__":
+   print("Iniciando testes de performance...")
+   realizar_todos_testes()
+   print("\nComparando IPTrie, IPTrieCompacta e busca linear...")
+   resultados_engines = comparar_engines()
+   salvar_comparacao_engines(resultados_engines)
+   print("\nResultados salvos em tp3_4-2_engines.txt e tp3_4-2_engines.png")
+   print("\nCompilando a IPTrie para arquivo mapeado em memória...")
+   prefixos_tabela = [gerar_prefixo_aleatorio() for _ in range(100000)]
+   ips_tabela = [gerar_ip_aleatorio() for _ in range(1000)]
+   medir_partida_a_frio(lambda: construir_trie(prefixos_tabela), "tp3_4-2_tabela.bin", ips_tabela)
+   print("\nAplicando atualizações de rotas com leitores concorrentes...")
+   testar_atualizacoes_concorrentes()
@@ -6,6 +6,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from random import randint
 import os
+import tracemalloc
+from tabela_mmap import medir_partida_a_frio
 
 
 
@@ -65,6 +67,83 @@ class IPv6Trie:
 
 
 
+class MultibitNode:
+   def __init__(self):
+       self.children = {}
+       self.prefixes = {}
+
+
+
+
+class IPv6MultibitTrie:
+   # A /n prefix expands into up to 2^(stride - 1) slots; beyond 16 bits a single
+   # prefix can need billions of slots
+   MAX_STRIDE = 16
+
+
+   def __init__(self, stride=8):
+       if stride < 1 or 128 % stride != 0:
+           raise ValueError(f"Stride {stride} must divide 128")
+       if stride > self.MAX_STRIDE:
+           raise ValueError(f"Stride {stride} is above the limit of {self.MAX_STRIDE} bits")
+       self.stride = stride
+       self.levels = 128 // stride
+       self.mask = (1 << stride) - 1
+       self.root = MultibitNode()
+       self.default_prefix = None
+
+
+   def insert(self, prefix):
+       try:
+           net = ipaddress.IPv6Network(prefix, strict=False)
+       except ValueError:
+           return None
+       ip_int = int(net.network_address)
+       prefix_len = net.prefixlen
+       if prefix_len == 0:
+           self.default_prefix = prefix
+           return
+       node = self.root
+       last_level = (prefix_len - 1) // self.stride
+       for level in range(last_level):
+           chunk = (ip_int >> (128 - self.stride * (level + 1))) & self.mask
+           if chunk not in node.children:
+               node.children[chunk] = MultibitNode()
+           node = node.children[chunk]
+
+
+       # Controlled prefix expansion: the prefix fills every slot of the last level it covers
+       chunk = (ip_int >> (128 - self.stride * (last_level + 1))) & self.mask
+       free_bits = self.stride * (last_level + 1) - prefix_len
+       first = chunk & ~((1 << free_bits) - 1)
+       for slot in range(first, first + (1 << free_bits)):
+           current = node.prefixes.get(slot)
+           if current is None or current[1] <= prefix_len:
+               node.prefixes[slot] = (prefix, prefix_len)
+
+
+   def longest_prefix_match(self, ip):
+       try:
+           ip_int = int(ipaddress.IPv6Address(ip))
+       except ValueError:
+           return None
+       node = self.root
+       best_match = self.default_prefix
+       stride = self.stride
+       mask = self.mask
+       shift = 128
+       while node is not None:
+           shift -= stride
+           chunk = (ip_int >> shift) & mask
+           entry = node.prefixes.get(chunk)
+           if entry is not None:
+               best_match = entry[0]
+           node = node.children.get(chunk)
+       return best_match
+
+
+
+
 def generate_random_ipv6():
    segments = []
    for _ in range(8):
@@ -83,6 +162,15 @@ def generate_random_prefix():
 
 
 
+def build_trie(prefixes):
+   trie = IPv6Trie()
+   for prefix in prefixes:
+       trie.insert(prefix)
+   return trie
+
+
+
+
 def run_performance_test(num_prefixes, num_searches):
    prefixes = [generate_random_prefix() for _ in range(num_prefixes)]
    trie = IPv6Trie()
@@ -108,6 +196,88 @@ def run_performance_test(num_prefixes, num_searches):
 
 
 
+def measure_trie(factory, prefixes, ips):
+   tracemalloc.start()
+   start = time.time()
+   trie = factory()
+   for prefix in prefixes:
+       trie.insert(prefix)
+   end = time.time()
+   memory, _ = tracemalloc.get_traced_memory()
+   tracemalloc.stop()
+   insertion_time = end - start
+
+
+   start = time.time()
+   for ip in ips:
+       trie.longest_prefix_match(ip)
+   end = time.time()
+   search_time = end - start
+
+
+   return memory, insertion_time, search_time
+
+
+
+
+def run_stride_tests(num_prefixes=1000, num_searches=1000, strides=(1, 2, 4, 8)):
+   prefixes = [generate_random_prefix() for _ in range(num_prefixes)]
+   ips = [generate_random_ipv6() for _ in range(num_searches)]
+   stride_results = {}
+
+
+   print(f"Testing memory vs stride with {num_prefixes} prefixes...")
+   stride_results['IPv6Trie'] = measure_trie(IPv6Trie, prefixes, ips)
+   for stride in strides:
+       stride_results[f"stride {stride}"] = measure_trie(lambda: IPv6MultibitTrie(stride), prefixes, ips)
+
+
+   for name, (memory, ins_time, search_time) in stride_results.items():
+       print(f"{name}: memory {memory / 2**20:.2f} MB | insertion {ins_time:.2f}s | search {search_time:.4f}s")
+   return stride_results
+
+
+
+
+def save_stride_results(stride_results, num_prefixes, base_name):
+   with open(f"{base_name}_strides.txt", "w") as f:
+       f.write("IPv6 Multibit Trie: Memory vs Stride\n")
+       f.write("=" * 60 + "\n\n")
+       f.write(f"Prefix count: {num_prefixes}\n\n")
+       f.write(f"{'Variant':12} | {'Memory (MB)':>12} | {'Insertion (s)':>13} | {'Search (s)':>10}\n")
+       f.write("-" * 60 + "\n")
+       for name, (memory, ins_time, search_time) in stride_results.items():
+           f.write(f"{name:12} | {memory / 2**20:12.2f} | {ins_time:13.4f} | {search_time:10.4f}\n")
+
+
+   names = list(stride_results.keys())
+   plt.figure(figsize=(12, 6))
+
+
+   plt.subplot(1, 2, 1)
+   plt.bar(names, [result[0] / 2**20 for result in stride_results.values()], color='purple', alpha=0.7)
+   plt.title('Memória vs Stride')
+   plt.xlabel('Variante da Trie')
+   plt.ylabel('Memória (MB)')
+   plt.yscale('log')
+   plt.grid(True, axis='y')
+
+
+   plt.subplot(1, 2, 2)
+   plt.bar(names, [result[2] for result in stride_results.values()], color='green', alpha=0.7)
+   plt.title('Tempo de Busca vs Stride')
+   plt.xlabel('Variante da Trie')
+   plt.ylabel('Tempo de Busca (segundos)')
+   plt.grid(True, axis='y')
+
+
+   plt.tight_layout()
+   plt.savefig(f"{base_name}_strides.png", dpi=300, bbox_inches='tight')
+   plt.close()
+
+
+
+
 def run_all_tests(base_name="tp3_4.3"):
    prefix_counts = [100, 500, 1000, 5000, 10000]
    search_count = 1000
@@ -125,6 +295,11 @@ def run_all_tests(base_name="tp3_4.3"):
 
 
    save_results(insertion_results, search_results, base_name)
+
+
+   stride_prefix_count = 1000
+   stride_results = run_stride_tests(stride_prefix_count, search_count)
+   save_stride_results(stride_results, stride_prefix_count, base_name)
    return insertion_results, search_results
 
 
@@ -187,3 +362,9 @@ if __name__ == "__main__":
 
    print("\nStarting performance tests...")
    run_all_tests()
+
+
+   print("\nCompiling the IPv6 trie into a memory-mapped table...")
+   table_prefixes = [generate_random_prefix() for _ in range(10000)]
+   table_ips = [generate_random_ipv6() for _ in range(1000)]
+   medir_partida_a_frio(lambda: build_trie(table_prefixes), "tp3_4.3_table.bin", table_ips, bits=128)
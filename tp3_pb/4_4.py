@@ -4,6 +4,8 @@ import random
 import matplotlib.pyplot as plt
 import numpy as np
 import os
+from tabela_mmap import medir_partida_a_frio
+from tabela_intervalos import TabelaIntervalos
 
 
 class TrieNode:
@@ -15,10 +17,13 @@ class TrieNode:
 class IPTrie:
     def __init__(self):
         self.root = TrieNode()
+        self.lista_prefixos = []
+        self.tabela_intervalos = None
 
     def insert(self, prefix):
         net = ipaddress.IPv4Network(prefix, strict=False)
         node = self.root
+        self.tabela_intervalos = None
 
         ip_int = int(net.network_address)
         prefix_len = net.prefixlen
@@ -55,6 +60,15 @@ class IPTrie:
 
         return best_match
 
+    def construir_intervalos(self):
+        self.tabela_intervalos = TabelaIntervalos(self.root)
+        self.lista_prefixos = self.tabela_intervalos.prefixos
+
+    def longest_prefix_match_many(self, ips):
+        if self.tabela_intervalos is None:
+            self.construir_intervalos()
+        return self.tabela_intervalos.longest_prefix_match_many(ips)
+
 
 def busca_linear(prefixos, ip):
     ip_addr = ipaddress.IPv4Address(ip)
@@ -84,6 +98,13 @@ def gerar_lista_prefixos(quantidade):
     return [gerar_prefixo_aleatorio() for _ in range(quantidade)]
 
 
+def construir_trie(prefixos):
+    trie = IPTrie()
+    for prefixo in prefixos:
+        trie.insert(prefixo)
+    return trie
+
+
 def comparar_metodos(tamanhos_lista):
     resultados = {
         'tamanhos': tamanhos_lista,
@@ -199,6 +220,64 @@ def gerar_graficos(resultados, nome_base="tp3_4-3"):
     plt.close()
 
 
+def comparar_busca_em_lote(qtd_prefixos=100000, tamanhos_lote=(10000, 100000, 1000000, 10000000), qtd_buscas_individuais=20000):
+    prefixos = gerar_lista_prefixos(qtd_prefixos)
+    trie = IPTrie()
+    for prefixo in prefixos:
+        trie.insert(prefixo)
+
+    inicio = time.time()
+    trie.construir_intervalos()
+    tempo_intervalos = time.time() - inicio
+    print(f"Tabela de intervalos: {len(trie.tabela_intervalos)} intervalos construídos em {tempo_intervalos:.2f}s")
+
+    ips_texto = [gerar_ip_aleatorio() for _ in range(qtd_buscas_individuais)]
+    inicio = time.time()
+    for ip in ips_texto:
+        trie.longest_prefix_match(ip)
+    taxa_individual = qtd_buscas_individuais / (time.time() - inicio)
+
+    resultados = {'tamanhos': list(tamanhos_lote), 'taxa_individual': taxa_individual, 'taxa_lote': []}
+    for tamanho in tamanhos_lote:
+        ips = np.random.randint(0, 2 ** 32, size=tamanho, dtype=np.uint64).astype(np.uint32)
+        inicio = time.time()
+        trie.longest_prefix_match_many(ips)
+        fim = time.time()
+        taxa_lote = tamanho / (fim - inicio) if fim > inicio else float('inf')
+        resultados['taxa_lote'].append(taxa_lote)
+        print(f"  Lote de {tamanho} IPs: {taxa_lote:,.0f} buscas/s (individual: {taxa_individual:,.0f} buscas/s)")
+
+    return resultados
+
+
+def gerar_grafico_lote(resultados, nome_base="tp3_4-3_lote"):
+    tamanhos = resultados['tamanhos']
+
+    with open(f"{nome_base}.txt", "w") as f:
+        f.write("Longest Prefix Match em Lote (NumPy) vs Busca Individual\n")
+        f.write("=" * 50 + "\n\n")
+        f.write(f"Busca individual (string por string): {resultados['taxa_individual']:,.0f} buscas/s\n\n")
+        f.write(f"{'Tamanho do Lote':15} | {'Buscas/s':>15} | {'Speedup':>8}\n")
+        for tamanho, taxa in zip(tamanhos, resultados['taxa_lote']):
+            f.write(f"{tamanho:15d} | {taxa:15,.0f} | {taxa / resultados['taxa_individual']:7.1f}x\n")
+
+    plt.figure(figsize=(12, 6))
+    plt.plot(tamanhos, resultados['taxa_lote'], 'g-o', linewidth=2, markersize=8, label='longest_prefix_match_many')
+    plt.axhline(resultados['taxa_individual'], color='b', linestyle='--', linewidth=2, label='longest_prefix_match')
+
+    plt.title('Buscas por Segundo: Lote NumPy vs Busca Individual', fontsize=14, pad=15)
+    plt.xlabel('Tamanho do Lote de IPs', fontsize=12)
+    plt.ylabel('Buscas por Segundo', fontsize=12)
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.grid(True, linestyle='--', alpha=0.7)
+    plt.legend(fontsize=12)
+
+    plt.tight_layout()
+    plt.savefig(f"{nome_base}.png", dpi=300, bbox_inches='tight')
+    plt.close()
+
+
 if __name__ == "__main__":
     tamanhos_teste = [100, 500, 1000, 2500, 5000]
 
@@ -210,5 +289,12 @@ if __name__ == "__main__":
 
     print("\nAnálise concluída! Arquivos salvos: tp3_4-3.txt e imagens PNG.")
 
+    print("\nComparando busca individual com busca em lote...")
+    resultados_lote = comparar_busca_em_lote()
+    gerar_grafico_lote(resultados_lote)
+    print("Arquivos salvos: tp3_4-3_lote.txt e tp3_4-3_lote.png")
 
-
+    print("\nCompilando a IPTrie para arquivo mapeado em memória...")
+    prefixos_tabela = gerar_lista_prefixos(100000)
+    ips_tabela = [gerar_ip_aleatorio() for _ in range(1000)]
+    medir_partida_a_frio(lambda: construir_trie(prefixos_tabela), "tp3_4-3_tabela.bin", ips_tabela)
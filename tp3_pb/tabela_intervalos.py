@@ -0,0 +1,52 @@
+import numpy as np
+
+
+BITS_INDICE = 20
+
+
+def coletar_intervalos(node, inicio, profundidade, melhor_id, inicios, ids, prefixos):
+    if node.prefix is not None:
+        melhor_id = len(prefixos)
+        prefixos.append(node.prefix)
+    if profundidade == 32:
+        if not ids or ids[-1] != melhor_id:
+            inicios.append(inicio)
+            ids.append(melhor_id)
+        return
+    for bit in (0, 1):
+        inicio_filho = inicio | (bit << (31 - profundidade))
+        if bit in node.children:
+            coletar_intervalos(node.children[bit], inicio_filho, profundidade + 1, melhor_id, inicios, ids, prefixos)
+        elif not ids or ids[-1] != melhor_id:
+            inicios.append(inicio_filho)
+            ids.append(melhor_id)
+
+
+class TabelaIntervalos:
+    # Cada prefixo vira um intervalo [rede, broadcast]; a tabela guarda apenas os pontos onde o match muda
+    def __init__(self, raiz, bits_indice=BITS_INDICE):
+        self.raiz = raiz
+        self.bits_indice = bits_indice
+        self.prefixos = []
+        inicios = []
+        ids = []
+        coletar_intervalos(raiz, 0, 0, -1, inicios, ids, self.prefixos)
+        self.inicios = np.array(inicios, dtype=np.uint32)
+        self.ids = np.array(ids, dtype=np.int32)
+        self.proximos_inicios = np.append(self.inicios[1:], np.uint32(0xFFFFFFFF))
+
+        # Índice direto pelos bits mais significativos: intervalo vigente no início de cada bloco
+        blocos = (np.arange(1 << bits_indice, dtype=np.uint64) << (32 - bits_indice)).astype(np.uint32)
+        self.indice_blocos = (np.searchsorted(self.inicios, blocos, side='right') - 1).astype(np.int32)
+
+    def __len__(self):
+        return len(self.inicios)
+
+    def longest_prefix_match_many(self, ips):
+        ips = np.asarray(ips, dtype=np.uint32)
+        posicoes = self.indice_blocos[ips >> (32 - self.bits_indice)]
+
+        # Só os IPs cujo bloco contém outro início de intervalo precisam da busca binária
+        adiante = np.flatnonzero(self.proximos_inicios[posicoes] <= ips)
+        posicoes[adiante] = np.searchsorted(self.inicios, ips[adiante], side='right') - 1
+        return self.ids[posicoes]
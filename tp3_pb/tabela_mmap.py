@@ -0,0 +1,131 @@
+import ipaddress
+import mmap
+import struct
+import time
+from array import array
+from collections import deque
+
+
+MAGICO = b'LPMT'
+VERSAO = 1
+CABECALHO = struct.Struct('=4sHHIII')
+
+
+def compilar_tabela(trie, caminho, bits=32):
+    # Numeração em largura: cada nó vira uma posição nos vetores filho0/filho1/prefixo
+    filho0 = array('i')
+    filho1 = array('i')
+    prefixo = array('i')
+    textos = []
+    fila = deque([trie.root])
+    filho0.append(-1)
+    filho1.append(-1)
+    prefixo.append(-1)
+    indice = 0
+    while fila:
+        node = fila.popleft()
+        if node.prefix is not None:
+            prefixo[indice] = len(textos)
+            textos.append(node.prefix.encode('utf-8'))
+        for bit, vetor in ((0, filho0), (1, filho1)):
+            filho = node.children.get(bit)
+            if filho is not None:
+                vetor[indice] = len(prefixo)
+                filho0.append(-1)
+                filho1.append(-1)
+                prefixo.append(-1)
+                fila.append(filho)
+        indice += 1
+
+    deslocamentos = array('I', [0])
+    for texto in textos:
+        deslocamentos.append(deslocamentos[-1] + len(texto))
+    blob = b''.join(textos)
+
+    with open(caminho, 'wb') as f:
+        f.write(CABECALHO.pack(MAGICO, VERSAO, bits, len(prefixo), len(textos), len(blob)))
+        f.write(filho0.tobytes())
+        f.write(filho1.tobytes())
+        f.write(prefixo.tobytes())
+        f.write(deslocamentos.tobytes())
+        f.write(blob)
+    return len(prefixo), len(textos)
+
+
+class TabelaMapeada:
+    def __init__(self, caminho):
+        with open(caminho, 'rb') as f:
+            self.mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magico, versao, self.bits, num_nos, num_prefixos, tamanho_textos = CABECALHO.unpack_from(self.mapa, 0)
+        if magico != MAGICO or versao != VERSAO:
+            self.mapa.close()
+            raise ValueError(f"Arquivo {caminho} não é uma tabela de prefixos compilada")
+
+        # Os vetores são apenas visões sobre as páginas mapeadas, sem cópia nem desserialização
+        visao = memoryview(self.mapa)
+        inicio = CABECALHO.size
+        tamanho_vetor = 4 * num_nos
+        self.filho0 = visao[inicio:inicio + tamanho_vetor].cast('i')
+        inicio += tamanho_vetor
+        self.filho1 = visao[inicio:inicio + tamanho_vetor].cast('i')
+        inicio += tamanho_vetor
+        self.prefixo = visao[inicio:inicio + tamanho_vetor].cast('i')
+        inicio += tamanho_vetor
+        self.deslocamentos = visao[inicio:inicio + 4 * (num_prefixos + 1)].cast('I')
+        inicio += 4 * (num_prefixos + 1)
+        self.textos = visao[inicio:inicio + tamanho_textos]
+        self.visao = visao
+
+    def longest_prefix_match(self, ip):
+        try:
+            ip_addr = ipaddress.ip_address(ip)
+        except ValueError:
+            return None
+        if ip_addr.max_prefixlen != self.bits:
+            return None
+
+        ip_int = int(ip_addr)
+        filho0 = self.filho0
+        filho1 = self.filho1
+        prefixo = self.prefixo
+        node = 0
+        melhor = prefixo[0]
+        for i in range(self.bits - 1, -1, -1):
+            node = filho1[node] if (ip_int >> i) & 1 else filho0[node]
+            if node < 0:
+                break
+            if prefixo[node] >= 0:
+                melhor = prefixo[node]
+
+        if melhor < 0:
+            return None
+        return bytes(self.textos[self.deslocamentos[melhor]:self.deslocamentos[melhor + 1]]).decode('utf-8')
+
+    def fechar(self):
+        for vetor in (self.filho0, self.filho1, self.prefixo, self.deslocamentos, self.textos, self.visao):
+            vetor.release()
+        self.mapa.close()
+
+
+def medir_partida_a_frio(construir_trie, caminho, ips, bits=32):
+    inicio = time.time()
+    trie = construir_trie()
+    tempo_construcao = time.time() - inicio
+
+    inicio = time.time()
+    num_nos, num_prefixos = compilar_tabela(trie, caminho, bits)
+    tempo_compilacao = time.time() - inicio
+
+    inicio = time.time()
+    tabela = TabelaMapeada(caminho)
+    tempo_abertura = time.time() - inicio
+
+    divergencias = sum(1 for ip in ips if tabela.longest_prefix_match(ip) != trie.longest_prefix_match(ip))
+    tabela.fechar()
+
+    print(f"Tabela compilada: {num_nos} nós, {num_prefixos} prefixos em {caminho}")
+    print(f"  Reconstrução via insert: {tempo_construcao:.4f}s")
+    print(f"  Compilação (uma vez): {tempo_compilacao:.4f}s")
+    print(f"  Abertura com mmap: {tempo_abertura * 1000:.3f}ms")
+    print(f"  Divergências em {len(ips)} buscas: {divergencias}")
+    return tempo_construcao, tempo_compilacao, tempo_abertura
@@ -4,6 +4,8 @@ import matplotlib.pyplot as plt
 import time
 import heapq
 import random
+import tracemalloc
+from heap_indexada import FilaPrioridadeIndexada, HeapPareamento
 
 
 def criar_heap(lista):
@@ -97,6 +99,141 @@ def plotar_comparativo_tempo(tamanhos_listas, tempos_heapq, tempos_manual, tempo
     plt.savefig('comparativo_heap.png')
 
 
+IMPLEMENTACOES_HEAP = {
+    'Binária': lambda: FilaPrioridadeIndexada(aridade=2),
+    '4-ária': lambda: FilaPrioridadeIndexada(aridade=4),
+    '8-ária': lambda: FilaPrioridadeIndexada(aridade=8),
+    'Pareamento': HeapPareamento,
+}
+
+CENARIOS_HEAP = {
+    'Agendador (90% push, 5% pop, 5% decrease)': (0.90, 0.05, 0.05),
+    'Equilibrado (50% push, 40% pop, 10% decrease)': (0.50, 0.40, 0.10),
+    'Caminhos (30% push, 30% pop, 40% decrease)': (0.30, 0.30, 0.40),
+}
+
+INSERIR, REMOVER_TOPO, DIMINUIR_CHAVE = 0, 1, 2
+
+
+def gerar_traco(num_operacoes, proporcao_insercao, proporcao_remocao, proporcao_diminuicao):
+    # Simula o traço numa heap de referência para só remover/diminuir itens presentes
+    total = proporcao_insercao + proporcao_remocao + proporcao_diminuicao
+    limite_insercao = proporcao_insercao / total
+    limite_remocao = limite_insercao + proporcao_remocao / total
+
+    referencia = FilaPrioridadeIndexada()
+    presentes = []
+    posicao_presente = {}
+    traco = []
+    proximo_item = 0
+
+    for _ in range(num_operacoes):
+        sorteio = random.random()
+        if sorteio < limite_insercao or not presentes:
+            prioridade = random.random()
+            referencia.inserir(proximo_item, prioridade)
+            posicao_presente[proximo_item] = len(presentes)
+            presentes.append(proximo_item)
+            traco.append((INSERIR, proximo_item, prioridade))
+            proximo_item += 1
+        elif sorteio < limite_remocao:
+            item, _ = referencia.remover_topo()
+            posicao = posicao_presente.pop(item)
+            ultimo = presentes.pop()
+            if ultimo != item:
+                presentes[posicao] = ultimo
+                posicao_presente[ultimo] = posicao
+            traco.append((REMOVER_TOPO,))
+        else:
+            item = random.choice(presentes)
+            prioridade = referencia.prioridade(item) * random.random()
+            referencia.diminuir_chave(item, prioridade)
+            traco.append((DIMINUIR_CHAVE, item, prioridade))
+
+    return traco
+
+
+def executar_traco(fila, traco):
+    inserir = fila.inserir
+    remover_topo = fila.remover_topo
+    diminuir_chave = fila.diminuir_chave
+    soma_removidos = 0.0
+
+    for operacao in traco:
+        tipo = operacao[0]
+        if tipo == INSERIR:
+            inserir(operacao[1], operacao[2])
+        elif tipo == REMOVER_TOPO:
+            soma_removidos += remover_topo()[1]
+        else:
+            diminuir_chave(operacao[1], operacao[2])
+
+    return soma_removidos
+
+
+def comparar_implementacoes_heap(implementacoes=None, cenarios=None, num_operacoes=200000):
+    implementacoes = implementacoes or IMPLEMENTACOES_HEAP
+    cenarios = cenarios or CENARIOS_HEAP
+    resultados = {}
+
+    for nome_cenario, proporcoes in cenarios.items():
+        traco = gerar_traco(num_operacoes, *proporcoes)
+        resultados[nome_cenario] = {}
+        soma_esperada = None
+
+        for nome, fabrica in implementacoes.items():
+            inicio = time.perf_counter()
+            soma = executar_traco(fabrica(), traco)
+            tempo = time.perf_counter() - inicio
+
+            if soma_esperada is None:
+                soma_esperada = soma
+            elif soma != soma_esperada:
+                raise RuntimeError(f"{nome} removeu elementos diferentes no cenário {nome_cenario}")
+
+            # Pico de memória medido numa segunda execução, já que o tracemalloc distorce o tempo
+            tracemalloc.start()
+            fila = fabrica()
+            executar_traco(fila, traco)
+            _, pico = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del fila
+
+            resultados[nome_cenario][nome] = (len(traco) / tempo, pico)
+
+    return resultados
+
+
+def plotar_implementacoes_heap(resultados):
+    cenarios = list(resultados)
+    nomes = list(resultados[cenarios[0]])
+    largura = 0.8 / len(nomes)
+    posicoes = np.arange(len(cenarios))
+
+    plt.figure(figsize=(14, 10))
+
+    plt.subplot(2, 1, 1)
+    for i, nome in enumerate(nomes):
+        plt.bar(posicoes + i * largura, [resultados[c][nome][0] for c in cenarios], largura, label=nome)
+    plt.xticks(posicoes + largura * (len(nomes) - 1) / 2, cenarios)
+    plt.title('Vazão por Implementação de Heap')
+    plt.ylabel('Operações por Segundo')
+    plt.legend()
+    plt.grid(True, axis='y')
+
+    plt.subplot(2, 1, 2)
+    for i, nome in enumerate(nomes):
+        plt.bar(posicoes + i * largura, [resultados[c][nome][1] / 2 ** 20 for c in cenarios], largura, label=nome)
+    plt.xticks(posicoes + largura * (len(nomes) - 1) / 2, cenarios)
+    plt.title('Pico de Memória por Implementação de Heap')
+    plt.ylabel('Memória (MB)')
+    plt.legend()
+    plt.grid(True, axis='y')
+
+    plt.tight_layout()
+    plt.savefig('comparativo_implementacoes_heap.png')
+
+
 def imprimir_heap_formatada(heap, tamanho=10):
     if not heap:
         print("Heap vazia")
@@ -148,11 +285,21 @@ def principal():
     heap_grande = criar_heap(lista_grande)
     imprimir_heap_formatada(heap_grande)
 
+    print("\nComparando heaps binária, 4-ária, 8-ária e de pareamento em traços mistos...")
+    resultados_implementacoes = comparar_implementacoes_heap()
+    plotar_implementacoes_heap(resultados_implementacoes)
+    for cenario, por_implementacao in resultados_implementacoes.items():
+        print(f"\n{cenario}")
+        print(f"{'Implementação':<15} {'Ops/s':<15} {'Pico (MB)':<12}")
+        for nome, (ops_por_segundo, pico) in por_implementacao.items():
+            print(f"{nome:<15} {ops_por_segundo:<15.0f} {pico / 2 ** 20:<12.2f}")
+
     return {
         'tamanhos': tamanhos_listas,
         'tempos_heapq': tempos_heapq,
         'tempos_manual': tempos_manual,
-        'tempos_exibir': tempos_exibir
+        'tempos_exibir': tempos_exibir,
+        'implementacoes': resultados_implementacoes
     }
 
 
@@ -3,6 +3,7 @@ import matplotlib.pyplot as plt
 import time
 import random
 import heapq
+from heap_indexada import FilaPrioridadeIndexada
 
 
 def criar_heap(lista):
@@ -114,6 +115,62 @@ def medir_tempo_insercao(tamanhos_heap, num_elementos, repeticoes=5):
     return tempos_heapq, tempos_manual
 
 
+def comparar_fila_indexada(tamanho=1000000, num_elementos=1000):
+    prioridades = [random.randint(1, 1000) for _ in range(tamanho)]
+    novas = [random.randint(1, 1000) for _ in range(num_elementos)]
+    heap_base = criar_heap(prioridades)
+    tempos = {}
+
+    inicio = time.time()
+    heap_temp = heap_base
+    for elem in novas:
+        heap_temp = inserir_elemento_heapq(heap_temp, elem)
+    tempos['heapq com cópia'] = (time.time() - inicio) / num_elementos
+
+    inicio = time.time()
+    heap_temp = heap_base
+    for elem in novas:
+        heap_temp = inserir_elemento_manual(heap_temp, elem)
+    tempos['manual com cópia'] = (time.time() - inicio) / num_elementos
+
+    inicio = time.time()
+    fila = FilaPrioridadeIndexada(enumerate(prioridades))
+    tempo_construcao = time.time() - inicio
+
+    inicio = time.time()
+    for i, elem in enumerate(novas):
+        fila.inserir(tamanho + i, elem)
+    tempos['fila indexada'] = (time.time() - inicio) / num_elementos
+
+    itens_alterados = random.sample(range(tamanho), num_elementos)
+    inicio = time.time()
+    for item in itens_alterados:
+        fila.diminuir_chave(item, fila.prioridade(item) - 1)
+    tempos['diminuir_chave'] = (time.time() - inicio) / num_elementos
+
+    inicio = time.time()
+    for item in itens_alterados:
+        fila.remover(item)
+    tempos['remover(item)'] = (time.time() - inicio) / num_elementos
+
+    inicio = time.time()
+    fila = FilaPrioridadeIndexada()
+    for item, prioridade in enumerate(prioridades):
+        fila.inserir(item, prioridade)
+    tempo_insercoes = time.time() - inicio
+
+    plt.figure(figsize=(10, 6))
+    nomes = list(tempos)
+    plt.bar(nomes, [tempos[nome] * 1000 for nome in nomes], color=['b', 'r', 'g', 'c', 'm'])
+    plt.title(f'Tempo por Operação em Heap de {tamanho} Elementos')
+    plt.ylabel('Tempo por Operação (ms)')
+    plt.yscale('log')
+    plt.grid(True, axis='y')
+    plt.savefig('comparativo_fila_indexada.png')
+
+    return tempos, tempo_construcao, tempo_insercoes
+
+
 def imprimir_heap_formatada(heap):
     if not heap:
         print("Heap vazia")
@@ -240,13 +297,23 @@ def principal():
 
     plotar_comparativo(tamanhos_heap, tempos_heapq, tempos_manual)
 
+    print("\nComparando inserção com cópia e fila de prioridade indexada em 1.000.000 elementos...")
+    tempos_fila, tempo_construcao, tempo_insercoes = comparar_fila_indexada()
+    print(f"{'Operação':<20} {'Tempo por operação (ms)':<25}")
+    print("-" * 45)
+    for nome, tempo in tempos_fila.items():
+        print(f"{nome:<20} {tempo * 1000:<25.6f}")
+    print(f"Construção da fila indexada (heapify): {tempo_construcao:.6f} s")
+    print(f"Construção por 1.000.000 inserções na fila indexada: {tempo_insercoes:.6f} s")
+
     return {
         'heap_antes': heap_antes,
         'heap_depois': heap_depois,
         'elemento_inserido': elemento,
         'tamanhos_testados': tamanhos_heap,
         'tempos_heapq': tempos_heapq,
-        'tempos_manual': tempos_manual
+        'tempos_manual': tempos_manual,
+        'tempos_fila_indexada': tempos_fila
     }
 
 
@@ -2,6 +2,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import time
 import heapq
+from heap_indexada import HeapComIndice
 
 
 def criar_heap(lista):
@@ -19,33 +20,49 @@ def buscar_elemento_heap(heap, valor):
 
 
 def comparar_tamanhos_heap():
-    tamanhos = [100, 1000, 5000, 10000, 50000, 100000]
+    tamanhos = [100, 1000, 5000, 10000, 50000, 100000, 1000000, 10000000]
     tempos_busca = []
+    tempos_busca_indice = []
 
     for tamanho in tamanhos:
         lista = np.random.randint(1, tamanho * 10, tamanho)
         heap = criar_heap(lista)
+        heap_indexada = HeapComIndice(heap)
 
         tempos_por_tamanho = []
+        tempos_indice_por_tamanho = []
 
         for _ in range(10):  # Executa 10 vezes para obter uma média
             valor_busca = np.random.randint(1, tamanho * 10)
 
             inicio = time.time()
-            buscar_elemento_heap(heap, valor_busca)
+            encontrado = buscar_elemento_heap(heap, valor_busca)
             fim = time.time()
 
             tempos_por_tamanho.append(fim - inicio)
 
+            inicio = time.perf_counter()
+            encontrado_indice = valor_busca in heap_indexada
+            fim = time.perf_counter()
+
+            tempos_indice_por_tamanho.append(fim - inicio)
+            if encontrado != encontrado_indice:
+                raise RuntimeError("Índice da heap diverge da busca linear")
+
         tempos_busca.append(np.mean(tempos_por_tamanho))
+        tempos_busca_indice.append(np.mean(tempos_indice_por_tamanho))
+        del heap, heap_indexada
 
     plt.figure(figsize=(12, 7))
-    plt.plot(tamanhos, tempos_busca, 'o-', linewidth=2, markersize=8)
+    plt.plot(tamanhos, tempos_busca, 'o-', linewidth=2, markersize=8, label='Busca linear')
+    plt.plot(tamanhos, tempos_busca_indice, 's-', linewidth=2, markersize=8, label='Índice valor -> contagem')
     plt.xlabel('Tamanho da Heap', fontsize=12)
     plt.ylabel('Tempo Médio de Busca (segundos)', fontsize=12)
     plt.title('Tempo de Execução da Busca por Tamanho da Heap', fontsize=14)
     plt.grid(True)
     plt.xscale('log')
+    plt.yscale('log')
+    plt.legend()
 
     # Adicionando anotações com os valores
     for i, (tamanho, tempo) in enumerate(zip(tamanhos, tempos_busca)):
@@ -56,7 +73,28 @@ def comparar_tamanhos_heap():
 
     plt.savefig('tempo_busca_por_tamanho_heap.png', dpi=300, bbox_inches='tight')
 
-    return tempos_busca, tamanhos
+    return tempos_busca, tamanhos, tempos_busca_indice
+
+
+def medir_remocao_arbitraria(tamanho=1000000, remocoes=1000):
+    lista = np.random.randint(1, tamanho * 10, tamanho)
+    heap = criar_heap(lista)
+    valores = np.random.choice(heap, remocoes, replace=False).tolist()
+
+    # Sem índice: localizar, remover da lista e refazer a heap a cada remoção
+    inicio = time.time()
+    for valor in valores[:10]:
+        heap.remove(valor)
+        heapq.heapify(heap)
+    tempo_reheapify = (time.time() - inicio) / 10
+
+    heap_indexada = HeapComIndice(heap)
+    inicio = time.time()
+    for valor in valores[10:]:
+        heap_indexada.remover(valor)
+    tempo_preguicoso = (time.time() - inicio) / (remocoes - 10)
+
+    return tempo_reheapify, tempo_preguicoso
 
 
 def calcular_complexidade(tamanhos, tempos):
@@ -69,7 +107,7 @@ def calcular_complexidade(tamanhos, tempos):
 
 
 def main():
-    tempos_busca, tamanhos = comparar_tamanhos_heap()
+    tempos_busca, tamanhos, tempos_busca_indice = comparar_tamanhos_heap()
 
     # Calculando a complexidade aproximada
     expoente = calcular_complexidade(tamanhos, tempos_busca)
@@ -78,6 +116,13 @@ def main():
     print(f"Tamanhos testados: {tamanhos}")
     print(f"Tempos médios de busca (segundos): {[round(t, 6) for t in tempos_busca]}")
     print(f"Complexidade estimada: O(n^{expoente:.2f})")
+    print(f"Tempos médios com índice valor -> contagem (segundos): {[f'{t:.2e}' for t in tempos_busca_indice]}")
+    print(f"Complexidade estimada com índice: O(n^{calcular_complexidade(tamanhos, tempos_busca_indice):.2f})")
+
+    tempo_reheapify, tempo_preguicoso = medir_remocao_arbitraria()
+    print("\nRemoção de elementos arbitrários em heap de 1.000.000 elementos:")
+    print(f"  - remove + heapify: {tempo_reheapify:.6f} s por remoção")
+    print(f"  - remoção preguiçosa com índice: {tempo_preguicoso:.2e} s por remoção")
 
     if 0.8 <= expoente <= 1.2:
         print("Os resultados confirmam que a busca em heap tem complexidade aproximadamente linear O(n).")
@@ -91,6 +136,8 @@ def main():
     print("\nConclusão:")
     print(
         "A busca em heap não oferece vantagem algoritmica em relação à busca linear, pois ambas precisam verificar cada elemento no pior caso.")
+    print(
+        "Mantendo um índice valor -> contagem sincronizado com a heap, a busca passa a O(1) sem perder as operações de heap.")
     print(
         "Para buscas eficientes, estruturas como dicionários (complexidade média O(1)) ou árvores de busca balanceadas (complexidade O(log n)) seriam mais adequadas.")
 
@@ -2,6 +2,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import time
 import heapq
+from heap_indexada import FilaPrioridadeIndexada
 
 def criar_min_heap(lista):
     if isinstance(lista, np.ndarray):
@@ -117,6 +118,79 @@ def comparar_operacoes_heap():
     }
 
 
+def comparar_max_heap_indexada(tamanhos=(1000, 10000, 100000, 1000000), operacoes=1000):
+    tempos_negacao = []
+    tempos_indexada = []
+    tempos_busca_linear = []
+    tempos_busca_indexada = []
+
+    for tamanho in tamanhos:
+        valores = np.random.permutation(tamanho * 2)[:tamanho].tolist()
+        novos = list(range(tamanho * 2, tamanho * 2 + operacoes))
+        buscados = np.random.randint(0, tamanho * 2, operacoes).tolist()
+
+        max_heap = criar_max_heap(valores)
+        fila = FilaPrioridadeIndexada(((v, v) for v in valores), maxima=True)
+
+        inicio = time.time()
+        for valor in novos:
+            inserir_max_heap(max_heap, valor)
+        for _ in range(operacoes):
+            remover_max_heap(max_heap)
+        tempos_negacao.append(time.time() - inicio)
+
+        inicio = time.time()
+        for valor in novos:
+            fila.inserir(valor)
+        for _ in range(operacoes):
+            fila.remover_topo()
+        tempos_indexada.append(time.time() - inicio)
+
+        inicio = time.time()
+        for valor in buscados:
+            buscar_elemento_heap(max_heap, valor, eh_max_heap=True)
+        tempos_busca_linear.append(time.time() - inicio)
+
+        inicio = time.time()
+        for valor in buscados:
+            valor in fila
+        tempos_busca_indexada.append(time.time() - inicio)
+
+    plt.figure(figsize=(12, 8))
+
+    plt.subplot(2, 1, 1)
+    plt.plot(tamanhos, tempos_negacao, 'o-', label='heapq com valores negados')
+    plt.plot(tamanhos, tempos_indexada, 's-', label='FilaPrioridadeIndexada(maxima=True)')
+    plt.xscale('log')
+    plt.xlabel('Tamanho da Heap')
+    plt.ylabel('Tempo (segundos)')
+    plt.title(f'Max-Heap: {operacoes} Inserções + {operacoes} Remoções do Topo')
+    plt.legend()
+    plt.grid(True)
+
+    plt.subplot(2, 1, 2)
+    plt.plot(tamanhos, tempos_busca_linear, 'o-', label='Busca linear')
+    plt.plot(tamanhos, tempos_busca_indexada, 's-', label='Mapa de posições')
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.xlabel('Tamanho da Heap')
+    plt.ylabel('Tempo (segundos)')
+    plt.title(f'{operacoes} Buscas na Max-Heap')
+    plt.legend()
+    plt.grid(True)
+
+    plt.tight_layout()
+    plt.savefig('comparacao_max_heap_indexada.png')
+
+    return {
+        'tamanhos': list(tamanhos),
+        'negacao': tempos_negacao,
+        'indexada': tempos_indexada,
+        'busca_linear': tempos_busca_linear,
+        'busca_indexada': tempos_busca_indexada
+    }
+
+
 def demonstrar_operacoes():
     lista = [5, 2, 3, 7, 1]
     print("Lista original:", lista)
@@ -147,6 +221,17 @@ def demonstrar_operacoes():
     print("Elemento removido da max-heap:", maior)
     print("Max-Heap após remoção (valores reais):", [-x for x in max_heap])
 
+    fila_max = FilaPrioridadeIndexada(((x, x) for x in lista_original), maxima=True)
+    print("\nMax-Heap indexada (sem negação):", fila_max.itens)
+    fila_max.inserir(8)
+    print("Max-Heap indexada após inserção do valor 8:", fila_max.itens)
+    print("O elemento 7 existe na max-heap indexada?", 7 in fila_max)
+    fila_max.remover(7)
+    print("Max-Heap indexada após remover o 7:", fila_max.itens)
+    maior, _ = fila_max.remover_topo()
+    print("Elemento removido do topo:", maior)
+    print("Max-Heap indexada após remoção:", fila_max.itens)
+
 
 def main():
     resultados = comparar_operacoes_heap()
@@ -158,6 +243,14 @@ def main():
     print("Tempos médios de remoção em min-heap (s):", [round(t, 8) for t in resultados['min_remocao']])
     print("Tempos médios de remoção em max-heap (s):", [round(t, 8) for t in resultados['max_remocao']])
 
+    resultados_indexada = comparar_max_heap_indexada()
+    print("\nMax-Heap com negação vs fila indexada (1000 inserções + 1000 remoções):")
+    for i, tamanho in enumerate(resultados_indexada['tamanhos']):
+        print(f"  {tamanho}: negação {resultados_indexada['negacao'][i]:.6f}s, "
+              f"indexada {resultados_indexada['indexada'][i]:.6f}s, "
+              f"busca linear {resultados_indexada['busca_linear'][i]:.6f}s, "
+              f"busca indexada {resultados_indexada['busca_indexada'][i]:.6f}s")
+
     print("\nDemonstração das operações de heap com exemplo específico:")
     demonstrar_operacoes()
 
@@ -3,6 +3,10 @@ import matplotlib.pyplot as plt
 import time
 import string
 import random
+import os
+import tempfile
+import gc
+from carga_ordenada import carregar_ordenadas, ler_palavras_ordenadas
 
 
 class NoTrie:
@@ -28,6 +32,12 @@ class Trie:
             no_atual.fim_palavra = True
             self.contador_palavras += 1
 
+    @classmethod
+    def from_sorted(cls, palavras):
+        trie = cls()
+        trie.contador_palavras = carregar_ordenadas(trie.raiz, palavras, NoTrie)
+        return trie
+
     def buscar(self, palavra):
         no_atual = self.raiz
 
@@ -109,6 +119,65 @@ def comparar_desempenho_tamanho():
     return tamanhos, tempos_insercao, tempos_busca
 
 
+def medir_tempo_insercao_sem_coletor(trie, palavras):
+    gc.disable()
+    try:
+        return medir_tempo_insercao(trie, palavras)
+    finally:
+        gc.enable()
+
+
+def comparar_carga_ordenada():
+    tamanhos = [1000, 10000, 100000, 500000, 1000000]
+    tempos_insercao = []
+    tempos_insercao_sem_coletor = []
+    tempos_carga = []
+    tempos_arquivo = []
+
+    for tamanho in tamanhos:
+        palavras = sorted(set(gerar_lista_palavras(tamanho)))
+
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as arquivo:
+            arquivo.write('\n'.join(palavras))
+            caminho = arquivo.name
+
+        # Cada trie é descartada antes da próxima medição, para o coletor não varrer a anterior
+        tempos_insercao.append(medir_tempo_insercao(Trie(), palavras))
+        gc.collect()
+
+        # from_sorted pausa o coletor durante a carga: inserir nas mesmas condições mostra
+        # que o ganho sobre inserir vem da pausa, não do reaproveitamento do prefixo
+        tempos_insercao_sem_coletor.append(medir_tempo_insercao_sem_coletor(Trie(), palavras))
+        gc.collect()
+
+        inicio = time.time()
+        Trie.from_sorted(palavras)
+        fim = time.time()
+        tempos_carga.append(fim - inicio)
+        gc.collect()
+
+        inicio = time.time()
+        Trie.from_sorted(ler_palavras_ordenadas(caminho))
+        fim = time.time()
+        tempos_arquivo.append(fim - inicio)
+        os.remove(caminho)
+        gc.collect()
+
+    plt.figure(figsize=(12, 6))
+    plt.plot(tamanhos, tempos_insercao, 'o-', label='inserir palavra a palavra')
+    plt.plot(tamanhos, tempos_insercao_sem_coletor, 'd--', label='inserir palavra a palavra (coletor pausado)')
+    plt.plot(tamanhos, tempos_carga, 's-', label='Trie.from_sorted (lista)')
+    plt.plot(tamanhos, tempos_arquivo, '^-', label='Trie.from_sorted (arquivo em streaming)')
+    plt.xlabel('Número de Palavras')
+    plt.ylabel('Tempo (segundos)')
+    plt.title('Construção da Trie: Inserções Repetidas vs Carga Ordenada (coletor pausado)')
+    plt.legend()
+    plt.grid(True)
+    plt.savefig('trie_carga_ordenada.png', dpi=300)
+
+    return tamanhos, tempos_insercao, tempos_insercao_sem_coletor, tempos_carga, tempos_arquivo
+
+
 def comparar_desempenho_comprimento():
     comprimentos = [4, 8, 12, 16, 20]
     tempos_insercao = []
@@ -223,7 +292,21 @@ def menu():
             print(
                 f"Comprimento: {comprimento}, Tempo de Inserção: {tempos_insercao_comp[i]:.6f}s, Tempo de Busca: {tempos_busca_comp[i]:.6f}s")
 
-        print("\nGráficos salvos como 'trie_desempenho_tamanho.png' e 'trie_desempenho_comprimento.png'")
+        print("\nComparando inserções repetidas com carga ordenada...")
+        tamanhos_carga, tempos_ins, tempos_ins_sem_coletor, tempos_carga, tempos_arquivo = comparar_carga_ordenada()
+
+        print("Resultados da carga ordenada:")
+        for i, tamanho in enumerate(tamanhos_carga):
+            print(
+                f"Tamanho: {tamanho}, inserir: {tempos_ins[i]:.6f}s, "
+                f"inserir com coletor pausado: {tempos_ins_sem_coletor[i]:.6f}s, "
+                f"from_sorted: {tempos_carga[i]:.6f}s ({tempos_ins[i] / tempos_carga[i]:.2f}x mais rápido "
+                f"pela pausa do coletor; {tempos_ins_sem_coletor[i] / tempos_carga[i]:.2f}x contra inserir "
+                f"também sem o coletor), "
+                f"from_sorted via arquivo: {tempos_arquivo[i]:.6f}s")
+
+        print("\nGráficos salvos como 'trie_desempenho_tamanho.png', 'trie_desempenho_comprimento.png' "
+              "e 'trie_carga_ordenada.png'")
 
     elif opcao == '3':
         print("Saindo...")
@@ -3,6 +3,11 @@ import matplotlib.pyplot as plt
 import time
 import string
 import random
+import sys
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 
 class NoTrie:
@@ -38,6 +43,33 @@ class Trie:
 
         return no_atual.fim_palavra
 
+    def buscar_aproximado(self, palavra, max_dist):
+        # Cada nó carrega a linha da matriz de Levenshtein entre seu prefixo e a palavra;
+        # se o menor valor da linha passa de max_dist, nenhum descendente pode servir
+        primeira_linha = list(range(len(palavra) + 1))
+        resultado = []
+        if self.raiz.fim_palavra and primeira_linha[-1] <= max_dist:
+            resultado.append(("", primeira_linha[-1]))
+
+        pilha = [(filho, caractere, primeira_linha) for caractere, filho in self.raiz.filhos.items()]
+        while pilha:
+            no, prefixo, linha_anterior = pilha.pop()
+            caractere = prefixo[-1]
+            linha = [linha_anterior[0] + 1]
+            for j in range(1, len(palavra) + 1):
+                custo = 0 if palavra[j - 1] == caractere else 1
+                linha.append(min(linha[j - 1] + 1, linha_anterior[j] + 1, linha_anterior[j - 1] + custo))
+
+            if no.fim_palavra and linha[-1] <= max_dist:
+                resultado.append((prefixo, linha[-1]))
+
+            if min(linha) <= max_dist:
+                for proximo, filho in no.filhos.items():
+                    pilha.append((filho, prefixo + proximo, linha))
+
+        resultado.sort(key=lambda item: (item[1], item[0]))
+        return resultado
+
     def imprimir_palavras(self):
         palavras = []
         self._coletar_palavras(self.raiz, "", palavras)
@@ -51,6 +83,258 @@ class Trie:
             self._coletar_palavras(no_filho, prefixo + caractere, palavras)
 
 
+class TrieDuploVetor:
+    MAX_FALHAS = 8
+
+    def __init__(self, trie):
+        alfabeto = set()
+        pilha = [trie.raiz]
+        while pilha:
+            no = pilha.pop()
+            alfabeto.update(no.filhos.keys())
+            pilha.extend(no.filhos.values())
+        self.alfabeto = sorted(alfabeto)
+        self.codigos = {caractere: i + 1 for i, caractere in enumerate(self.alfabeto)}
+
+        # base[s] + codigo(c) = t e check[t] = s; posições livres têm check = -1
+        self.base = array('i', [0, 0])
+        self.check = array('i', [-1, -1])
+        self.fim_palavra = bytearray(2)
+        self.fim_palavra[0] = trie.raiz.fim_palavra
+        self.contador_palavras = 0
+
+        # Lista duplamente encadeada das posições livres, usada só durante a construção
+        self._proxima_livre = array('i', [-1, -1])
+        self._anterior_livre = array('i', [-1, -1])
+        self._falhas = bytearray(2)
+        self._primeira_livre = -1
+        self._ultima_livre = -1
+
+        fila = deque([(trie.raiz, 0)])
+        while fila:
+            no, indice = fila.popleft()
+            if no.fim_palavra:
+                self.contador_palavras += 1
+            if not no.filhos:
+                continue
+
+            codigos_filhos = sorted(self.codigos[c] for c in no.filhos)
+            base = self._encontrar_base(codigos_filhos)
+            self.base[indice] = base
+
+            for caractere, filho in no.filhos.items():
+                destino = base + self.codigos[caractere]
+                self.check[destino] = indice
+                self.fim_palavra[destino] = filho.fim_palavra
+                self._ocupar(destino)
+                fila.append((filho, destino))
+
+        del self._proxima_livre, self._anterior_livre, self._falhas
+
+        tamanho = len(self.check)
+        while tamanho > 2 and self.check[tamanho - 1] == -1:
+            tamanho -= 1
+        del self.base[tamanho:], self.check[tamanho:], self.fim_palavra[tamanho:]
+
+    def _crescer(self, novo_tamanho):
+        antigo = len(self.check)
+        extra = novo_tamanho - antigo
+        self.base.extend(array('i', [0]) * extra)
+        self.check.extend(array('i', [-1]) * extra)
+        self.fim_palavra.extend(bytes(extra))
+        self._falhas.extend(bytes(extra))
+        self._proxima_livre.extend(array('i', range(antigo + 1, novo_tamanho + 1)))
+        self._anterior_livre.extend(array('i', range(antigo - 1, novo_tamanho - 1)))
+        self._proxima_livre[novo_tamanho - 1] = -1
+        self._anterior_livre[antigo] = self._ultima_livre
+        if self._ultima_livre == -1:
+            self._primeira_livre = antigo
+        else:
+            self._proxima_livre[self._ultima_livre] = antigo
+        self._ultima_livre = novo_tamanho - 1
+
+    def _ocupar(self, posicao):
+        anterior = self._anterior_livre[posicao]
+        proxima = self._proxima_livre[posicao]
+        if anterior == -1:
+            self._primeira_livre = proxima
+        else:
+            self._proxima_livre[anterior] = proxima
+        if proxima == -1:
+            self._ultima_livre = anterior
+        else:
+            self._anterior_livre[proxima] = anterior
+
+    def _encontrar_base(self, codigos_filhos):
+        posicao = self._primeira_livre
+        while True:
+            if posicao == -1:
+                posicao = len(self.check)
+                self._crescer(2 * posicao + codigos_filhos[-1])
+            base = posicao - codigos_filhos[0]
+            if base >= 1:
+                limite = base + codigos_filhos[-1] + 1
+                if limite > len(self.check):
+                    self._crescer(2 * limite)
+                if all(self.check[base + codigo] == -1 for codigo in codigos_filhos):
+                    return base
+            proxima = self._proxima_livre[posicao]
+            # Buracos que recusam muitos nós deixam de ser visitados, evitando varreduras repetidas
+            self._falhas[posicao] += 1
+            if self._falhas[posicao] >= self.MAX_FALHAS:
+                self._ocupar(posicao)
+            posicao = proxima
+
+    def _descer(self, palavra):
+        indice = 0
+        for caractere in palavra:
+            codigo = self.codigos.get(caractere)
+            if codigo is None:
+                return -1
+            destino = self.base[indice] + codigo
+            if destino >= len(self.check) or self.check[destino] != indice:
+                return -1
+            indice = destino
+        return indice
+
+    def buscar(self, palavra):
+        indice = self._descer(palavra)
+        return indice != -1 and bool(self.fim_palavra[indice])
+
+    def buscar_palavras_com_prefixo(self, prefixo):
+        indice = self._descer(prefixo)
+        if indice == -1:
+            return []
+
+        resultado = []
+        tamanho = len(self.check)
+        pilha = [(indice, prefixo)]
+        while pilha:
+            indice, palavra = pilha.pop()
+            if self.fim_palavra[indice]:
+                resultado.append(palavra)
+            base = self.base[indice]
+            for caractere in reversed(self.alfabeto):
+                destino = base + self.codigos[caractere]
+                if destino < tamanho and self.check[destino] == indice:
+                    pilha.append((destino, palavra + caractere))
+        return resultado
+
+    def memoria_bytes(self):
+        return (self.base.itemsize * len(self.base) + self.check.itemsize * len(self.check)
+                + len(self.fim_palavra))
+
+
+class TrieCompacta:
+    # Nós em ordem de largura com os filhos de cada nó contíguos: a estrutura inteira
+    # são três vetores e uma string, baratos de serializar entre processos
+    def __init__(self, trie):
+        self.primeiro_filho = array('i')
+        self.num_filhos = array('H')
+        self.fim_palavra = bytearray()
+        rotulos = ['']
+        self.contador_palavras = 0
+
+        fila = deque([trie.raiz])
+        proximo = 1
+        while fila:
+            no = fila.popleft()
+            self.primeiro_filho.append(proximo)
+            self.num_filhos.append(len(no.filhos))
+            self.fim_palavra.append(no.fim_palavra)
+            if no.fim_palavra:
+                self.contador_palavras += 1
+            for caractere in sorted(no.filhos):
+                rotulos.append(caractere)
+                fila.append(no.filhos[caractere])
+            proximo += len(no.filhos)
+
+        # rotulos[i] é o caractere da aresta que chega ao nó i (a raiz não tem rótulo)
+        self.rotulos = ' ' + ''.join(rotulos)
+
+    def _descer(self, palavra):
+        indice = 0
+        for caractere in palavra:
+            inicio = self.primeiro_filho[indice]
+            posicao = self.rotulos.find(caractere, inicio, inicio + self.num_filhos[indice])
+            if posicao == -1:
+                return -1
+            indice = posicao
+        return indice
+
+    def buscar(self, palavra):
+        indice = self._descer(palavra)
+        return indice != -1 and bool(self.fim_palavra[indice])
+
+    def buscar_palavras_com_prefixo(self, prefixo):
+        indice = self._descer(prefixo)
+        if indice == -1:
+            return []
+
+        resultado = []
+        pilha = [(indice, prefixo)]
+        while pilha:
+            indice, palavra = pilha.pop()
+            if self.fim_palavra[indice]:
+                resultado.append(palavra)
+            inicio = self.primeiro_filho[indice]
+            for filho in range(inicio + self.num_filhos[indice] - 1, inicio - 1, -1):
+                pilha.append((filho, palavra + self.rotulos[filho]))
+        return resultado
+
+    def memoria_bytes(self):
+        return (self.primeiro_filho.itemsize * len(self.primeiro_filho)
+                + self.num_filhos.itemsize * len(self.num_filhos)
+                + len(self.fim_palavra) + sys.getsizeof(self.rotulos))
+
+
+class TrieFragmentada:
+    # Raiz que encaminha cada consulta ao fragmento do primeiro caractere
+    def __init__(self, fragmentos, contem_vazia=False):
+        self.fragmentos = fragmentos
+        self.contem_vazia = contem_vazia
+        self.contador_palavras = contem_vazia + sum(f.contador_palavras for f in fragmentos.values())
+
+    def buscar(self, palavra):
+        if not palavra:
+            return self.contem_vazia
+        fragmento = self.fragmentos.get(palavra[0])
+        return fragmento is not None and fragmento.buscar(palavra)
+
+    def buscar_palavras_com_prefixo(self, prefixo):
+        if prefixo:
+            fragmento = self.fragmentos.get(prefixo[0])
+            return fragmento.buscar_palavras_com_prefixo(prefixo) if fragmento is not None else []
+
+        resultado = [''] if self.contem_vazia else []
+        for caractere in sorted(self.fragmentos):
+            resultado.extend(self.fragmentos[caractere].buscar_palavras_com_prefixo(''))
+        return resultado
+
+
+def _construir_fragmento(palavras):
+    trie = Trie()
+    for palavra in palavras:
+        trie.inserir(palavra)
+    return TrieCompacta(trie)
+
+
+def criar_trie_paralela(palavras, num_trabalhadores=None):
+    grupos = {}
+    contem_vazia = False
+    for palavra in palavras:
+        if palavra:
+            grupos.setdefault(palavra[0], []).append(palavra)
+        else:
+            contem_vazia = True
+
+    # Cada processo devolve o fragmento já compactado, sem serializar milhões de NoTrie
+    with ProcessPoolExecutor(max_workers=num_trabalhadores) as executor:
+        caracteres = list(grupos)
+        fragmentos = executor.map(_construir_fragmento, [grupos[c] for c in caracteres])
+        return TrieFragmentada(dict(zip(caracteres, fragmentos)), contem_vazia)
+
+
 def gerar_palavra_aleatoria(tamanho=8):
     letras = string.ascii_lowercase
     return ''.join(random.choice(letras) for _ in range(tamanho))
@@ -74,6 +358,12 @@ def criar_trie_com_palavras(quantidade):
     return trie, palavras
 
 
+def criar_trie_fragmentada_com_palavras(quantidade, num_trabalhadores=None):
+    # Construção em paralelo: devolve uma TrieFragmentada, somente leitura (sem inserir)
+    palavras = gerar_lista_palavras(quantidade)
+    return criar_trie_paralela(palavras, num_trabalhadores), palavras
+
+
 def medir_tempo_busca(trie, palavras, n_buscas=1000):
     palavras_para_buscar = []
 
@@ -129,13 +419,60 @@ def comparar_tamanhos_trie():
     plt.tight_layout()
     plt.savefig('trie_busca_por_tamanho.png', dpi=300)
 
-    return tamanhos, tempos_busca, acertos, erros
+    trabalhadores, tempos_construcao, tempo_serial = medir_construcao_paralela()
+
+    return tamanhos, tempos_busca, acertos, erros, trabalhadores, tempos_construcao, tempo_serial
+
+
+def medir_construcao_paralela(tamanho=1000000, trabalhadores=(1, 2, 4, 8)):
+    print(f"Medindo construção de Trie com {tamanho} palavras por número de processos...")
+    palavras = gerar_lista_palavras(tamanho)
+
+    inicio = time.time()
+    trie = Trie()
+    for palavra in palavras:
+        trie.inserir(palavra)
+    tempo_serial = time.time() - inicio
+
+    tempos_construcao = []
+    for num_trabalhadores in trabalhadores:
+        inicio = time.time()
+        trie_fragmentada = criar_trie_paralela(palavras, num_trabalhadores)
+        tempos_construcao.append(time.time() - inicio)
+
+        if trie_fragmentada.contador_palavras != trie.contador_palavras:
+            raise RuntimeError("Trie fragmentada diverge da Trie sequencial")
+
+    plt.figure(figsize=(12, 6))
+    plt.plot(trabalhadores, tempos_construcao, 'o-', linewidth=2, label='Fragmentada por primeiro caractere')
+    plt.axhline(tempo_serial, color='r', linestyle='--', label='Sequencial')
+    plt.xlabel('Número de Processos')
+    plt.ylabel('Tempo de Construção (segundos)')
+    plt.title(f'Construção da Trie com {tamanho} palavras ({os.cpu_count()} CPUs disponíveis)')
+    plt.legend()
+    plt.grid(True)
+    plt.savefig('trie_construcao_paralela.png', dpi=300)
+
+    return list(trabalhadores), tempos_construcao, tempo_serial
+
+
+def medir_memoria_trie(trie):
+    memoria = 0
+    pilha = [trie.raiz]
+    while pilha:
+        no = pilha.pop()
+        memoria += sys.getsizeof(no) + sys.getsizeof(no.__dict__) + sys.getsizeof(no.filhos)
+        pilha.extend(no.filhos.values())
+    return memoria
 
 
 def comparar_com_lista():
     tamanhos = [100, 1000, 10000, 50000, 100000]
     tempos_trie = []
     tempos_lista = []
+    tempos_duplo = []
+    memorias_trie = []
+    memorias_duplo = []
     n_buscas = 1000
 
     for tamanho in tamanhos:
@@ -145,6 +482,9 @@ def comparar_com_lista():
         trie = Trie()
         for palavra in palavras:
             trie.inserir(palavra)
+        trie_duplo = TrieDuploVetor(trie)
+        memorias_trie.append(medir_memoria_trie(trie))
+        memorias_duplo.append(trie_duplo.memoria_bytes())
 
         palavras_busca = []
         existentes = min(n_buscas // 2, len(palavras))
@@ -159,23 +499,122 @@ def comparar_com_lista():
         fim = time.time()
         tempos_trie.append(fim - inicio)
 
+        inicio = time.time()
+        for palavra in palavras_busca:
+            trie_duplo.buscar(palavra)
+        fim = time.time()
+        tempos_duplo.append(fim - inicio)
+
         inicio = time.time()
         for palavra in palavras_busca:
             palavra in palavras
         fim = time.time()
         tempos_lista.append(fim - inicio)
 
-    plt.figure(figsize=(12, 6))
+    plt.figure(figsize=(12, 10))
+
+    plt.subplot(2, 1, 1)
     plt.plot(tamanhos, tempos_trie, 'o-', label='Busca em Trie')
+    plt.plot(tamanhos, tempos_duplo, '^-', label='Busca em Trie Duplo Vetor')
     plt.plot(tamanhos, tempos_lista, 's-', label='Busca em Lista')
     plt.xlabel('Número de Palavras')
     plt.ylabel('Tempo Total de Busca (segundos)')
-    plt.title(f'Comparação: Trie vs. Lista ({n_buscas} buscas)')
+    plt.title(f'Comparação: Trie vs. Trie Duplo Vetor vs. Lista ({n_buscas} buscas)')
+    plt.legend()
+    plt.grid(True)
+
+    plt.subplot(2, 1, 2)
+    plt.plot(tamanhos, [m / 2 ** 20 for m in memorias_trie], 'o-', label='Trie')
+    plt.plot(tamanhos, [m / 2 ** 20 for m in memorias_duplo], '^-', label='Trie Duplo Vetor')
+    plt.xlabel('Número de Palavras')
+    plt.ylabel('Memória (MB)')
+    plt.title('Memória Ocupada pela Estrutura')
     plt.legend()
     plt.grid(True)
+
+    plt.tight_layout()
     plt.savefig('trie_vs_lista.png', dpi=300)
 
-    return tamanhos, tempos_trie, tempos_lista
+    return tamanhos, tempos_trie, tempos_lista, tempos_duplo, memorias_trie, memorias_duplo
+
+
+def distancia_levenshtein(a, b):
+    linha_anterior = list(range(len(b) + 1))
+    for i, caractere in enumerate(a, 1):
+        linha = [i]
+        for j in range(1, len(b) + 1):
+            custo = 0 if b[j - 1] == caractere else 1
+            linha.append(min(linha[j - 1] + 1, linha_anterior[j] + 1, linha_anterior[j - 1] + custo))
+        linha_anterior = linha
+    return linha_anterior[-1]
+
+
+def busca_aproximada_forca_bruta(palavras, palavra, max_dist):
+    resultado = []
+    for candidata in set(palavras):
+        distancia = distancia_levenshtein(candidata, palavra)
+        if distancia <= max_dist:
+            resultado.append((candidata, distancia))
+    resultado.sort(key=lambda item: (item[1], item[0]))
+    return resultado
+
+
+def gerar_erro_digitacao(palavra):
+    posicao = random.randrange(len(palavra))
+    letra = random.choice(string.ascii_lowercase)
+    operacao = random.choice(('trocar', 'inserir', 'apagar'))
+    if operacao == 'trocar':
+        return palavra[:posicao] + letra + palavra[posicao + 1:]
+    if operacao == 'inserir':
+        return palavra[:posicao] + letra + palavra[posicao:]
+    return palavra[:posicao] + palavra[posicao + 1:]
+
+
+def comparar_busca_aproximada(tamanhos=(100000, 1000000), distancias=(1, 2), n_consultas=20,
+                              n_consultas_forca_bruta=2):
+    tempos_trie = {d: [] for d in distancias}
+    tempos_forca_bruta = {d: [] for d in distancias}
+
+    for tamanho in tamanhos:
+        print(f"Busca aproximada em {tamanho} palavras...")
+        palavras = gerar_lista_palavras(tamanho)
+        trie = Trie()
+        for palavra in palavras:
+            trie.inserir(palavra)
+
+        consultas = [gerar_erro_digitacao(p) for p in random.sample(palavras, n_consultas)]
+
+        for max_dist in distancias:
+            inicio = time.time()
+            resultados_trie = [trie.buscar_aproximado(c, max_dist) for c in consultas]
+            fim = time.time()
+            tempos_trie[max_dist].append((fim - inicio) / n_consultas)
+
+            # A varredura completa é lenta demais para todas as consultas; usa-se só o início da lista
+            inicio = time.time()
+            resultados_forca_bruta = [busca_aproximada_forca_bruta(palavras, c, max_dist)
+                                      for c in consultas[:n_consultas_forca_bruta]]
+            fim = time.time()
+            tempos_forca_bruta[max_dist].append((fim - inicio) / n_consultas_forca_bruta)
+
+            if resultados_forca_bruta != resultados_trie[:n_consultas_forca_bruta]:
+                raise RuntimeError("Busca aproximada na Trie diverge da força bruta")
+
+    plt.figure(figsize=(12, 6))
+    for max_dist in distancias:
+        plt.plot(tamanhos, [t * 1000 for t in tempos_trie[max_dist]], 'o-', label=f'Trie (distância {max_dist})')
+        plt.plot(tamanhos, [t * 1000 for t in tempos_forca_bruta[max_dist]], 's--',
+                 label=f'Força bruta (distância {max_dist})')
+    plt.xlabel('Número de Palavras')
+    plt.ylabel('Tempo Médio por Consulta (ms)')
+    plt.title('Busca Aproximada: Trie com Poda vs. Levenshtein em Todas as Palavras')
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.legend()
+    plt.grid(True)
+    plt.savefig('trie_busca_aproximada.png', dpi=300)
+
+    return list(tamanhos), tempos_trie, tempos_forca_bruta
 
 
 def medir_busca_comprimento():
@@ -221,7 +660,7 @@ def main():
     print("=" * 50)
 
     print("\n1. Comparando tempos de busca para diferentes tamanhos de Trie...")
-    tamanhos, tempos_busca, acertos, erros = comparar_tamanhos_trie()
+    tamanhos, tempos_busca, acertos, erros, trabalhadores, tempos_construcao, tempo_serial = comparar_tamanhos_trie()
 
     print("\nResultados por tamanho de Trie:")
     for i, tamanho in enumerate(tamanhos):
@@ -231,15 +670,25 @@ def main():
         print(f"  - Palavras encontradas: {acertos[i]}")
         print(f"  - Palavras não encontradas: {erros[i]}")
 
+    print("\nTempo de construção por número de processos:")
+    print(f"  - Sequencial: {tempo_serial:.6f} segundos")
+    for i, num_trabalhadores in enumerate(trabalhadores):
+        print(f"  - {num_trabalhadores} processo(s): {tempos_construcao[i]:.6f} segundos "
+              f"({tempo_serial / tempos_construcao[i]:.2f}x)")
+
     print("\n2. Comparando busca em Trie vs. busca em Lista...")
-    tamanhos, tempos_trie, tempos_lista = comparar_com_lista()
+    tamanhos, tempos_trie, tempos_lista, tempos_duplo, memorias_trie, memorias_duplo = comparar_com_lista()
 
     print("\nResultados Trie vs. Lista:")
     for i, tamanho in enumerate(tamanhos):
         print(f"Tamanho {tamanho}:")
         print(f"  - Tempo de busca em Trie: {tempos_trie[i]:.6f} segundos")
+        print(f"  - Tempo de busca em Trie Duplo Vetor: {tempos_duplo[i]:.6f} segundos")
         print(f"  - Tempo de busca em Lista: {tempos_lista[i]:.6f} segundos")
         print(f"  - Trie é {tempos_lista[i] / tempos_trie[i]:.2f}x mais rápido que Lista")
+        print(f"  - Memória da Trie: {memorias_trie[i] / 2 ** 20:.2f} MB")
+        print(f"  - Memória da Trie Duplo Vetor: {memorias_duplo[i] / 2 ** 20:.2f} MB "
+              f"({memorias_trie[i] / memorias_duplo[i]:.1f}x menor)")
 
     print("\n3. Analisando impacto do comprimento das palavras...")
     comprimentos, tempos_busca_comp = medir_busca_comprimento()
@@ -249,10 +698,23 @@ def main():
         print(f"Comprimento médio {comprimento}:")
         print(f"  - Tempo de busca: {tempos_busca_comp[i]:.6f} segundos")
 
+    print("\n4. Comparando busca aproximada na Trie com força bruta...")
+    tamanhos_aprox, tempos_aprox_trie, tempos_aprox_forca_bruta = comparar_busca_aproximada()
+
+    print("\nResultados da busca aproximada (tempo médio por consulta):")
+    for max_dist in tempos_aprox_trie:
+        for i, tamanho in enumerate(tamanhos_aprox):
+            print(f"Distância {max_dist}, {tamanho} palavras:")
+            print(f"  - Trie: {tempos_aprox_trie[max_dist][i] * 1000:.3f} ms")
+            print(f"  - Força bruta: {tempos_aprox_forca_bruta[max_dist][i] * 1000:.3f} ms "
+                  f"({tempos_aprox_forca_bruta[max_dist][i] / tempos_aprox_trie[max_dist][i]:.1f}x mais lenta)")
+
     print("\nAnálise completa! Gráficos salvos como:")
     print("- trie_busca_por_tamanho.png")
+    print("- trie_construcao_paralela.png")
     print("- trie_vs_lista.png")
     print("- trie_busca_por_comprimento.png")
+    print("- trie_busca_aproximada.png")
 
 
 if __name__ == "__main__":
@@ -3,46 +3,120 @@ import matplotlib.pyplot as plt
 import time
 import string
 import random
+import heapq
+import tracemalloc
+from carga_ordenada import carregar_ordenadas
 
 
 class NoTrie:
     def __init__(self):
         self.filhos = {}
         self.fim_palavra = False
+        self.peso = 0
+        self.melhor_peso = float('-inf')
+
+
+def _criar_no_peso_unitario():
+    no = NoTrie()
+    no.melhor_peso = 1
+    return no
+
+
+def _marcar_peso_unitario(no):
+    no.peso = 1
 
 
 class Trie:
     def __init__(self):
         self.raiz = NoTrie()
 
-    def inserir(self, palavra):
+    def inserir(self, palavra, peso=1):
         no_atual = self.raiz
+        caminho = [no_atual]
 
         for caractere in palavra:
             if caractere not in no_atual.filhos:
                 no_atual.filhos[caractere] = NoTrie()
             no_atual = no_atual.filhos[caractere]
+            caminho.append(no_atual)
 
+        peso_reduzido = no_atual.fim_palavra and peso < no_atual.peso
         no_atual.fim_palavra = True
-
-    def buscar_palavras_com_prefixo(self, prefixo):
+        no_atual.peso = peso
+
+        # Cada nó guarda o maior peso de palavra em sua subárvore
+        if peso_reduzido:
+            for no in reversed(caminho):
+                melhor = no.peso if no.fim_palavra else float('-inf')
+                for filho in no.filhos.values():
+                    melhor = max(melhor, filho.melhor_peso)
+                no.melhor_peso = melhor
+        else:
+            for no in caminho:
+                if peso > no.melhor_peso:
+                    no.melhor_peso = peso
+
+    def sugerir(self, prefixo, k=10):
         no_atual = self.raiz
-        resultado = []
 
         for caractere in prefixo:
             if caractere not in no_atual.filhos:
                 return []
             no_atual = no_atual.filhos[caractere]
 
-        self._buscar_palavras_recursivamente(no_atual, prefixo, resultado)
-        return resultado
+        # Busca pelo melhor primeiro: melhor_peso é o limite exato do que cada subárvore ainda pode oferecer
+        sugestoes = []
+        contador = 0
+        heap = [(-no_atual.melhor_peso, prefixo, contador, no_atual)]
+        while heap and len(sugestoes) < k:
+            peso_negativo, palavra, _, no = heapq.heappop(heap)
+            if no is None:
+                sugestoes.append((palavra, -peso_negativo))
+                continue
+
+            if no.fim_palavra:
+                contador += 1
+                heapq.heappush(heap, (-no.peso, palavra, contador, None))
+            for caractere, filho in no.filhos.items():
+                contador += 1
+                heapq.heappush(heap, (-filho.melhor_peso, palavra + caractere, contador, filho))
+
+        return sugestoes
+
+    @classmethod
+    def from_sorted(cls, palavras):
+        trie = cls()
+        if carregar_ordenadas(trie.raiz, palavras, _criar_no_peso_unitario, _marcar_peso_unitario):
+            trie.raiz.melhor_peso = 1
+        return trie
+
+    def buscar_palavras_com_prefixo(self, prefixo):
+        return list(self.iterar_palavras_com_prefixo(prefixo))
+
+    def iterar_palavras_com_prefixo(self, prefixo, offset=0, limit=None):
+        no_atual = self.raiz
+
+        for caractere in prefixo:
+            if caractere not in no_atual.filhos:
+                return
+            no_atual = no_atual.filhos[caractere]
 
-    def _buscar_palavras_recursivamente(self, no, prefixo_atual, resultado):
-        if no.fim_palavra:
-            resultado.append(prefixo_atual)
+        # Pilha explícita: mesma ordem da versão recursiva, sem limite de profundidade
+        pilha = [(no_atual, prefixo)]
+        encontradas = 0
+        entregues = 0
+        while pilha:
+            if limit is not None and entregues >= limit:
+                return
+            no, palavra = pilha.pop()
+            if no.fim_palavra:
+                if encontradas >= offset:
+                    entregues += 1
+                    yield palavra
+                encontradas += 1
 
-        for caractere, filho in no.filhos.items():
-            self._buscar_palavras_recursivamente(filho, prefixo_atual + caractere, resultado)
+            for caractere, filho in reversed(no.filhos.items()):
+                pilha.append((filho, palavra + caractere))
 
 
 def gerar_palavra_aleatoria(tamanho_min=3, tamanho_max=10):
@@ -181,6 +255,112 @@ def experimento_tempo_por_prefixo():
     plt.savefig('analise_tamanho_prefixo.png')
     plt.show()
 
+    medir_percentis_sugestoes()
+
+
+def medir_tempo_e_pico(funcao):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    funcao()
+    fim = time.perf_counter()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return fim - inicio, pico
+
+
+def experimento_iteracao_paginada(tamanho_conjunto=100000, tamanho_pagina=20):
+    trie = Trie()
+    for palavra in gerar_conjunto_palavras(tamanho_conjunto):
+        trie.inserir(palavra)
+
+    cenarios = {
+        'Lista completa': lambda: trie.buscar_palavras_com_prefixo(''),
+        'Gerador completo': lambda: sum(1 for _ in trie.iterar_palavras_com_prefixo('')),
+        f'Primeira página ({tamanho_pagina})': lambda: list(trie.iterar_palavras_com_prefixo('', limit=tamanho_pagina)),
+        f'Página 100 ({tamanho_pagina})': lambda: list(
+            trie.iterar_palavras_com_prefixo('', offset=100 * tamanho_pagina, limit=tamanho_pagina)),
+    }
+
+    tempos = []
+    picos = []
+    for nome, funcao in cenarios.items():
+        tempo, pico = medir_tempo_e_pico(funcao)
+        tempos.append(tempo)
+        picos.append(pico / 1024)
+        print(f"  - {nome}: {tempo * 1000:.3f} ms, pico de memória {pico / 1024:.1f} KB")
+
+    plt.figure(figsize=(14, 5))
+
+    plt.subplot(1, 2, 1)
+    plt.bar(list(cenarios.keys()), tempos, color='teal')
+    plt.title(f'Tempo de Enumeração ({tamanho_conjunto} palavras)')
+    plt.ylabel('Tempo (segundos)')
+    plt.yscale('log')
+    plt.xticks(rotation=15)
+
+    plt.subplot(1, 2, 2)
+    plt.bar(list(cenarios.keys()), picos, color='orange')
+    plt.title('Pico de Memória Durante a Enumeração')
+    plt.ylabel('Memória (KB)')
+    plt.yscale('log')
+    plt.xticks(rotation=15)
+
+    plt.tight_layout()
+    plt.savefig('analise_iteracao_paginada.png')
+    plt.show()
+
+    return tempos, picos
+
+
+def medir_latencias(funcao, prefixos):
+    latencias = []
+    for prefixo in prefixos:
+        inicio = time.perf_counter()
+        funcao(prefixo)
+        fim = time.perf_counter()
+        latencias.append((fim - inicio) * 1000)
+    return np.array(latencias)
+
+
+def medir_percentis_sugestoes(tamanho_conjunto=100000, k=10, n_consultas=200):
+    trie = Trie()
+    palavras = gerar_conjunto_palavras(tamanho_conjunto)
+    for palavra in palavras:
+        trie.inserir(palavra, int(np.random.zipf(1.5)))
+
+    percentis = [50, 95, 99]
+    resultados = {}
+    for tamanho in range(1, 4):
+        prefixos = [gerar_palavra_aleatoria(tamanho, tamanho) for _ in range(n_consultas)]
+        latencias_todas = medir_latencias(trie.buscar_palavras_com_prefixo, prefixos)
+        latencias_top_k = medir_latencias(lambda prefixo: trie.sugerir(prefixo, k), prefixos)
+        resultados[tamanho] = (np.percentile(latencias_todas, percentis), np.percentile(latencias_top_k, percentis))
+
+        print(f"Prefixos de tamanho {tamanho} ({tamanho_conjunto} palavras):")
+        for nome, valores in (('buscar_palavras_com_prefixo', resultados[tamanho][0]),
+                              (f'sugerir(k={k})', resultados[tamanho][1])):
+            print(f"  - {nome}: " + ", ".join(f"p{p}={v:.3f} ms" for p, v in zip(percentis, valores)))
+
+    plt.figure(figsize=(15, 5))
+    largura = 0.35
+    for i, tamanho in enumerate(resultados):
+        plt.subplot(1, len(resultados), i + 1)
+        x = np.arange(len(percentis))
+        plt.bar(x - largura / 2, resultados[tamanho][0], largura, label='Todas as palavras')
+        plt.bar(x + largura / 2, resultados[tamanho][1], largura, label=f'Top-{k} (sugerir)')
+        plt.xticks(x, [f'p{p}' for p in percentis])
+        plt.yscale('log')
+        plt.title(f'Latência por Consulta - Prefixo de Tamanho {tamanho}')
+        plt.ylabel('Latência (ms)')
+        plt.legend()
+        plt.grid(True, axis='y')
+
+    plt.tight_layout()
+    plt.savefig('analise_percentis_sugestoes.png')
+    plt.show()
+
+    return resultados
+
 
 if __name__ == "__main__":
     print("Experimento 1: Análise de desempenho por tamanho do conjunto de palavras")
@@ -188,3 +368,6 @@ if __name__ == "__main__":
 
     print("\nExperimento 2: Análise de desempenho por tamanho do prefixo")
     experimento_tempo_por_prefixo()
+
+    print("\nExperimento 3: Enumeração paginada com gerador vs lista completa")
+    experimento_iteracao_paginada()
@@ -14,6 +14,9 @@ class NoTrie:
 class Trie:
     def __init__(self):
         self.raiz = NoTrie()
+        # Contadores mantidos a cada inserção/remoção para que contar_nos seja O(1)
+        self.num_nos = 1
+        self.num_palavras = 0
 
     def inserir(self, palavra):
         no_atual = self.raiz
@@ -21,9 +24,12 @@ class Trie:
         for caractere in palavra:
             if caractere not in no_atual.filhos:
                 no_atual.filhos[caractere] = NoTrie()
+                self.num_nos += 1
             no_atual = no_atual.filhos[caractere]
 
-        no_atual.fim_palavra = True
+        if not no_atual.fim_palavra:
+            no_atual.fim_palavra = True
+            self.num_palavras += 1
 
     def buscar(self, palavra):
         no_atual = self.raiz
@@ -42,6 +48,7 @@ class Trie:
         if profundidade == len(palavra):
             if no.fim_palavra:
                 no.fim_palavra = False
+                self.num_palavras -= 1
                 return len(no.filhos) == 0
             return False
 
@@ -54,37 +61,84 @@ class Trie:
 
         if deve_remover_filho:
             del no.filhos[caractere]
+            self.num_nos -= 1
             return len(no.filhos) == 0 and not no.fim_palavra
 
         return False
 
+    def remover_varios(self, palavras):
+        # Remove o lote em uma única passada: com as palavras ordenadas, cada uma
+        # reaproveita o caminho da anterior até o maior prefixo comum, e os ramos
+        # que ficam vazios são podados quando o caminho é desfeito
+        removidas = 0
+        caminho = [self.raiz]
+        anterior = ''
+
+        for palavra in sorted(set(palavras)):
+            comum = 0
+            limite = min(len(anterior), len(palavra), len(caminho) - 1)
+            while comum < limite and anterior[comum] == palavra[comum]:
+                comum += 1
+            self._podar_caminho(caminho, anterior, comum)
+
+            no_atual = caminho[-1]
+            for caractere in palavra[comum:]:
+                no_atual = no_atual.filhos.get(caractere)
+                if no_atual is None:
+                    break
+                caminho.append(no_atual)
+            else:
+                if no_atual.fim_palavra:
+                    no_atual.fim_palavra = False
+                    removidas += 1
+
+            anterior = palavra
+
+        self._podar_caminho(caminho, anterior, 0)
+        self.num_palavras -= removidas
+        return removidas
+
+    def _podar_caminho(self, caminho, palavra, profundidade):
+        # caminho[i] é o nó alcançado por palavra[:i]
+        while len(caminho) - 1 > profundidade:
+            no = caminho.pop()
+            if not no.filhos and not no.fim_palavra:
+                del caminho[-1].filhos[palavra[len(caminho) - 1]]
+                self.num_nos -= 1
+
     def buscar_palavras_com_prefixo(self, prefixo):
+        return list(self.iterar_palavras_com_prefixo(prefixo))
+
+    def iterar_palavras_com_prefixo(self, prefixo, offset=0, limit=None):
         no_atual = self.raiz
-        resultado = []
 
         for caractere in prefixo:
             if caractere not in no_atual.filhos:
-                return []
+                return
             no_atual = no_atual.filhos[caractere]
 
-        self._buscar_palavras_recursivamente(no_atual, prefixo, resultado)
-        return resultado
-
-    def _buscar_palavras_recursivamente(self, no, prefixo_atual, resultado):
-        if no.fim_palavra:
-            resultado.append(prefixo_atual)
+        # Pilha explícita: mesma ordem da versão recursiva, sem limite de profundidade
+        pilha = [(no_atual, prefixo)]
+        encontradas = 0
+        entregues = 0
+        while pilha:
+            if limit is not None and entregues >= limit:
+                return
+            no, palavra = pilha.pop()
+            if no.fim_palavra:
+                if encontradas >= offset:
+                    entregues += 1
+                    yield palavra
+                encontradas += 1
 
-        for caractere, filho in no.filhos.items():
-            self._buscar_palavras_recursivamente(filho, prefixo_atual + caractere, resultado)
+            for caractere, filho in reversed(no.filhos.items()):
+                pilha.append((filho, palavra + caractere))
 
     def contar_nos(self):
-        return self._contar_nos_recursivamente(self.raiz)
+        return self.num_nos
 
-    def _contar_nos_recursivamente(self, no):
-        count = 1  # Contamos o nó atual
-        for filho in no.filhos.values():
-            count += self._contar_nos_recursivamente(filho)
-        return count
+    def contar_palavras(self):
+        return self.num_palavras
 
 
 def gerar_palavra_aleatoria(tamanho_min=3, tamanho_max=10):
@@ -193,6 +247,46 @@ def experimento_remocao_palavras_especificas():
     return tamanhos, [t[1] for t in sorted(tempos_por_tamanho)]
 
 
+def experimento_remocao_em_lote():
+    tamanhos_tries = [10000, 100000, 1000000]
+    proporcao = 0.5
+
+    tempos_individual = []
+    tempos_lote = []
+
+    for tamanho in tamanhos_tries:
+        print(f"\nRemovendo {proporcao * 100:.0f}% de uma Trie de {tamanho} palavras:")
+
+        palavras = gerar_conjunto_palavras(tamanho)
+        palavras_remover = random.sample(palavras, int(tamanho * proporcao))
+
+        trie_individual = Trie()
+        trie_lote = Trie()
+        for palavra in palavras:
+            trie_individual.inserir(palavra)
+            trie_lote.inserir(palavra)
+
+        inicio = time.time()
+        for palavra in palavras_remover:
+            trie_individual.remover(palavra)
+        fim = time.time()
+        tempos_individual.append(fim - inicio)
+
+        inicio = time.time()
+        trie_lote.remover_varios(palavras_remover)
+        fim = time.time()
+        tempos_lote.append(fim - inicio)
+
+        print(f"  - remover palavra a palavra: {tempos_individual[-1]:.6f} segundos")
+        print(f"  - remover_varios: {tempos_lote[-1]:.6f} segundos "
+              f"({tempos_individual[-1] / tempos_lote[-1]:.2f}x)")
+        print(f"  - Nós finais: {trie_individual.contar_nos()} (individual) / {trie_lote.contar_nos()} (lote)")
+        print(f"  - Palavras finais: {trie_individual.contar_palavras()} (individual) / "
+              f"{trie_lote.contar_palavras()} (lote)")
+
+    return tamanhos_tries, tempos_individual, tempos_lote
+
+
 def plotar_graficos_remocao_parcial(tamanhos, proporcoes, tempos, reducao_nos):
     plt.figure(figsize=(15, 10))
 
@@ -262,6 +356,23 @@ def plotar_grafico_tamanho_palavra(tamanhos, tempos):
     plt.show()
 
 
+def plotar_grafico_remocao_em_lote(tamanhos, tempos_individual, tempos_lote):
+    plt.figure(figsize=(10, 6))
+
+    plt.plot(tamanhos, tempos_individual, 'ro-', label='remover (palavra a palavra)')
+    plt.plot(tamanhos, tempos_lote, 'go-', label='remover_varios (passada única)')
+    plt.title('Remoção de 50% das Palavras: Individual vs Lote')
+    plt.xlabel('Número de Palavras na Trie')
+    plt.ylabel('Tempo (segundos)')
+    plt.xscale('log')
+    plt.legend()
+    plt.grid(True)
+
+    plt.tight_layout()
+    plt.savefig('analise_remocao_em_lote.png')
+    plt.show()
+
+
 if __name__ == "__main__":
     print("Exercício 2.4 – Remoção de uma palavra do Trie")
 
@@ -273,6 +384,10 @@ if __name__ == "__main__":
     tamanhos_palavras, tempos_por_tamanho = experimento_remocao_palavras_especificas()
     plotar_grafico_tamanho_palavra(tamanhos_palavras, tempos_por_tamanho)
 
+    print("\nExperimento 3: Remoção em lote com poda em passada única")
+    tamanhos_lote, tempos_individual, tempos_lote = experimento_remocao_em_lote()
+    plotar_grafico_remocao_em_lote(tamanhos_lote, tempos_individual, tempos_lote)
+
     # Exemplo específico para ilustrar o funcionamento do método de remoção
     print("\nDemonstração do método de remoção:")
     trie_demo = Trie()
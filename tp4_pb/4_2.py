@@ -2,6 +2,11 @@ import numpy as np
 import matplotlib.pyplot as plt
 import time
 import random
+import os
+import sys
+import tempfile
+from ordenacao_externa import (ordenacao_mergesort_natural, gerar_arquivo_binario, gerar_arquivo_texto,
+                                ordenacao_externa, arquivo_binario_ordenado, arquivo_texto_ordenado)
 
 
 def ordenacao_bolha(lista):
@@ -76,10 +81,59 @@ def mesclar(esquerda, direita):
     return resultado
 
 
-def medir_tempo_execucao(algoritmo, tamanhos_listas):
+def contar_linhas(caminho):
+    with open(caminho, 'r') as arquivo:
+        return sum(1 for _ in arquivo)
+
+
+def comparar_ordenacao_externa(tamanho_bytes=10 * 2 ** 30, memoria_bytes=512 * 2 ** 20, linhas_texto=10 ** 7,
+                               diretorio=None):
+    with tempfile.TemporaryDirectory(dir=diretorio) as pasta:
+        entrada = os.path.join(pasta, 'entrada.bin')
+        saida = os.path.join(pasta, 'saida.bin')
+
+        inicio = time.time()
+        gerar_arquivo_binario(entrada, tamanho_bytes)
+        tempo_geracao = time.time() - inicio
+
+        inicio = time.time()
+        num_trechos = ordenacao_externa(entrada, saida, memoria_bytes, diretorio_temporario=pasta)
+        tempo_ordenacao = time.time() - inicio
+
+        if os.path.getsize(saida) != os.path.getsize(entrada) or not arquivo_binario_ordenado(saida):
+            raise RuntimeError("Ordenação externa produziu um arquivo incorreto")
+        os.remove(entrada)
+        os.remove(saida)
+
+        # Mesmo algoritmo no formato texto: uma linha por item, ordenadas como strings
+        entrada_texto = os.path.join(pasta, 'entrada.txt')
+        saida_texto = os.path.join(pasta, 'saida.txt')
+        gerar_arquivo_texto(entrada_texto, linhas_texto)
+        tamanho_texto = os.path.getsize(entrada_texto)
+
+        inicio = time.time()
+        num_trechos_texto = ordenacao_externa(entrada_texto, saida_texto, memoria_bytes, formato='texto',
+                                              diretorio_temporario=pasta)
+        tempo_texto = time.time() - inicio
+
+        if contar_linhas(saida_texto) != linhas_texto or not arquivo_texto_ordenado(saida_texto):
+            raise RuntimeError("Ordenação externa de texto produziu um arquivo incorreto")
+
+    print(f"Ordenação externa de {tamanho_bytes / 2 ** 30:.2f} GB com {memoria_bytes / 2 ** 20:.0f} MB de memória:")
+    print(f"  - Geração do arquivo: {tempo_geracao:.2f} s")
+    print(f"  - {num_trechos} trechos ordenados e intercalados em {tempo_ordenacao:.2f} s "
+          f"({tamanho_bytes / 2 ** 20 / tempo_ordenacao:.2f} MB/s)")
+    print(f"  - Texto: {linhas_texto} linhas ({tamanho_texto / 2 ** 20:.0f} MB) em {num_trechos_texto} trechos, "
+          f"{tempo_texto:.2f} s ({tamanho_texto / 2 ** 20 / tempo_texto:.2f} MB/s)")
+    return tempo_ordenacao, num_trechos
+
+
+def medir_tempo_execucao(algoritmo, tamanhos_listas, ordenada=False):
     tempos = []
     for tamanho in tamanhos_listas:
         lista = [random.randint(1, 1000) for _ in range(tamanho)]
+        if ordenada:
+            lista.sort()
         inicio = time.time()
         if algoritmo.__name__ in ['ordenacao_quicksort', 'ordenacao_mergesort']:
             resultado = algoritmo(lista)
@@ -91,14 +145,15 @@ def medir_tempo_execucao(algoritmo, tamanhos_listas):
     return tempos
 
 
-def main():
+def main(ordenacao_externa=False):
     tamanhos_entrada = [100, 500, 1000, 2000, 3000, 4000, 5000]
     algoritmos = [
         ordenacao_bolha,
         ordenacao_selecao,
         ordenacao_insercao,
         ordenacao_quicksort,
-        ordenacao_mergesort
+        ordenacao_mergesort,
+        ordenacao_mergesort_natural
     ]
 
     todos_tempos = {}
@@ -140,7 +195,8 @@ def main():
         'selecao': [n ** 2 for n in tamanhos_entrada],
         'insercao': [n ** 2 for n in tamanhos_entrada],
         'quicksort': [n * np.log(n) for n in tamanhos_entrada],
-        'mergesort': [n * np.log(n) for n in tamanhos_entrada]
+        'mergesort': [n * np.log(n) for n in tamanhos_entrada],
+        'mergesort_natural': [n * np.log(n) for n in tamanhos_entrada]
     }
 
     # Normalizar as complexidades teóricas para comparação
@@ -157,8 +213,31 @@ def main():
     plt.grid(True)
     plt.savefig('complexidade_teorica.png')
 
+    # Merge sort recursivo com fatias vs. de baixo para cima com buffer, em entradas maiores
+    tamanhos_merge = [10000, 50000, 100000, 500000]
+    plt.figure(figsize=(12, 8))
+    for ordenada in (False, True):
+        for algoritmo in (ordenacao_mergesort, ordenacao_mergesort_natural):
+            tempos = medir_tempo_execucao(algoritmo, tamanhos_merge, ordenada)
+            rotulo = f"{algoritmo.__name__.replace('ordenacao_', '')} ({'ordenada' if ordenada else 'aleatória'})"
+            print(f"{rotulo}: " + ", ".join(f"{t:.4f}s" for t in tempos))
+            plt.plot(tamanhos_merge, tempos, marker='o', label=rotulo)
+
+    plt.title('Merge Sort Recursivo vs. Natural de Baixo para Cima')
+    plt.xlabel('Tamanho da Entrada')
+    plt.ylabel('Tempo de Execução (segundos)')
+    plt.legend()
+    plt.grid(True)
+    plt.savefig('comparacao_mergesort_natural.png')
+
+    # Arquivo de 10 GB ordenado com 512 MB de memória: leva minutos e ocupa ~20 GB de disco
+    if ordenacao_externa:
+        comparar_ordenacao_externa()
+    else:
+        print("Ordenação externa de 10 GB omitida; rode com --ordenacao-externa para incluí-la.")
+
     print('Análise concluída. Gráficos salvos na pasta atual.')
 
 
 if __name__ == "__main__":
-    main()
+    main('--ordenacao-externa' in sys.argv)
@@ -0,0 +1,54 @@
+import gc
+
+
+def ler_palavras_ordenadas(caminho):
+    with open(caminho, encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            palavra = linha.strip()
+            if palavra:
+                yield palavra
+
+
+def carregar_ordenadas(raiz, palavras, criar_no, marcar_fim=None):
+    # Mantém a pilha de nós da palavra anterior e cria só o trecho depois do maior prefixo
+    # comum. Em CPython isso custa o mesmo que inserir palavra a palavra: o ganho da carga
+    # vem de pausar o coletor, e a pilha serve para validar a ordem sem nova descida
+    caminho = [raiz]
+    anterior = ''
+    quantidade = 0
+
+    # A carga só cria árvores, sem ciclos; com o coletor ligado, cada geração cheia
+    # de nós novos dispara uma varredura de todos os objetos já criados, e é isso que
+    # domina o tempo de construção
+    coletor_ligado = gc.isenabled()
+    gc.disable()
+    try:
+        for palavra in palavras:
+            if quantidade and palavra <= anterior:
+                if palavra == anterior:
+                    continue
+                raise ValueError(f"Entrada fora de ordem: '{palavra}' depois de '{anterior}'")
+
+            limite = min(len(palavra), len(anterior))
+            comum = 0
+            while comum < limite and palavra[comum] == anterior[comum]:
+                comum += 1
+            del caminho[comum + 1:]
+
+            no_atual = caminho[comum]
+            for caractere in palavra[comum:]:
+                novo = criar_no()
+                no_atual.filhos[caractere] = novo
+                no_atual = novo
+                caminho.append(novo)
+
+            no_atual.fim_palavra = True
+            if marcar_fim is not None:
+                marcar_fim(no_atual)
+            quantidade += 1
+            anterior = palavra
+    finally:
+        if coletor_ligado:
+            gc.enable()
+
+    return quantidade
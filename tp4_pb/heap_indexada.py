@@ -0,0 +1,384 @@
+import heapq
+import operator
+from collections import Counter
+
+
+class FilaPrioridadeIndexada:
+    # Heap d-ária em vetor (binária por padrão), modificada no próprio lugar, com um mapa
+    # item -> posição que permite alterar a prioridade ou remover qualquer item em O(log n)
+    def __init__(self, pares=None, maxima=False, aridade=2):
+        if aridade < 2:
+            raise ValueError("A aridade da heap deve ser pelo menos 2")
+        self.aridade = aridade
+        self.maxima = maxima
+        self._precede = operator.gt if maxima else operator.lt
+        self.itens = []
+        self.prioridades = []
+        self.posicoes = {}
+
+        if pares is not None:
+            for item, prioridade in pares:
+                if item in self.posicoes:
+                    raise KeyError(f"Item {item!r} repetido")
+                self.posicoes[item] = len(self.itens)
+                self.itens.append(item)
+                self.prioridades.append(prioridade)
+            for i in range((len(self.itens) - 2) // aridade, -1, -1):
+                self._descer(i)
+
+    def __len__(self):
+        return len(self.itens)
+
+    def __contains__(self, item):
+        return item in self.posicoes
+
+    def contem(self, item):
+        return item in self.posicoes
+
+    def prioridade(self, item):
+        return self.prioridades[self.posicoes[item]]
+
+    def inserir(self, item, prioridade=None):
+        if item in self.posicoes:
+            raise KeyError(f"Item {item!r} já está na fila")
+        if prioridade is None:
+            prioridade = item
+        self.posicoes[item] = len(self.itens)
+        self.itens.append(item)
+        self.prioridades.append(prioridade)
+        self._subir(len(self.itens) - 1)
+
+    def topo(self):
+        if not self.itens:
+            raise IndexError("Fila de prioridade vazia")
+        return self.itens[0], self.prioridades[0]
+
+    def remover_topo(self):
+        if not self.itens:
+            raise IndexError("Fila de prioridade vazia")
+        item, prioridade = self.itens[0], self.prioridades[0]
+        self._remover_posicao(0)
+        return item, prioridade
+
+    def remover(self, item):
+        posicao = self.posicoes[item]
+        prioridade = self.prioridades[posicao]
+        self._remover_posicao(posicao)
+        return prioridade
+
+    def alterar_prioridade(self, item, prioridade):
+        posicao = self.posicoes[item]
+        antiga = self.prioridades[posicao]
+        self.prioridades[posicao] = prioridade
+        if self._precede(prioridade, antiga):
+            self._subir(posicao)
+        else:
+            self._descer(posicao)
+
+    def diminuir_chave(self, item, prioridade):
+        if prioridade > self.prioridades[self.posicoes[item]]:
+            raise ValueError("A nova prioridade é maior que a atual")
+        self.alterar_prioridade(item, prioridade)
+
+    def aumentar_chave(self, item, prioridade):
+        if prioridade < self.prioridades[self.posicoes[item]]:
+            raise ValueError("A nova prioridade é menor que a atual")
+        self.alterar_prioridade(item, prioridade)
+
+    def _remover_posicao(self, posicao):
+        ultimo = len(self.itens) - 1
+        del self.posicoes[self.itens[posicao]]
+        if posicao != ultimo:
+            self.itens[posicao] = self.itens[ultimo]
+            self.prioridades[posicao] = self.prioridades[ultimo]
+            self.posicoes[self.itens[posicao]] = posicao
+        self.itens.pop()
+        self.prioridades.pop()
+        if posicao < ultimo:
+            self._subir(posicao)
+            self._descer(posicao)
+
+    def _subir(self, indice):
+        itens = self.itens
+        prioridades = self.prioridades
+        posicoes = self.posicoes
+        precede = self._precede
+        aridade = self.aridade
+        item = itens[indice]
+        prioridade = prioridades[indice]
+
+        # O elemento só é gravado na posição final; os pais descem uma casa cada
+        while indice > 0:
+            pai = (indice - 1) // aridade
+            if not precede(prioridade, prioridades[pai]):
+                break
+            itens[indice] = itens[pai]
+            prioridades[indice] = prioridades[pai]
+            posicoes[itens[indice]] = indice
+            indice = pai
+
+        itens[indice] = item
+        prioridades[indice] = prioridade
+        posicoes[item] = indice
+
+    def _descer(self, indice):
+        itens = self.itens
+        prioridades = self.prioridades
+        posicoes = self.posicoes
+        precede = self._precede
+        aridade = self.aridade
+        n = len(itens)
+        item = itens[indice]
+        prioridade = prioridades[indice]
+
+        while True:
+            filho = aridade * indice + 1
+            if filho >= n:
+                break
+            if aridade == 2:
+                if filho + 1 < n and precede(prioridades[filho + 1], prioridades[filho]):
+                    filho += 1
+            else:
+                for irmao in range(filho + 1, min(filho + aridade, n)):
+                    if precede(prioridades[irmao], prioridades[filho]):
+                        filho = irmao
+            if not precede(prioridades[filho], prioridade):
+                break
+            itens[indice] = itens[filho]
+            prioridades[indice] = prioridades[filho]
+            posicoes[itens[indice]] = indice
+            indice = filho
+
+        itens[indice] = item
+        prioridades[indice] = prioridade
+        posicoes[item] = indice
+
+
+class NoPareamento:
+    __slots__ = ('item', 'prioridade', 'filho', 'irmao', 'anterior')
+
+    def __init__(self, item, prioridade):
+        self.item = item
+        self.prioridade = prioridade
+        self.filho = None
+        self.irmao = None
+        # Pai, se for o primeiro filho; caso contrário, o irmão à esquerda
+        self.anterior = None
+
+
+class HeapPareamento:
+    # Mesma interface da FilaPrioridadeIndexada: inserção e diminuir_chave em O(1),
+    # remoção do topo em O(log n) amortizado pela combinação em duas passadas
+    def __init__(self, pares=None, maxima=False):
+        self.maxima = maxima
+        self._precede = operator.gt if maxima else operator.lt
+        self.raiz = None
+        self.nos = {}
+        if pares is not None:
+            for item, prioridade in pares:
+                self.inserir(item, prioridade)
+
+    def __len__(self):
+        return len(self.nos)
+
+    def __contains__(self, item):
+        return item in self.nos
+
+    def contem(self, item):
+        return item in self.nos
+
+    def prioridade(self, item):
+        return self.nos[item].prioridade
+
+    def inserir(self, item, prioridade=None):
+        if item in self.nos:
+            raise KeyError(f"Item {item!r} já está na fila")
+        if prioridade is None:
+            prioridade = item
+        no = NoPareamento(item, prioridade)
+        self.nos[item] = no
+        self.raiz = no if self.raiz is None else self._unir(self.raiz, no)
+
+    def topo(self):
+        if self.raiz is None:
+            raise IndexError("Fila de prioridade vazia")
+        return self.raiz.item, self.raiz.prioridade
+
+    def remover_topo(self):
+        if self.raiz is None:
+            raise IndexError("Fila de prioridade vazia")
+        raiz = self.raiz
+        del self.nos[raiz.item]
+        self.raiz = self._combinar_pares(raiz.filho)
+        return raiz.item, raiz.prioridade
+
+    def remover(self, item):
+        no = self.nos[item]
+        if no is self.raiz:
+            return self.remover_topo()[1]
+        del self.nos[item]
+        self._cortar(no)
+        subarvore = self._combinar_pares(no.filho)
+        if subarvore is not None:
+            self.raiz = self._unir(self.raiz, subarvore)
+        return no.prioridade
+
+    def alterar_prioridade(self, item, prioridade):
+        no = self.nos[item]
+        if self._precede(prioridade, no.prioridade):
+            no.prioridade = prioridade
+            if no is not self.raiz:
+                self._cortar(no)
+                self.raiz = self._unir(self.raiz, no)
+        else:
+            self.remover(item)
+            self.inserir(item, prioridade)
+
+    def diminuir_chave(self, item, prioridade):
+        if prioridade > self.nos[item].prioridade:
+            raise ValueError("A nova prioridade é maior que a atual")
+        self.alterar_prioridade(item, prioridade)
+
+    def aumentar_chave(self, item, prioridade):
+        if prioridade < self.nos[item].prioridade:
+            raise ValueError("A nova prioridade é menor que a atual")
+        self.alterar_prioridade(item, prioridade)
+
+    def _unir(self, a, b):
+        if self._precede(b.prioridade, a.prioridade):
+            a, b = b, a
+        b.anterior = a
+        b.irmao = a.filho
+        if a.filho is not None:
+            a.filho.anterior = b
+        a.filho = b
+        a.irmao = None
+        a.anterior = None
+        return a
+
+    def _cortar(self, no):
+        anterior = no.anterior
+        if anterior.filho is no:
+            anterior.filho = no.irmao
+        else:
+            anterior.irmao = no.irmao
+        if no.irmao is not None:
+            no.irmao.anterior = anterior
+        no.anterior = None
+        no.irmao = None
+
+    def _combinar_pares(self, primeiro):
+        if primeiro is None:
+            return None
+        primeiro.anterior = None
+
+        # Primeira passada: une os filhos dois a dois, da esquerda para a direita
+        pares = []
+        atual = primeiro
+        while atual is not None:
+            segundo = atual.irmao
+            if segundo is None:
+                atual.anterior = None
+                pares.append(atual)
+                break
+            proximo = segundo.irmao
+            atual.irmao = segundo.irmao = None
+            pares.append(self._unir(atual, segundo))
+            atual = proximo
+
+        # Segunda passada: acumula da direita para a esquerda
+        resultado = pares.pop()
+        while pares:
+            resultado = self._unir(pares.pop(), resultado)
+        return resultado
+
+
+class HeapComIndice:
+    # Min-heap sobre heapq com um índice valor -> contagem mantido a cada operação;
+    # remoções arbitrárias só marcam o valor, descartado quando chegar ao topo
+    def __init__(self, valores=None):
+        self.heap = list(valores) if valores is not None else []
+        heapq.heapify(self.heap)
+        self.contagem = Counter(self.heap)
+        self.pendentes = Counter()
+        self.num_pendentes = 0
+
+    def __len__(self):
+        return len(self.heap) - self.num_pendentes
+
+    def __contains__(self, valor):
+        return valor in self.contagem
+
+    def contem(self, valor):
+        return valor in self.contagem
+
+    def contar(self, valor):
+        return self.contagem.get(valor, 0)
+
+    def inserir(self, valor):
+        heapq.heappush(self.heap, valor)
+        self.contagem[valor] += 1
+
+    def topo(self):
+        self._limpar_topo()
+        if not self.heap:
+            raise IndexError("Heap vazia")
+        return self.heap[0]
+
+    def remover_topo(self):
+        self._limpar_topo()
+        if not self.heap:
+            raise IndexError("Heap vazia")
+        valor = heapq.heappop(self.heap)
+        self._decrementar(valor)
+        return valor
+
+    def substituir(self, valor):
+        self._limpar_topo()
+        if not self.heap:
+            raise IndexError("Heap vazia")
+        removido = heapq.heapreplace(self.heap, valor)
+        self._decrementar(removido)
+        self.contagem[valor] += 1
+        return removido
+
+    def remover(self, valor):
+        if valor not in self.contagem:
+            raise KeyError(valor)
+        self._decrementar(valor)
+        self.pendentes[valor] += 1
+        self.num_pendentes += 1
+
+        # Com muitas marcas acumuladas, reconstruir em O(n) sai mais barato que carregá-las
+        if self.num_pendentes > len(self.heap) // 2:
+            self.compactar()
+
+    def compactar(self):
+        pendentes = self.pendentes
+        restantes = []
+        for valor in self.heap:
+            if pendentes.get(valor):
+                pendentes[valor] -= 1
+            else:
+                restantes.append(valor)
+        heapq.heapify(restantes)
+        self.heap = restantes
+        self.pendentes = Counter()
+        self.num_pendentes = 0
+
+    def _decrementar(self, valor):
+        restante = self.contagem[valor] - 1
+        if restante:
+            self.contagem[valor] = restante
+        else:
+            del self.contagem[valor]
+
+    def _limpar_topo(self):
+        heap = self.heap
+        pendentes = self.pendentes
+        while heap and pendentes.get(heap[0]):
+            valor = heapq.heappop(heap)
+            pendentes[valor] -= 1
+            if not pendentes[valor]:
+                del pendentes[valor]
+            self.num_pendentes -= 1
@@ -0,0 +1,237 @@
+import os
+import heapq
+import random
+import itertools
+import tempfile
+import numpy as np
+
+
+def ordenacao_mergesort_natural(lista):
+    # Merge sort de baixo para cima: detecta as sequências já ordenadas e as intercala
+    # alternando entre a lista e um único buffer pré-alocado, sem fatiar a lista
+    n = len(lista)
+    if n <= 1:
+        return lista
+
+    limites = [0]
+    i = 1
+    while i < n:
+        inicio = i - 1
+        if lista[i] < lista[inicio]:
+            # Sequência estritamente decrescente: invertida no lugar, o que preserva a estabilidade
+            while i < n and lista[i] < lista[i - 1]:
+                i += 1
+            lista[inicio:i] = lista[inicio:i][::-1]
+        else:
+            while i < n and not lista[i] < lista[i - 1]:
+                i += 1
+        limites.append(i)
+        i += 1
+    if limites[-1] != n:
+        limites.append(n)
+
+    origem = lista
+    destino = [None] * n
+    while len(limites) > 2:
+        novos_limites = [0]
+        for k in range(0, len(limites) - 1, 2):
+            inicio = limites[k]
+            meio = limites[k + 1]
+            if k + 2 < len(limites):
+                fim = limites[k + 2]
+                mesclar_intervalos(origem, destino, inicio, meio, fim)
+            else:
+                fim = meio
+                destino[inicio:fim] = origem[inicio:fim]
+            novos_limites.append(fim)
+        limites = novos_limites
+        origem, destino = destino, origem
+
+    if origem is not lista:
+        lista[:] = origem
+    return lista
+
+
+def mesclar_intervalos(origem, destino, inicio, meio, fim):
+    i = inicio
+    j = meio
+    k = inicio
+    while i < meio and j < fim:
+        if origem[j] < origem[i]:
+            destino[k] = origem[j]
+            j += 1
+        else:
+            destino[k] = origem[i]
+            i += 1
+        k += 1
+    if i < meio:
+        destino[k:fim] = origem[i:meio]
+    else:
+        destino[k:fim] = origem[j:fim]
+
+
+TAMANHO_ITEM = np.dtype(np.int64).itemsize
+# Estimativa de bytes por elemento numa lista Python (ponteiro + objeto int + buffer do mergesort)
+CUSTO_ITEM_LISTA = 48
+CUSTO_LINHA_LISTA = 64
+# Um ordenador de trechos binários pode usar até duas cópias do trecho além do próprio vetor
+COPIAS_ORDENADOR = 3
+
+
+def gerar_arquivo_binario(caminho, tamanho_bytes, bytes_por_bloco=64 * 2 ** 20):
+    gerador = np.random.default_rng()
+    itens_por_bloco = bytes_por_bloco // TAMANHO_ITEM
+    restantes = tamanho_bytes // TAMANHO_ITEM
+    with open(caminho, 'wb') as arquivo:
+        while restantes > 0:
+            quantidade = min(itens_por_bloco, restantes)
+            gerador.integers(0, 2 ** 62, quantidade, dtype=np.int64).tofile(arquivo)
+            restantes -= quantidade
+
+
+def gerar_arquivo_texto(caminho, num_linhas):
+    with open(caminho, 'w') as arquivo:
+        for _ in range(num_linhas):
+            arquivo.write(f"{random.randint(1, 10 ** 9)}\n")
+
+
+def ler_binario(caminho, itens_por_leitura):
+    with open(caminho, 'rb') as arquivo:
+        while True:
+            bloco = np.fromfile(arquivo, dtype=np.int64, count=itens_por_leitura)
+            if len(bloco) == 0:
+                return
+            valores = bloco.tolist()
+            del bloco
+            yield from valores
+
+
+def escrever_binario(caminho, valores, itens_por_escrita):
+    with open(caminho, 'wb') as arquivo:
+        for bloco in iter(lambda: list(itertools.islice(valores, itens_por_escrita)), []):
+            np.array(bloco, dtype=np.int64).tofile(arquivo)
+
+
+def ler_texto(caminho, bytes_por_leitura):
+    with open(caminho, 'r', buffering=bytes_por_leitura) as arquivo:
+        yield from arquivo
+
+
+def escrever_texto(caminho, linhas, bytes_por_escrita):
+    with open(caminho, 'w', buffering=bytes_por_escrita) as arquivo:
+        arquivo.writelines(linhas)
+
+
+def gerar_trechos_binarios(entrada, memoria_bytes, ordenar, diretorio):
+    # O trecho fica num vetor int64 do início ao fim: nada vira lista de int Python
+    itens_por_trecho = max(1, memoria_bytes // (TAMANHO_ITEM * (1 if ordenar is None else COPIAS_ORDENADOR)))
+    trechos = []
+    with open(entrada, 'rb') as arquivo:
+        while True:
+            bloco = np.fromfile(arquivo, dtype=np.int64, count=itens_por_trecho)
+            if len(bloco) == 0:
+                break
+            if ordenar is None:
+                bloco.sort()
+            else:
+                bloco = ordenar(bloco)
+            caminho = os.path.join(diretorio, f"trecho_{len(trechos)}.bin")
+            bloco.tofile(caminho)
+            trechos.append(caminho)
+            del bloco
+    return trechos
+
+
+def gerar_trechos_texto(entrada, memoria_bytes, ordenar, diretorio):
+    trechos = []
+
+    def despejar(linhas):
+        caminho = os.path.join(diretorio, f"trecho_{len(trechos)}.txt")
+        escrever_texto(caminho, ordenar(linhas), 2 ** 20)
+        trechos.append(caminho)
+
+    linhas = []
+    ocupado = 0
+    with open(entrada, 'r') as arquivo:
+        for linha in arquivo:
+            if not linha.endswith('\n'):
+                linha += '\n'
+            linhas.append(linha)
+            ocupado += len(linha) + CUSTO_LINHA_LISTA
+            if ocupado >= memoria_bytes:
+                despejar(linhas)
+                linhas = []
+                ocupado = 0
+    if linhas:
+        despejar(linhas)
+    return trechos
+
+
+def ordenacao_externa(entrada, saida, memoria_bytes=512 * 2 ** 20, formato='binario', ordenar=None,
+                      max_vias=64, diretorio_temporario=None):
+    # Ordena um arquivo maior que a memória: trechos de até memoria_bytes são ordenados em
+    # memória e gravados em arquivos temporários, depois intercalados em k vias com leituras
+    # em blocos de memoria_bytes / (k + 1). No formato binário, ordenar recebe o vetor int64
+    # do trecho e devolve um vetor ordenado; no formato texto, recebe e devolve a lista de linhas
+    if formato not in ('binario', 'texto'):
+        raise ValueError("Formato inválido. Escolha 'binario' (int64) ou 'texto' (uma linha por item).")
+
+    with tempfile.TemporaryDirectory(dir=diretorio_temporario) as diretorio:
+        if formato == 'binario':
+            trechos = gerar_trechos_binarios(entrada, memoria_bytes, ordenar, diretorio)
+        else:
+            trechos = gerar_trechos_texto(entrada, memoria_bytes, ordenar or ordenacao_mergesort_natural, diretorio)
+        num_trechos = len(trechos)
+
+        passada = 0
+        while True:
+            vias = min(max(len(trechos), 1), max_vias)
+            bytes_por_via = max(4096, memoria_bytes // (vias + 1))
+            if len(trechos) <= max_vias:
+                destinos = [(saida, trechos)]
+            else:
+                # Mais trechos que vias: intercalação em várias passadas
+                destinos = [(os.path.join(diretorio, f"passada_{passada}_{i}.{formato}"), trechos[i:i + max_vias])
+                            for i in range(0, len(trechos), max_vias)]
+
+            for destino, grupo in destinos:
+                if formato == 'binario':
+                    # Os buffers de leitura e escrita viram listas de int Python: o orçamento
+                    # é contado pelo custo de cada item na lista, não pelos 8 bytes em disco
+                    itens_por_via = max(1, bytes_por_via // (TAMANHO_ITEM + CUSTO_ITEM_LISTA))
+                    leitores = [ler_binario(t, itens_por_via) for t in grupo]
+                    escrever_binario(destino, heapq.merge(*leitores), itens_por_via)
+                else:
+                    leitores = [ler_texto(t, bytes_por_via) for t in grupo]
+                    escrever_texto(destino, heapq.merge(*leitores), bytes_por_via)
+                for trecho in grupo:
+                    os.remove(trecho)
+
+            if destinos[0][0] == saida:
+                break
+            trechos = [destino for destino, _ in destinos]
+            passada += 1
+
+    return num_trechos
+
+
+def arquivo_binario_ordenado(caminho, itens_por_leitura=2 ** 20):
+    anterior = None
+    with open(caminho, 'rb') as arquivo:
+        while True:
+            bloco = np.fromfile(arquivo, dtype=np.int64, count=itens_por_leitura)
+            if len(bloco) == 0:
+                return True
+            if np.any(bloco[1:] < bloco[:-1]) or (anterior is not None and bloco[0] < anterior):
+                return False
+            anterior = bloco[-1]
+
+
+def arquivo_texto_ordenado(caminho):
+    anterior = None
+    with open(caminho, 'r') as arquivo:
+        for linha in arquivo:
+            if anterior is not None and linha < anterior:
+                return False
+            anterior = linha
+    return True